@@ -0,0 +1,96 @@
+"""
+Offline sprite atlas builder.
+
+Packs every PNG under assets/sprites/** into one or a few atlas pages and
+writes a manifest of named rects next to them:
+
+    python -m assets.build_atlas
+
+Output goes to assets/atlas/ (atlas_0.png, ... + manifest.json). When the
+manifest is present, sprite_manager serves images as subsurfaces of the
+pages instead of decoding each PNG separately. Re-run after editing sprites.
+"""
+from __future__ import annotations
+import argparse, json, os
+import pygame as pg
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SPRITES_DIR = os.path.join(ROOT, "assets", "sprites")
+OUT_DIR = os.path.join(ROOT, "assets", "atlas")
+MANIFEST = "manifest.json"
+PADDING = 1
+
+
+def _collect(src: str) -> list[tuple[str, pg.Surface]]:
+    """(manifest key, image) for every png under src, keys relative to the repo root."""
+    out = []
+    for dirpath, dirnames, filenames in os.walk(src):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        for fn in sorted(filenames):
+            if not fn.lower().endswith(".png"):
+                continue
+            full = os.path.join(dirpath, fn)
+            key = os.path.relpath(full, ROOT).replace(os.sep, "/")
+            out.append((key, pg.image.load(full)))
+    return out
+
+
+def _pack(sizes: list[tuple[str, int, int]], page_size: int) -> dict[str, tuple[int, int, int, int, int]]:
+    """Shelf packing, tallest first. Returns key -> (page, x, y, w, h)."""
+    placed: dict[str, tuple[int, int, int, int, int]] = {}
+    page, x, y, shelf_h = 0, 0, 0, 0
+    for key, w, h in sorted(sizes, key=lambda s: (-s[2], -s[1], s[0])):
+        if w > page_size or h > page_size:
+            raise ValueError(f"{key} ({w}x{h}) does not fit a {page_size}px atlas page")
+        if x + w > page_size:
+            x, y, shelf_h = 0, y + shelf_h + PADDING, 0
+        if y + h > page_size:
+            page, x, y, shelf_h = page + 1, 0, 0, 0
+        placed[key] = (page, x, y, w, h)
+        x += w + PADDING
+        shelf_h = max(shelf_h, h)
+    return placed
+
+
+def build_atlas(src: str = SPRITES_DIR, out_dir: str = OUT_DIR, page_size: int = 1024) -> dict:
+    images = _collect(src)
+    placed = _pack([(k, img.get_width(), img.get_height()) for k, img in images], page_size)
+    n_pages = 1 + max((p[0] for p in placed.values()), default=0)
+
+    # trim each page to the area actually used
+    used = [[0, 0] for _ in range(n_pages)]
+    for page, x, y, w, h in placed.values():
+        used[page][0] = max(used[page][0], x + w)
+        used[page][1] = max(used[page][1], y + h)
+    pages = [pg.Surface((max(1, uw), max(1, uh)), pg.SRCALPHA) for uw, uh in used]
+    for key, img in images:
+        page, x, y, _, _ = placed[key]
+        pages[page].blit(img, (x, y))
+
+    os.makedirs(out_dir, exist_ok=True)
+    page_files = []
+    for i, surf in enumerate(pages):
+        fn = f"atlas_{i}.png"
+        pg.image.save(surf, os.path.join(out_dir, fn))
+        page_files.append(fn)
+
+    manifest = {
+        "pages": page_files,
+        "sprites": {k: {"page": p, "rect": [x, y, w, h]} for k, (p, x, y, w, h) in sorted(placed.items())},
+    }
+    with open(os.path.join(out_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    return manifest
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Pack assets/sprites/** into atlas pages.")
+    ap.add_argument("--page-size", type=int, default=1024)
+    ap.add_argument("--out", default=OUT_DIR)
+    args = ap.parse_args()
+    manifest = build_atlas(out_dir=args.out, page_size=args.page_size)
+    print(f"{len(manifest['sprites'])} sprites -> {len(manifest['pages'])} page(s) in {args.out}")
+
+
+if __name__ == "__main__":
+    main()
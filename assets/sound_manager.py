@@ -1,9 +1,20 @@
 import pygame as pg
 from medieval_rogue.utils import resource_path
 
+
+class SilentSound:
+    """Stand-in for pg.mixer.Sound when no mixer is running (headless runs, no audio device)."""
+    def play(self, *args, **kwargs): return None
+    def stop(self): pass
+    def set_volume(self, value): pass
+    def get_volume(self): return 0.0
+
+
 def load_sounds():
+    if not pg.mixer.get_init():
+        return {"arrow_shot": SilentSound(), "player_hit": SilentSound()}
     return {
         "arrow_shot": pg.mixer.Sound(resource_path("assets", "sfx", "arrow_shot.wav")),
         "player_hit": pg.mixer.Sound(resource_path("assets", "sfx", "player_hit.wav")),
         # "kill": pg.mixer.Sound(resource_path("assets", "sfx", "kill.wav")),
-    }
\ No newline at end of file
+    }
@@ -1,17 +1,61 @@
 import pygame as pg
 from medieval_rogue.utils import resource_path
+from medieval_rogue import settings as S
 from typing import List, Dict, Tuple
+import json
 import os
 
 _cache = {}
 
+# Atlas mode: built offline by `python -m assets.build_atlas`.
+_atlas: Dict[str, Tuple[int, pg.Rect]] | None = None   # None = manifest not read yet
+_atlas_files: List[str] = []
+_atlas_pages: Dict[int, pg.Surface] = {}
+
+def _path_key(path) -> str:
+    """Normalised relative path used as cache / manifest key."""
+    parts = path if isinstance(path, (list, tuple)) else (path,)
+    return "/".join(str(p) for p in parts).replace(os.sep, "/")
+
+def _load_atlas_manifest() -> None:
+    global _atlas, _atlas_files
+    _atlas = {}
+    if not getattr(S, "USE_SPRITE_ATLAS", True):
+        return
+    try:
+        with open(resource_path('assets', 'atlas', 'manifest.json'), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return
+    _atlas_files = list(manifest.get("pages", []))
+    for key, entry in manifest.get("sprites", {}).items():
+        _atlas[key] = (int(entry["page"]), pg.Rect(entry["rect"]))
+
+def _atlas_image(key: str) -> pg.Surface | None:
+    """Zero-copy subsurface of an atlas page, or None if the sprite is not in the atlas."""
+    if _atlas is None:
+        _load_atlas_manifest()
+    entry = _atlas.get(key)
+    if entry is None:
+        return None
+    page_i, rect = entry
+    page = _atlas_pages.get(page_i)
+    if page is None:
+        page = pg.image.load(resource_path('assets', 'atlas', _atlas_files[page_i])).convert_alpha()
+        _atlas_pages[page_i] = page
+    return page.subsurface(rect)
+
 def _load_image(path):
-    """Load image (path can be string or list/tuple passed to resource_path). Cache result."""
-    path = resource_path(*path) if isinstance(path, (list, tuple)) else resource_path(path)
-    if path in _cache:
-        return _cache[path]
-    img = pg.image.load(path).convert_alpha()
-    _cache[path] = img
+    """Load image (path can be string or list/tuple passed to resource_path). Cache result.
+    Served from the sprite atlas when one has been built."""
+    key = _path_key(path)
+    if key in _cache:
+        return _cache[key]
+    img = _atlas_image(key)
+    if img is None:
+        path = resource_path(*path) if isinstance(path, (list, tuple)) else resource_path(path)
+        img = pg.image.load(path).convert_alpha()
+    _cache[key] = img
     return img
 
 def slice_sheet(img: pg.Surface, frame_w: int, frame_h: int) -> List[pg.Surface]:
@@ -26,10 +70,60 @@ def slice_sheet(img: pg.Surface, frame_w: int, frame_h: int) -> List[pg.Surface]
             frames.append(frame)
     return frames
 
+class Clip:
+    """
+    Frames cut from one sheet at one frame size, shared by every AnimatedSprite
+    playing them. Frames are never modified; scaled / flipped variants are
+    built once and shared as well.
+    """
+    __slots__ = ("frames", "_variants")
+
+    def __init__(self, frames: List[pg.Surface]):
+        self.frames = frames
+        self._variants: Dict[Tuple[int, bool], List[pg.Surface]] = {}
+
+    def variant(self, scale: int, flip_x: bool) -> List[pg.Surface]:
+        """Frames scaled by an integer factor and optionally mirrored (cached)."""
+        scale = 1 if scale is None or scale <= 1 else int(scale)
+        key = (scale, bool(flip_x))
+        frames = self._variants.get(key)
+        if frames is not None:
+            return frames
+        if flip_x:
+            frames = [pg.transform.flip(f, True, False) for f in self.variant(scale, False)]
+        elif scale > 1:
+            frames = [pg.transform.scale(f, (f.get_width() * scale, f.get_height() * scale)) for f in self.frames]
+        else:
+            frames = self.frames
+        self._variants[key] = frames
+        return frames
+
+
+_clips: Dict[Tuple, Clip] = {}        # (path, frame_w, frame_h) -> Clip
+_clip_by_frames: Dict[int, Clip] = {}  # id(clip.frames) -> Clip, so AnimatedSprite finds shared variants
+
+def load_clip(path, frame_w: int, frame_h: int) -> Clip:
+    """Load a sheet once per (path, frame size) and return its shared Clip."""
+    key = (tuple(path) if isinstance(path, (list, tuple)) else (path,), frame_w, frame_h)
+    clip = _clips.get(key)
+    if clip is None:
+        clip = Clip(_cut_frames(_load_image(path), frame_w, frame_h))
+        _clips[key] = clip
+        _clip_by_frames[id(clip.frames)] = clip
+    return clip
+
+def _cut_frames(img: pg.Surface, frame_w: int, frame_h: int) -> List[pg.Surface]:
+    """Like slice_sheet, but frames fully inside the sheet are zero-copy subsurfaces."""
+    w, h = img.get_width(), img.get_height()
+    if w % frame_w or h % frame_h:
+        return slice_sheet(img, frame_w, frame_h)
+    return [img.subsurface((x, y, frame_w, frame_h))
+            for y in range(0, h, frame_h) for x in range(0, w, frame_w)]
+
 def load_strip(path, frame_w: int, frame_h: int) -> List[pg.Surface]:
-    """Load image and slice into frames of frame_w x frame_h."""
-    img = _load_image(path)
-    return slice_sheet(img, frame_w, frame_h)
+    """Load image and slice into frames of frame_w x frame_h.
+    The returned list is shared between callers and must not be modified."""
+    return load_clip(path, frame_w, frame_h).frames
 
 def flip_frames(frames: List[pg.Surface]) -> List[pg.Surface]:
     """Return horizontally flipped copies of frames."""
@@ -42,9 +136,15 @@ class AnimatedSprite:
     fps: frames per second.
     loop: whether to loop or stop at last frame.
     anchor: 'bottom' (default) or 'center' -- influences draw positioning.
+
+    Frames and their scaled/flipped variants live in a shared Clip; an
+    AnimatedSprite only holds playback state.
     """
+    __slots__ = ("clip", "frames", "fps", "loop", "anchor", "t", "idx", "paused")
+
     def __init__(self, frames: List[pg.Surface], fps: float = 8.0, loop: bool=True, anchor: str='bottom'):
         assert frames and isinstance(frames, list)
+        self.clip = _clip_by_frames.get(id(frames)) or Clip(frames)
         self.frames = frames
         self.fps = float(fps)
         self.loop = bool(loop)
@@ -53,9 +153,6 @@ class AnimatedSprite:
         self.idx = 0
         self.paused = False
 
-        self._scaled_cache: Dict[int, List[pg.Surface]] = {}
-        self._scaled_flipped_cache: Dict[Tuple[int,bool], List[pg.Surface]] = {}
-
     def update(self, dt: float):
         """dt should be seconds (clock.tick(...) / 1000.0)."""
         if self.paused or len(self.frames) <= 1:
@@ -76,31 +173,11 @@ class AnimatedSprite:
         return self.frames[self.idx]
 
     def _get_scaled_frames(self, scale: int) -> List[pg.Surface]:
-        """Return list of frames scaled by integer scale (cache result)."""
-        if scale is None or scale <= 1:
-            return self.frames
-        if scale in self._scaled_cache:
-            return self._scaled_cache[scale]
-        scaled = []
-        for f in self.frames:
-            w, h = f.get_width(), f.get_height()
-            sf = pg.transform.scale(f, (int(w * scale), int(h * scale)))
-            scaled.append(sf)
-        self._scaled_cache[scale] = scaled
-        return scaled
+        """Return list of frames scaled by integer scale (shared cache)."""
+        return self.clip.variant(scale, False)
 
     def _get_scaled_flipped_frames(self, scale: int, flip_x: bool) -> List[pg.Surface]:
-        key = (scale, bool(flip_x))
-        if key in self._scaled_flipped_cache:
-            return self._scaled_flipped_cache[key]
-        frames = self._get_scaled_frames(scale)
-        if flip_x:
-            flipped = [pg.transform.flip(f, True, False) for f in frames]
-            self._scaled_flipped_cache[key] = flipped
-            return flipped
-        else:
-            self._scaled_flipped_cache[key] = frames
-            return frames
+        return self.clip.variant(scale, flip_x)
 
     def draw(self, surf: pg.Surface, x: float, y: float, camera=None, scale:int=1, flip_x: bool=False):
         """
@@ -0,0 +1,204 @@
+"""
+Batch run simulator for balancing. Plays seeded headless runs of the full
+floor loop with scripted bots across a process pool, streams one JSON line
+per run and prints an aggregated report:
+
+    python -m medieval_rogue.batch --runs 500 --policy kite,rush --cls archer,mage --out runs.jsonl
+
+Runs are independent, so throughput scales with --workers (default: all cores).
+"""
+from __future__ import annotations
+import argparse, json, os, statistics, sys, time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, asdict
+from multiprocessing import Pool
+from medieval_rogue import settings as S
+
+# a run that enters this many rooms in a row without reaching a new one is stuck going back and forth
+LOOP_ENTRIES = 24
+
+
+@dataclass
+class RunRecord:
+    seed: int
+    policy: str
+    cls: str
+    outcome: str            # "victory", "gameover", "timeout" or "looping" (stopped by the loop detector)
+    score: int
+    floor_reached: int      # 1-based
+    ticks: int
+    killer: str | None      # boss id when a boss was alive at death, "enemy" for other deaths
+    items: list[str] = field(default_factory=list)
+    bosses: list[str] = field(default_factory=list)
+    rooms: list[dict] = field(default_factory=list)     # {"floor", "gp", "kind", "ticks", "damage"} per room entered
+
+
+def _boss_ids() -> dict[type, str]:
+    from medieval_rogue.entities.enemy_registry import BOSSES
+    return {cls: key for key, cls in BOSSES.items()}
+
+
+def run_one(job: tuple[int, str, str, int]) -> dict:
+    """Play one seeded run to victory, death or max_ticks; returns a RunRecord as a dict."""
+    from medieval_rogue.headless import make_scene
+    from medieval_rogue.input_source import ScriptedInput
+    from medieval_rogue.bots import make_bot
+
+    seed, policy, cls, max_ticks = job
+    scene = make_scene(ScriptedInput(make_bot(policy, seed)), cls, seed)
+    boss_ids = _boss_ids()
+    dt = 1.0 / S.SIM_HZ
+
+    rooms: list[dict] = []
+    room, entry = None, None
+    seen: set[tuple] = set()
+    since_new = 0
+    last_hp = scene.player.hp
+    tick = 0
+    outcome = None
+    while tick < max_ticks and not scene.next_scene:
+        if scene.current_room is not room:
+            room = scene.current_room
+            key = (scene.floor_i, scene.current_gp)
+            since_new = 0 if key not in seen else since_new + 1
+            seen.add(key)
+            if since_new >= LOOP_ENTRIES:
+                outcome = "looping"
+                break
+            entry = {"floor": scene.floor_i + 1, "gp": list(scene.current_gp), "kind": room.kind, "ticks": 0, "damage": 0}
+            rooms.append(entry)
+        scene.update(dt)
+        tick += 1
+        entry["ticks"] += 1
+        hp = scene.player.hp
+        if hp < last_hp:
+            entry["damage"] += last_hp - hp
+        last_hp = hp
+
+    outcome = outcome or scene.next_scene or "timeout"
+    killer = None
+    if outcome == "gameover":
+        killer = boss_ids.get(type(scene.boss), "boss") if scene.boss is not None else "enemy"
+    return asdict(RunRecord(
+        seed=seed, policy=policy, cls=cls, outcome=outcome,
+        score=int(scene.score), floor_reached=min(scene.floor_i, S.FLOORS - 1) + 1, ticks=tick,
+        killer=killer, items=list(scene.player.inventory), bosses=list(scene.boss_history), rooms=rooms,
+    ))
+
+
+class Report:
+    """Aggregates run records per (policy, class) as they stream in."""
+    def __init__(self) -> None:
+        self.groups: dict[tuple[str, str], list[dict]] = defaultdict(list)
+
+    def add(self, rec: dict) -> None:
+        self.groups[(rec["policy"], rec["cls"])].append(rec)
+
+    def summary(self) -> dict:
+        out = {}
+        for (policy, cls), recs in sorted(self.groups.items()):
+            n = len(recs)
+            wins = [r for r in recs if r["outcome"] == "victory"]
+            scores = [r["score"] for r in recs]
+            dmg = defaultdict(list)
+            for r in recs:
+                if r["outcome"] == "looping":
+                    continue        # bot failure, not balance data
+                for room in r["rooms"]:
+                    dmg[room["kind"]].append(room["damage"])
+            items = Counter(i for r in recs for i in set(r["items"]))
+            item_wins = Counter(i for r in wins for i in set(r["items"]))
+            boss_seen = Counter(b for r in recs for b in r["bosses"])
+            boss_kills = Counter(r["killer"] for r in recs if r["killer"] not in (None, "enemy"))
+            out[f"{policy}/{cls}"] = {
+                "runs": n,
+                "looping": sum(r["outcome"] == "looping" for r in recs),
+                "win_rate": len(wins) / n,
+                "outcomes": dict(Counter(r["outcome"] for r in recs)),
+                "score_mean": statistics.fmean(scores),
+                "score_median": statistics.median(scores),
+                "floors": dict(sorted(Counter(r["floor_reached"] for r in recs).items())),
+                "killers": dict(Counter(r["killer"] for r in recs if r["killer"]).most_common()),
+                "boss_lethality": {b: boss_kills[b] / boss_seen[b] for b in sorted(boss_seen)},
+                "damage_per_room": {k: statistics.fmean(v) for k, v in sorted(dmg.items())},
+                "item_win_rate": {i: item_wins[i] / items[i] for i in sorted(items)},
+            }
+        return out
+
+    def format(self) -> str:
+        lines = []
+        for key, g in self.summary().items():
+            lines.append(f"== {key}: {g['runs']} runs, win rate {g['win_rate']:.1%}, "
+                         f"score mean {g['score_mean']:.1f} / median {g['score_median']:.0f}")
+            lines.append(f"   outcomes {g['outcomes']}  floors {g['floors']}")
+            if g["looping"]:
+                lines.append(f"   WARNING: {g['looping']} runs stopped by the loop detector; the bot, not the game, ended them")
+            lines.append(f"   killers {g['killers']}")
+            lines.append("   boss lethality " + ", ".join(f"{b} {v:.0%}" for b, v in g["boss_lethality"].items()))
+            lines.append("   damage/room " + ", ".join(f"{k} {v:.2f}" for k, v in g["damage_per_room"].items()))
+            lines.append("   item win rate " + ", ".join(f"{i} {v:.0%}" for i, v in g["item_win_rate"].items()))
+        return "\n".join(lines)
+
+
+def _init_worker() -> None:
+    from medieval_rogue.headless import init_headless
+    init_headless()
+
+
+def run_batch(jobs: list[tuple[int, str, str, int]], workers: int | None = None, out=None,
+              report: Report | None = None) -> Report:
+    """Run jobs on a process pool, streaming each finished record to `out` (a text file) and the report."""
+    report = report or Report()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker()
+        results = map(run_one, jobs)
+        pool = None
+    else:
+        pool = Pool(workers, initializer=_init_worker)
+        results = pool.imap_unordered(run_one, jobs, chunksize=1)
+    try:
+        for rec in results:
+            report.add(rec)
+            if out is not None:
+                out.write(json.dumps(rec) + "\n")
+                out.flush()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return report
+
+
+def main() -> None:
+    from medieval_rogue.bots import POLICIES
+    ap = argparse.ArgumentParser(description="Run many seeded headless games with bot policies.")
+    ap.add_argument("--runs", type=int, default=100, help="seeds per policy/class combination")
+    ap.add_argument("--seed0", type=int, default=1)
+    ap.add_argument("--policy", default="kite", help=f"comma-separated: {','.join(POLICIES)}")
+    ap.add_argument("--cls", default="archer", help="comma-separated player classes")
+    ap.add_argument("--max-ticks", type=int, default=S.SIM_HZ * 60 * 10)
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--out", default=None, help="write one JSON record per run (JSONL)")
+    ap.add_argument("--report", default=None, help="write the aggregated report as JSON")
+    args = ap.parse_args()
+
+    jobs = [(args.seed0 + i, policy, cls, args.max_ticks)
+            for policy in args.policy.split(",") for cls in args.cls.split(",") for i in range(args.runs)]
+    t0 = time.perf_counter()
+    out = open(args.out, "w", encoding="utf-8") if args.out else None
+    try:
+        report = run_batch(jobs, args.workers, out)
+    finally:
+        if out is not None:
+            out.close()
+    secs = time.perf_counter() - t0
+    print(report.format())
+    print(f"{len(jobs)} runs in {secs:.1f}s ({len(jobs) / secs:.2f} runs/s)", file=sys.stderr)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report.summary(), f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
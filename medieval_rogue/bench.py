@@ -0,0 +1,289 @@
+"""
+Benchmark suite. Runs headless and compares against a per-machine baseline:
+
+    python -m medieval_rogue.bench                  # run all, compare with this machine's baseline
+    python -m medieval_rogue.bench --save           # run all and store them as the new baseline
+    python -m medieval_rogue.bench -k lighting -k room_draw --threshold 0.2
+
+Each case is registered with @case and builds whatever it needs once, then
+returns the zero-argument callable that gets timed. Each case reports the
+best and median per-call time over a few repeats, each auto-sized to
+--min-time. Regressions are judged on the best time, the least noisy of
+the two: exits with status 1 when a case is slower than its baseline by
+more than the threshold.
+"""
+from __future__ import annotations
+import argparse, json, os, platform, re, statistics, sys, time
+from dataclasses import dataclass
+from typing import Callable, Iterable
+import pygame as pg
+from medieval_rogue import settings as S
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bench_baselines")
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[..., Callable[[], object]]
+    params: tuple = (None,)
+
+    def ids(self) -> list[str]:
+        return [self.name if p is None else f"{self.name}[{_param_id(p)}]" for p in self.params]
+
+
+CASES: dict[str, Case] = {}
+
+
+def case(name: str, params: Iterable = (None,)):
+    """Register a benchmark; setup(param) returns the callable to time."""
+    def deco(fn):
+        CASES[name] = Case(name, fn, tuple(params))
+        return fn
+    return deco
+
+
+def _param_id(p) -> str:
+    if isinstance(p, tuple):
+        return "x".join(str(v) for v in p)
+    return str(p)
+
+
+# --- shared fixtures ---
+
+def _room(w: int, h: int, kind: str = "combat", pattern_i: int = 1):
+    from medieval_rogue.dungeon.room import Room, PATTERNS
+    pats = PATTERNS.get((kind, w, h)) or [[]]
+    room = Room(kind=kind, gx=0, gy=0, w_cells=w, h_cells=h, pattern=pats[min(pattern_i, len(pats) - 1)])
+    room.compute_doors({})
+    return room
+
+
+def _camera_on(room):
+    from medieval_rogue.camera import Camera
+    cam = Camera()
+    wr = room.world_rect
+    cam.center_on(wr.centerx, wr.centery)
+    cam.clamp_to_room(wr)
+    return cam
+
+
+def _screen() -> pg.Surface:
+    return pg.Surface((S.BASE_W, S.BASE_H))
+
+
+# --- micro benchmarks ---
+
+ROOM_SIZES = [(1, 1), (2, 1), (1, 2), (2, 2)]
+
+
+@case("room_draw", ROOM_SIZES)
+def _bench_room_draw(size):
+    room = _room(*size)
+    cam, surf = _camera_on(room), _screen()
+    room.draw(surf, cam)     # bake outside the timing
+    return lambda: room.draw(surf, cam)
+
+
+@case("lighting", [0, 2, 4, 8, 16])
+def _bench_lighting(n_torches):
+    from medieval_rogue.ui.lighting import Torch, bake_lightmap, apply_lighting, update_torches
+    room = _room(2, 2)
+    wr = room.world_rect
+    torches = [Torch(wr.x + 100 + (i * 337) % (wr.w - 200), wr.y + 100 + (i * 211) % (wr.h - 200), phase=i * 0.7)
+               for i in range(n_torches)]
+    lightmap = bake_lightmap(room, torches)
+    cam, surf = _camera_on(room), _screen()
+
+    def run():
+        update_torches(torches, 1 / 60)
+        apply_lighting(surf, cam, torches, lightmap)
+    return run
+
+
+@case("edge_fade", ["static", "scroll"])
+def _bench_edge_fade(mode):
+    from medieval_rogue.ui.edge_fade import draw_edge_fade
+    room = _room(2, 2)
+    wr = room.world_rect
+    cam, surf = _camera_on(room), _screen()
+    cam.x, cam.y = float(wr.x), float(wr.y)     # edges on screen
+    if mode == "static":
+        return lambda: draw_edge_fade(surf, cam, wr)
+    state = [0]
+
+    def run():
+        # a new camera offset every call: exercises the mask cache misses
+        state[0] = (state[0] + 1) % 97
+        cam.x = wr.x + state[0]
+        draw_edge_fade(surf, cam, wr)
+    return run
+
+
+@case("move_and_collide", [10, 100, 1000])
+def _bench_move_and_collide(n_walls):
+    import random
+    from medieval_rogue.entities.utilities import WallGrid, move_and_collide
+    rng = random.Random(n_walls)
+    walls = WallGrid([pg.Rect(rng.randrange(0, 2500), rng.randrange(0, 1400), rng.randrange(16, 120), rng.randrange(16, 120))
+                      for _ in range(n_walls)])
+    starts = [(rng.uniform(0, 2560), rng.uniform(0, 1440), rng.uniform(-4, 4), rng.uniform(-4, 4)) for _ in range(64)]
+
+    def run():
+        for x, y, dx, dy in starts:
+            move_and_collide(x, y, 24, 48, dx, dy, walls, ox=-12, oy=-48)
+    return run
+
+
+@case("generate_floor")
+def _bench_generate_floor(_):
+    from medieval_rogue.dungeon.generation import generate_floor
+    from medieval_rogue.rng import RunRng
+    run_rng = RunRng(1)
+    state = [0]
+
+    def run():
+        state[0] += 1
+        generate_floor(state[0] % S.FLOORS, run_rng.fork("generation", "floor", state[0]))
+    return run
+
+
+@case("spawn_from_pattern", ["combat_ring", "wide_lanes", "arena_big"])
+def _bench_spawn_from_pattern(name):
+    from medieval_rogue.entities.enemy_registry import spawn_from_pattern
+    room_rect = _room(2, 2).world_rect
+    avoid = (room_rect.centerx, room_rect.centery)
+    return lambda: spawn_from_pattern(name, room_rect, avoid_pos=avoid, avoid_radius=160)
+
+
+# --- macro benchmark: one full sim step plus frame ---
+
+@case("run_tick", [0, 10, 50, 150])
+def _bench_run_tick(n_enemies):
+    from medieval_rogue.headless import make_scene
+    from medieval_rogue.entities.enemy_registry import create_enemy
+    from medieval_rogue.rng import RunRng
+    scene = make_scene(seed=1, render=True)
+    scene.entry_freeze = 0.0
+    wr = scene.current_room.world_rect
+    rng = RunRng(n_enemies).generation
+    kinds = ("slime", "bat", "skeleton")
+    scene.enemies = [create_enemy(kinds[i % 3], int(rng.uniform(wr.left + 80, wr.right - 80)),
+                                  int(rng.uniform(wr.top + 80, wr.bottom - 80))) for i in range(n_enemies)]
+    player = scene.player
+    hp = player.hp
+    surf = _screen()
+    dt = 1.0 / S.SIM_HZ
+
+    def run():
+        player.hp = hp      # keep the run alive at a fixed entity count
+        scene.update(dt)
+        scene.draw(surf)
+    return run
+
+
+# --- runner ---
+
+def time_case(fn: Callable[[], object], min_time: float, repeats: int) -> dict:
+    fn()    # warm-up: caches, lazy loads
+    clock = time.perf_counter
+    number = 1
+    while True:
+        t0 = clock()
+        for _ in range(number):
+            fn()
+        took = clock() - t0
+        if took >= min_time or number >= 1 << 20:
+            break
+        number = max(number * 2, int(number * min_time / max(took, 1e-9)))
+    samples = [took / number]
+    for _ in range(repeats - 1):
+        t0 = clock()
+        for _ in range(number):
+            fn()
+        samples.append((clock() - t0) / number)
+    return {"median_us": statistics.median(samples) * 1e6, "best_us": min(samples) * 1e6, "number": number}
+
+
+def machine_id() -> str:
+    raw = f"{platform.node()}-{platform.machine()}-py{sys.version_info[0]}{sys.version_info[1]}"
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", raw)
+
+
+def baseline_path(directory: str = BASELINE_DIR) -> str:
+    return os.path.join(directory, f"{machine_id()}.json")
+
+
+def run_suite(patterns: list[str] | None = None, min_time: float = 0.05, repeats: int = 5,
+              out=sys.stdout) -> dict[str, dict]:
+    from medieval_rogue.headless import init_headless
+    init_headless()
+    results = {}
+    for c in CASES.values():
+        for p, bench_id in zip(c.params, c.ids()):
+            if patterns and not any(pat in bench_id for pat in patterns):
+                continue
+            results[bench_id] = r = time_case(c.setup(p), min_time, repeats)
+            print(f"{bench_id:32s} {r['median_us']:12.1f} us  (best {r['best_us']:.1f}, n={r['number']})", file=out)
+    return results
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], threshold: float) -> list[str]:
+    """Bench ids whose best time got slower than baseline by more than threshold (0.1 = 10%)."""
+    slower = []
+    for bench_id, r in results.items():
+        base = baseline.get(bench_id)
+        if base is None:
+            continue
+        ratio = r["best_us"] / base["best_us"]
+        flag = "REGRESSION" if ratio > 1 + threshold else ("faster" if ratio < 1 - threshold else "")
+        print(f"{bench_id:32s} {base['best_us']:12.1f} -> {r['best_us']:12.1f} us  {ratio:6.2f}x  {flag}")
+        if flag == "REGRESSION":
+            slower.append(bench_id)
+    return slower
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Run the benchmark suite.")
+    ap.add_argument("-k", dest="patterns", action="append", help="only cases whose id contains this (repeatable)")
+    ap.add_argument("--save", action="store_true", help="store the results as this machine's baseline")
+    ap.add_argument("--baseline", default=None, help=f"baseline JSON (default {baseline_path()})")
+    ap.add_argument("--threshold", type=float, default=S.BENCH_REGRESSION_THRESHOLD)
+    ap.add_argument("--min-time", type=float, default=0.05, help="seconds per repeat")
+    ap.add_argument("--repeats", type=int, default=5)
+    ap.add_argument("--list", action="store_true")
+    args = ap.parse_args()
+
+    if args.list:
+        for c in CASES.values():
+            print("\n".join(c.ids()))
+        return
+
+    results = run_suite(args.patterns, args.min_time, args.repeats)
+    path = args.baseline or baseline_path()
+    if args.save:
+        stored = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                stored = json.load(f)["results"]
+        stored.update(results)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"machine": machine_id(), "python": platform.python_version(),
+                       "pygame": pg.version.ver, "results": stored}, f, indent=1, sort_keys=True)
+        print(f"baseline saved to {path}")
+        return
+    if not os.path.exists(path):
+        print(f"no baseline at {path}; run with --save to create one")
+        return
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    print(f"\ncompared with {path} (threshold {args.threshold:.0%}):")
+    slower = compare(results, baseline, args.threshold)
+    if slower:
+        print(f"{len(slower)} regression(s): {', '.join(slower)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
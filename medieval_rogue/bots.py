@@ -0,0 +1,311 @@
+"""
+Scripted bot policies for headless runs. A bot is called once per sim step
+with (tick, scene) and returns an InputFrame, so it plugs into ScriptedInput.
+"""
+from __future__ import annotations
+import math, random
+from collections import deque
+import numpy as np
+import pygame as pg
+from medieval_rogue import settings as S
+from medieval_rogue.input_source import InputFrame, KeySet
+
+_SIDE_STEP = {"N": (0, -1), "E": (1, 0), "S": (0, 1), "W": (-1, 0)}     # also the BFS side order
+_NEXT_FLOOR = pg.event.Event(pg.KEYDOWN, key=pg.K_n, mod=0, unicode="n", scancode=0)
+_NAV_CELL = 16
+_SHOT_CLEARANCE = 16   # px walls are grown by for the line-of-fire test (the arrow is 12 across)
+_DODGE_TIME = 0.5       # seconds ahead an enemy shot is dodged
+_DODGE_MISS = 28.0      # shots passing closer than this (px, from the player's centre) are dodged
+# straight steps first, so ties go to them
+_NAV_STEPS = sorted(((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy), key=lambda s: abs(s[0]) + abs(s[1]))
+
+
+class NavGrid:
+    """
+    The 16px cells of a room the player can stand in: the hitbox, feet at the
+    cell centre, hits no wall. Cells whose hitbox touches a door are kept
+    apart, so a path to one place never brushes a door and leaves the room.
+    """
+    def __init__(self, room, walls: list[pg.Rect]) -> None:
+        wr = room.world_rect
+        self.x0, self.y0 = wr.x, wr.y
+        self.cols, self.rows = wr.w // _NAV_CELL, wr.h // _NAV_CELL
+        w, h = S.PLAYER_HITBOX
+        probe = pg.Rect(0, 0, w, h)
+        doors = [d.rect for d in room.doors.values()]
+        self.free: dict[tuple[int, int], pg.Rect] = {}     # cell -> the player's hitbox there
+        self.door_of: dict[tuple[int, int], pg.Rect] = {}  # cells touching a door
+        for cy in range(self.rows):
+            for cx in range(self.cols):
+                probe.midbottom = self.world(cx, cy)
+                if probe.collidelist(walls) < 0:
+                    self.free[(cx, cy)] = probe.copy()
+                    i = probe.collidelist(doors)
+                    if i >= 0:
+                        self.door_of[(cx, cy)] = doors[i]
+
+    def world(self, cx: int, cy: int) -> tuple[int, int]:
+        return self.x0 + cx * _NAV_CELL + _NAV_CELL // 2, self.y0 + cy * _NAV_CELL + _NAV_CELL // 2
+
+    def cell(self, x: float, y: float) -> tuple[int, int]:
+        return int(x - self.x0) // _NAV_CELL, int(y - self.y0) // _NAV_CELL
+
+    def field(self, goal: pg.Rect) -> dict[tuple[int, int], int]:
+        """Walking distance (in cells) to the nearest cell whose hitbox touches `goal`."""
+        door_of = self.door_of
+        ok = {c for c in self.free if door_of.get(c, goal) == goal}
+        queue = deque(c for c in ok if self.free[c].colliderect(goal))
+        dist = dict.fromkeys(queue, 0)
+        while queue:
+            c = queue.popleft()
+            d = dist[c] + 1
+            for dx, dy in _NAV_STEPS:
+                n = (c[0] + dx, c[1] + dy)
+                # no corner cutting on diagonals
+                if n in ok and n not in dist and (c[0] + dx, c[1]) in ok and (c[0], c[1] + dy) in ok:
+                    dist[n] = d
+                    queue.append(n)
+        return dist
+
+    def step(self, dist: dict[tuple[int, int], int], x: float, y: float) -> tuple[float, float] | None:
+        """Direction towards the neighbouring cell closest to the goal, or None when off the map."""
+        c = self.cell(x, y)
+        best, best_d = None, dist.get(c)
+        for dx, dy in _NAV_STEPS:
+            n = (c[0] + dx, c[1] + dy)
+            d = dist.get(n)
+            # same no-corner-cutting rule as the field, or the hitbox clips walls and doors on the way
+            if d is not None and (best_d is None or d < best_d) and \
+                    ((c[0] + dx, c[1]) in dist and (c[0], c[1] + dy) in dist or c not in dist):
+                best, best_d = n, d
+        if best is None:
+            return None
+        tx, ty = self.world(*best)
+        return tx - x, ty - y
+
+
+def _keys_toward(dx: float, dy: float) -> KeySet:
+    """WASD keys approximating the direction (dx, dy)."""
+    n = math.hypot(dx, dy)
+    if n < 1e-6:
+        return KeySet()
+    dx, dy = dx / n, dy / n
+    down = []
+    if dx > 0.38: down.append(pg.K_d)
+    elif dx < -0.38: down.append(pg.K_a)
+    if dy > 0.38: down.append(pg.K_s)
+    elif dy < -0.38: down.append(pg.K_w)
+    return KeySet(down)
+
+
+class Bot:
+    """
+    Fights the nearest enemy or boss, picks up items, then walks to a door,
+    exploring every room before the boss; presses N after a boss. Sidesteps
+    enemy shots about to hit it, and with no line of fire to its target walks
+    round the walls towards it. Subclasses only change how it moves while it
+    can shoot. Unsticks itself by wandering when blocked.
+    """
+    name = "bot"
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.rng = random.Random(seed)
+        self._last = (0.0, 0.0)
+        self._stalled = 0
+        self._wander = (0.0, 0.0)
+        self._wander_left = 0
+        self._route: tuple | None = None     # (rooms, grid pos, door side) of the last route
+        self._goal: tuple | None = None      # (rooms, grid pos, picked as unvisited) of the room being walked to
+        self._strafe = 1
+        self._nav: tuple | None = None       # (walls, NavGrid) of the current room
+        self._field: tuple | None = None     # (key, tick, distance field) of the last path goal
+
+    def fight_move(self, dx: float, dy: float, dist: float, tick: int) -> tuple[float, float]:
+        return 0.0, 0.0
+
+    @staticmethod
+    def _room_bfs(scene) -> tuple[dict[tuple[int, int], str | None], list[tuple[int, int]]]:
+        """First door side towards every reachable room, and the rooms in BFS order (sides in _SIDE_STEP order)."""
+        start = scene.current_gp
+        first: dict[tuple[int, int], str | None] = {start: None}
+        queue = [start]
+        for gp in queue:
+            doors = scene.rooms[gp].doors
+            for side, (dx, dy) in _SIDE_STEP.items():
+                nxt = (gp[0] + dx, gp[1] + dy)
+                if side in doors and nxt in scene.rooms and nxt not in first:
+                    first[nxt] = first[gp] or side
+                    queue.append(nxt)
+        return first, queue
+
+    def _pick_door(self, scene) -> str | None:
+        """
+        First door on the shortest path to the goal room: the nearest unvisited
+        room, and the boss room once there are none left. The goal is kept
+        until it is reached, visited or unreachable, so equally distant rooms
+        can't trade places.
+        """
+        start = scene.current_gp
+        if self._route is not None and self._route[0] is scene.rooms and self._route[1] == start:
+            side = self._route[2]
+            return side if scene.current_room.doors[side].open else None
+        first, order = self._room_bfs(scene)
+        g = self._goal
+        if (g is None or g[0] is not scene.rooms or g[1] == start or g[1] not in first
+                or g[2] and scene.rooms[g[1]].visited):
+            g = None
+            for gp in order[1:]:
+                room = scene.rooms[gp]
+                if room.kind == "boss":
+                    g = g or (scene.rooms, gp, False)
+                elif not room.visited:
+                    g = (scene.rooms, gp, True)
+                    break
+            self._goal = g
+        if g is None:
+            return None
+        side = first[g[1]]
+        self._route = (scene.rooms, start, side)
+        return side if scene.current_room.doors[side].open else None
+
+    def _grid(self, scene) -> NavGrid:
+        if self._nav is None or self._nav[0] is not scene.walls:
+            self._nav = (scene.walls, NavGrid(scene.current_room, scene.walls))
+            self._field = None
+        return self._nav[1]
+
+    def _path_step(self, scene, key, goal: pg.Rect, tick: int, max_age: int | None = None) -> tuple[float, float] | None:
+        """Step along the grid towards `goal`; the field is rebuilt when `key` changes or it is `max_age` ticks old."""
+        grid = self._grid(scene)
+        f = self._field
+        if f is None or f[0] != key or max_age is not None and tick - f[1] >= max_age:
+            f = self._field = (key, tick, grid.field(goal))
+        return grid.step(f[2], scene.player.x, scene.player.y)
+
+    def _chase(self, scene, t, tick: int) -> tuple[float, float] | None:
+        """Walk round the walls towards a target there is no line of fire to; None if there is one."""
+        o, c = scene.player.center(), t.center()
+        if not any(w.inflate(_SHOT_CLEARANCE, _SHOT_CLEARANCE).clipline(o, c) for w in scene.walls):
+            return None
+        grid = self._grid(scene)
+        cx, cy = grid.cell(c.x, c.y)
+        # coarse key: the field follows the target every few cells, not every pixel
+        return self._path_step(scene, ("chase", id(t), cx // 3, cy // 3), t.rect().inflate(64, 64), tick, 30)
+
+    @staticmethod
+    def _dodge(scene) -> tuple[float, float] | None:
+        """Sidestep the first enemy shot that will hit, away from the side it passes on."""
+        f = scene.e_projectiles
+        n = f.n
+        if not n:
+            return None
+        o = scene.player.center()
+        live = f.alive[:n]
+        rx, ry = f.x[:n] - o.x, f.y[:n] - o.y
+        vx, vy = f.vx[:n], f.vy[:n]
+        v2 = np.maximum(vx * vx + vy * vy, 1e-9)
+        tc = -(rx * vx + ry * vy) / v2          # time of closest approach
+        mx, my = rx + vx * tc, ry + vy * tc     # where the shot passes, relative to the player
+        threat = live & (tc > 0) & (tc < _DODGE_TIME) & (mx * mx + my * my < _DODGE_MISS ** 2)
+        if not threat.any():
+            return None
+        i = int(np.flatnonzero(threat)[np.argmin(tc[threat])])
+        # perpendicular to the shot, on the side it doesn't pass
+        sx, sy = -float(vy[i]), float(vx[i])
+        if sx * mx[i] + sy * my[i] > 0:
+            sx, sy = -sx, -sy
+        return sx, sy
+
+    def __call__(self, tick: int, scene) -> InputFrame:
+        player = scene.player
+        px, py = player.x, player.y
+        events = ()
+        fire = False
+        aim = (px + 1.0, py)
+        move = (0.0, 0.0)
+
+        targets = [e for e in scene.enemies if e.alive]
+        if scene.boss is not None:
+            targets.append(scene.boss)
+        if targets:
+            t = min(targets, key=lambda e: (e.x - px) ** 2 + (e.y - py) ** 2)
+            c = t.center()
+            aim = (c.x, c.y)
+            fire = True
+            dx, dy = t.x - px, t.y - py
+            move = self._chase(scene, t, tick) or self.fight_move(dx, dy, math.hypot(dx, dy), tick)
+        elif scene.item_pickup is not None and scene.item_pickup.alive:
+            move = (scene.item_pickup.x - px, scene.item_pickup.y - py)
+        elif scene.current_room.kind == "boss" and scene.room_cleared:
+            if tick % 30 == 0:
+                events = (_NEXT_FLOOR,)
+        else:
+            side = self._pick_door(scene)
+            if side is not None:
+                door = scene.current_room.doors[side].rect
+                aim = door.center
+                move = (self._path_step(scene, ("door", side), door, tick)
+                        or (door.centerx - px, door.centery - py))
+
+        move = self._dodge(scene) or move
+
+        # blocked for a while -> wander in a random direction
+        moved = abs(px - self._last[0]) + abs(py - self._last[1])
+        self._last = (px, py)
+        if self._wander_left > 0:
+            self._wander_left -= 1
+            move = self._wander
+        elif move != (0.0, 0.0) and moved < 0.25:
+            self._stalled += 1
+            if self._stalled > 20:
+                ang = self.rng.random() * math.tau
+                self._wander = (math.cos(ang), math.sin(ang))
+                self._wander_left = 30
+                self._stalled = 0
+        else:
+            self._stalled = 0
+
+        return InputFrame(
+            keys=_keys_toward(*move),
+            mouse_buttons=(fire, False, False),
+            mouse_pos=scene.camera.world_to_screen(*aim),
+            events=events,
+        )
+
+
+class TurretBot(Bot):
+    """Stands still and shoots while it has a line of fire."""
+    name = "turret"
+
+
+class RushBot(Bot):
+    """Runs at the nearest target while shooting."""
+    name = "rush"
+
+    def fight_move(self, dx, dy, dist, tick):
+        return (dx, dy) if dist > 48 else (0.0, 0.0)
+
+
+class KiteBot(Bot):
+    """Keeps the nearest target at mid range, circling it."""
+    name = "kite"
+    near, far = 170.0, 300.0
+
+    def fight_move(self, dx, dy, dist, tick):
+        if tick % 120 == 0 and self.rng.random() < 0.3:
+            self._strafe = -self._strafe
+        if dist < self.near:
+            return -dx, -dy
+        if dist > self.far:
+            return dx, dy
+        return -dy * self._strafe, dx * self._strafe
+
+
+POLICIES: dict[str, type[Bot]] = {cls.name: cls for cls in (TurretBot, RushBot, KiteBot)}
+
+
+def make_bot(policy: str, seed: int | None = None) -> Bot:
+    try:
+        return POLICIES[policy](seed)
+    except KeyError as e:
+        raise KeyError(f"Unknown bot policy: {policy!r}. Known: {sorted(POLICIES)}") from e
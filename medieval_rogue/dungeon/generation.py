@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from typing import Dict, Tuple, Optional
 from medieval_rogue.dungeon.room import Room, PATTERNS, RoomType, Direction
 from medieval_rogue import settings as S
+from medieval_rogue import rng as run_rng
+from medieval_rogue.trace import traced
 
 GridPos = Tuple[int, int]
 
@@ -105,8 +107,9 @@ def _pick_item_leaf(
 
 # --- Floor generation ---
 
+@traced
 def generate_floor(floor_index: int, rng: Optional[random.Random] = None) -> FloorPlan:
-    rng = rng or random.Random(S.RANDOM_SEED)
+    rng = rng or run_rng.current().fork("generation", "floor", floor_index)
     n_rooms = rng.randint(S.MIN_ROOMS, S.MAX_ROOMS)
 
     sizes = _grow_tree(rng, n_rooms)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 import pygame as pg, random
+import numpy as np
 from dataclasses import dataclass, field
 from typing import Literal, List, Tuple, Dict
 from medieval_rogue import settings as S
 from medieval_rogue.camera import Camera
+from medieval_rogue.trace import traced
 from assets.sprite_manager import _load_image, load_strip
 
 INSET = S.ROOM_INSET
@@ -20,6 +22,9 @@ _SCALE_Y = S.BASE_H / _BASE_PATTERN_H
 
 RectSpec = Tuple[int, int, int, int]
 
+# Layers of Room.variant_grid
+GRID_FLOOR, GRID_WALL, GRID_OBS = 0, 1, 2
+
 # --- Patterns ---
 # Keys: (room_type, w_cells, h_cells)
 # NOTE: coordinates are authored in the base 320x180 logical space.
@@ -155,6 +160,7 @@ _FLOOR = None
 _WALLS  = None
 _OBS   = None
 _DOOR  = {}   # "h_open", "h_closed", "v_open", "v_closed"
+_DOOR_SCALED: dict[tuple[str, int, int], pg.Surface] = {}
 
 def _get_tiles():
     global _FLOOR, _WALLS, _OBS, _DOOR
@@ -185,6 +191,16 @@ def _get_tiles():
         }
     return _FLOOR, _WALLS, _OBS, _DOOR
 
+def _scaled_door(key: str, img: pg.Surface | None, size: tuple[int, int]) -> pg.Surface | None:
+    if img is None:
+        return None
+    ck = (key, int(size[0]), int(size[1]))
+    scaled = _DOOR_SCALED.get(ck)
+    if scaled is None:
+        scaled = img if img.get_size() == size else pg.transform.scale(img, size)
+        _DOOR_SCALED[ck] = scaled
+    return scaled
+
 def _variant_index_at(
     images: list[pg.Surface],
     wx: int,
@@ -229,33 +245,79 @@ def _variant_index_at(
             return i
     return len(images) - 1
 
+def _variant_index_grid(
+    images: list[pg.Surface],
+    tx0: int,
+    ty0: int,
+    cols: int,
+    rows: int,
+    salt: int = 0,
+    weights: list[int] | None = None
+) -> np.ndarray:
+    """
+    Batched _variant_index_at over a rows x cols block of tiles whose top-left
+    tile coordinate is (tx0, ty0). Same splitmix64 hash and weighted pick, so
+    grid[j, i] == _variant_index_at(images, (tx0+i)*tw, (ty0+j)*th, salt, weights).
+    """
+    if not images or cols <= 0 or rows <= 0:
+        return np.zeros((max(0, rows), max(0, cols)), dtype=np.uint8)
+
+    M = 0xFFFFFFFFFFFFFFFF
+    base_seed = (S.RANDOM_SEED if getattr(S, "RANDOM_SEED", None) is not None else 1337) & M
+    salt_term = ((salt & M) * 0x165667B19E3779F9) & M
+
+    tx = np.arange(tx0, tx0 + cols, dtype=np.int64).view(np.uint64)
+    ty = np.arange(ty0, ty0 + rows, dtype=np.int64).view(np.uint64)[:, None]
+
+    z  = tx * np.uint64(0x9E3779B97F4A7C15)
+    z  = z ^ (ty * np.uint64(0xC2B2AE3D27D4EB4F))
+    z ^= np.uint64(salt_term ^ base_seed)
+
+    z ^= (z >> np.uint64(30)); z *= np.uint64(0xBF58476D1CE4E5B9)
+    z ^= (z >> np.uint64(27)); z *= np.uint64(0x94D049BB133111EB)
+    z ^= (z >> np.uint64(31))
+
+    w = _weights_for_images(images, weights)
+    total = np.uint64(sum(w))
+    # high 64 bits of the 128-bit product rnd * total, done in 32-bit halves
+    hi = (z >> np.uint64(32)) * total
+    lo = ((z & np.uint64(0xFFFFFFFF)) * total) >> np.uint64(32)
+    r = (hi + lo) >> np.uint64(32)
+
+    idx = np.searchsorted(np.cumsum(np.asarray(w, dtype=np.uint64)), r, side="right")
+    return np.minimum(idx, len(images) - 1).astype(np.uint8)
+
 def _tile_rect_world_variants(
     surf: pg.Surface,
     images: list[pg.Surface],
     rect_world: pg.Rect,
     camera: Camera | None,
-    weights: list[int] | None = None,
-    salt: int = 0,
+    grid: np.ndarray,
+    origin: tuple[int, int] = (0, 0),
 ):
+    """Blit tiles covering rect_world, picking variants from a precomputed grid.
+    origin is the tile coordinate of grid[0, 0]."""
     if not images:
         return
     tw, th = images[0].get_width(), images[0].get_height()
+    ox, oy = origin
 
     start_x = rect_world.left - (rect_world.left % tw)
     start_y = rect_world.top  - (rect_world.top  % th)
 
+    blits = []
     y = start_y
     while y < rect_world.bottom:
         x = start_x
+        row = grid[y // th - oy]
         while x < rect_world.right:
-            idx = _variant_index_at(images, x, y, salt=salt, weights=weights)
-            img = images[idx]
+            img = images[row[x // tw - ox]]
             sx, sy = (x, y) if camera is None else camera.world_to_screen(x, y)
-            if x + tw > rect_world.left and x < rect_world.right and y + th > rect_world.top and y < rect_world.bottom:
-                surf.blit(img, (sx, sy))
+            blits.append((img, (sx, sy)))
             x += tw
         y += th
-        
+    surf.blits(blits, doreturn=False)
+
 def _stable_hash_int(*parts: object) -> int:
     seed = (S.RANDOM_SEED if getattr(S, "RANDOM_SEED", None) is not None else 1337)
     h = int(seed) & 0x7FFFFFFF
@@ -302,6 +364,10 @@ class Room:
     wall_variant_index: int = 0
     obs_variant_index: int = 0
 
+    _baked: pg.Surface | None = field(default=None, init=False, repr=False, compare=False)
+    _baked_key: tuple | None = field(default=None, init=False, repr=False, compare=False)
+    _variant_grid: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         self.variant_salt = _stable_hash_int("room-tiles", self.kind, self.gx, self.gy, self.w_cells, self.h_cells)
             
@@ -315,6 +381,40 @@ class Room:
             self.h_cells * S.ROOM_CELL_H,
         )
 
+    @property
+    def tile_origin(self) -> tuple[int, int]:
+        """Tile coordinate of the room's top-left tile (index [0, 0] of variant_grid)."""
+        wr = self.world_rect
+        return wr.x // S.TILE_SIZE, wr.y // S.TILE_SIZE
+
+    @property
+    def variant_grid(self) -> np.ndarray:
+        """
+        Tile variant indices for the whole room, shape (3, rows, cols):
+        layer GRID_FLOOR / GRID_WALL / GRID_OBS. Computed once per room.
+        """
+        if self._variant_grid is None:
+            FLOOR, WALL, OBS, _ = _get_tiles()
+            wr = self.world_rect
+            T = S.TILE_SIZE
+            tx0, ty0 = self.tile_origin
+            cols = -(-wr.w // T)
+            rows = -(-wr.h // T)
+            obs_imgs = OBS if OBS else WALL
+            obs_weights = getattr(S, "OBS_TILE_WEIGHTS", None) if OBS else getattr(S, "WALL_TILE_WEIGHTS", None)
+            self._variant_grid = np.stack([
+                _variant_index_grid(FLOOR, tx0, ty0, cols, rows,
+                                    salt=self.variant_salt ^ 0xD1B54A32,
+                                    weights=getattr(S, "FLOOR_TILE_WEIGHTS", None)),
+                _variant_index_grid(WALL, tx0, ty0, cols, rows,
+                                    salt=self.variant_salt,
+                                    weights=getattr(S, "WALL_TILE_WEIGHTS", None)),
+                _variant_index_grid(obs_imgs, tx0, ty0, cols, rows,
+                                    salt=self.variant_salt ^ 0x9E3779B9,
+                                    weights=obs_weights),
+            ])
+        return self._variant_grid
+
     def to_world(self, p: RectSpec) -> pg.Rect:
         x, y, w, h = p
 
@@ -335,6 +435,7 @@ class Room:
         return r.clip(interior)
 
     # --- Walls ---
+    @traced
     def wall_rects(self) -> List[pg.Rect]:
         r = inset_rect(self.world_rect, INSET)
         b = S.WALL_THICKNESS
@@ -402,61 +503,85 @@ class Room:
             self.doors[side] = Door(side=side, rect=rect, open=self.cleared or self.kind in ("start", "item"))
 
     # --- Drawing ---
-    def draw(self, surf: pg.Surface, camera: Camera | None = None) -> None:
+    def _door_state_key(self) -> tuple:
+        return tuple((side, d.open) for side, d in self.doors.items())
+
+    def invalidate_bake(self) -> None:
+        """Drop the pre-rendered static layers (rebuilt lazily on next draw)."""
+        self._baked = None
+        self._baked_key = None
+
+    @traced
+    def _bake_static(self) -> pg.Surface:
+        """
+        Render floor, walls, obstacles and doors once into a world-space surface
+        covering world_rect. Re-baked only when a door opens or closes.
+        """
+        key = self._door_state_key()
+        if self._baked is not None and self._baked_key == key:
+            return self._baked
+
+        wr = self.world_rect
+        baked = pg.Surface(wr.size, pg.SRCALPHA)
+        # tiles are placed relative to the room origin
+        local = Camera(w=wr.w, h=wr.h, x=float(wr.x), y=float(wr.y))
+
         def _apply(r: pg.Rect) -> pg.Rect:
-            if camera is None: return r
-            x, y = camera.world_to_screen(r.x, r.y)
+            x, y = local.world_to_screen(r.x, r.y)
             return pg.Rect(int(x), int(y), int(r.w), int(r.h))
 
         FLOOR, WALL, OBS, DOOR = _get_tiles()
+        grid = self.variant_grid
+        origin = self.tile_origin
 
         # floor
-        interior = inset_rect(self.world_rect, INSET + S.WALL_THICKNESS)
-        FLOOR_WEIGHTS = getattr(S, "FLOOR_TILE_WEIGHTS", None)
+        interior = inset_rect(wr, INSET + S.WALL_THICKNESS)
         if FLOOR:
-            _tile_rect_world_variants(
-                surf, FLOOR, interior, camera,
-                weights=FLOOR_WEIGHTS,
-                salt=self.variant_salt ^ 0xD1B54A32,
-            )
+            _tile_rect_world_variants(baked, FLOOR, interior, local, grid[GRID_FLOOR], origin)
         else:
-            pg.draw.rect(surf, S.FLOOR_COLOR, _apply(interior))
+            pg.draw.rect(baked, S.FLOOR_COLOR, _apply(interior))
 
         # walls
         walls = self.wall_rects()
 
-        WALL_TILE_WEIGHTS = getattr(S, "WALL_TILE_WEIGHTS", None)
-        OBS_TILE_WEIGHTS  = getattr(S, "OBS_TILE_WEIGHTS", None)
-
         for wrect in walls[:4]:
             if WALL:
-                _tile_rect_world_variants(
-                    surf, WALL, wrect, camera,
-                    weights=WALL_TILE_WEIGHTS,
-                    salt=self.variant_salt,
-                )
+                _tile_rect_world_variants(baked, WALL, wrect, local, grid[GRID_WALL], origin)
             else:
-                pg.draw.rect(surf, S.BORDER_COLOR, _apply(wrect))
+                pg.draw.rect(baked, S.BORDER_COLOR, _apply(wrect))
 
         for wrect in walls[4:]:
             imgs = OBS if OBS else WALL
             if imgs:
-                _tile_rect_world_variants(
-                    surf, imgs, wrect, camera,
-                    weights=(OBS_TILE_WEIGHTS if imgs is OBS else WALL_TILE_WEIGHTS),
-                    salt=self.variant_salt ^ 0x9E3779B9,
-                )
+                _tile_rect_world_variants(baked, imgs, wrect, local, grid[GRID_OBS], origin)
             else:
-                pg.draw.rect(surf, S.OBSTACLES_COLOR, _apply(wrect))
+                pg.draw.rect(baked, S.OBSTACLES_COLOR, _apply(wrect))
 
         for d in self.doors.values():
             sr = _apply(d.rect)
             horizontal = (d.side in ("N","S"))
-            key = ("h_" if horizontal else "v_") + ("open" if d.open else "closed")
-            img = DOOR.get(key)
+            key_img = ("h_" if horizontal else "v_") + ("open" if d.open else "closed")
+            img = _scaled_door(key_img, DOOR.get(key_img), sr.size)
             if img:
-                scaled = pg.transform.scale(img, (sr.w, sr.h))
-                surf.blit(scaled, sr.topleft)
+                baked.blit(img, sr.topleft)
             else:
                 color = S.DOOR_OPEN_COLOR if d.open else S.DOOR_CLOSED_COLOR
-                pg.draw.rect(surf, color, sr)
+                pg.draw.rect(baked, color, sr)
+
+        self._baked = baked
+        self._baked_key = key
+        return baked
+
+    @traced
+    def draw(self, surf: pg.Surface, camera: Camera | None = None) -> None:
+        baked = self._bake_static()
+        wr = self.world_rect
+        if camera is None:
+            ox, oy = wr.x, wr.y
+        else:
+            ox, oy = camera.world_to_screen(wr.x, wr.y)
+
+        # blit only the slice of the baked room that lands on screen
+        view = pg.Rect(-ox, -oy, surf.get_width(), surf.get_height()).clip(baked.get_rect())
+        if view.w > 0 and view.h > 0:
+            surf.blit(baked, (ox + view.x, oy + view.y), view)
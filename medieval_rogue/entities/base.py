@@ -1,24 +1,53 @@
 from __future__ import annotations
 import pygame as pg
 from dataclasses import dataclass
+from typing import ClassVar
 
 
-@dataclass
-class Entity:
+def feet_hitbox(size: tuple[int, int]) -> tuple[int, int, int, int]:
+    """Hitbox (ox, oy, w, h) centred on x and standing on y."""
+    w, h = size
+    return -(w // 2), -h, w, h
+
+
+class Hitboxed:
+    """
+    Mixin giving rect()/center() from a hitbox (ox, oy, w, h) relative to
+    (x, y). The rect and centre are allocated once and moved in place when
+    x/y change; callers must treat them as read-only (copy before editing).
+    """
+    __slots__ = ("_rect", "_center", "_rx", "_ry")
+    hitbox: ClassVar[tuple[int, int, int, int]]
+
+    def rect(self) -> pg.Rect:
+        x, y = self.x, self.y
+        try:
+            if x == self._rx and y == self._ry:
+                return self._rect
+            r = self._rect
+        except AttributeError:
+            r = self._rect = pg.Rect(0, 0, 0, 0)
+            self._center = pg.Vector2()
+        ox, oy, w, h = self.hitbox
+        r.update(int(x + ox), int(y + oy), w, h)
+        self._center.update(r.centerx, r.centery)
+        self._rx, self._ry = x, y
+        return r
+
+    def center(self) -> pg.Vector2:
+        self.rect()
+        return self._center
+
+
+@dataclass(slots=True)
+class Entity(Hitboxed):
     x: float
     y: float
     sprite_id: str
     alive: bool = True
 
-    def rect(self) -> pg.Rect:
-        raise NotImplementedError
-
     def update(self, dt: float, **kwargs) -> None:
         raise NotImplementedError
 
     def draw(self, surf: pg.Surface, camera=None) -> None:
         raise NotImplementedError
-
-    def center(self) -> pg.Vector2:
-        r = self.rect()
-        return pg.Vector2(r.centerx, r.centery)
@@ -1,15 +1,21 @@
 from __future__ import annotations
-import pygame as pg, random, math
-from medieval_rogue.entities.projectile import Projectile
+import pygame as pg, math
 from medieval_rogue.entities.utilities import move_and_collide
 from medieval_rogue.camera import Camera
+from medieval_rogue import rng
+from medieval_rogue.trace import traced
 from medieval_rogue.entities.enemy import Enemy
 from medieval_rogue.entities.enemy_registry import register_boss
 from assets.sprite_manager import AnimatedSprite, load_strip
 
+_BOSS_RECT = (-16, -16, 32, 32)     # (ox, oy, w, h) around the boss centre
+
 
 @register_boss("the_skull")
 class TheSkull(Enemy):     # bouncing + 5-way volley
+    __slots__ = ("is_boss", "max_hp", "name", "vx", "vy")
+    hitbox = _BOSS_RECT
+
     def __init__(self, x, y, **opts):
         super().__init__(x, y, hp=40, speed=360.0, sprite_id="the_skull")
         self.is_boss = True
@@ -23,9 +29,6 @@ class TheSkull(Enemy):     # bouncing + 5-way volley
 
         self.sprite = AnimatedSprite(frames, fps=4, loop=True, anchor='center')  
 
-    def rect(self) -> pg.Rect:
-        return pg.Rect(int(self.x-16), int(self.y-16), 32, 32)
-
     def draw(self, surf: pg.Surface, camera: Camera = None) -> None:
         if self.sprite:
             self.sprite.draw(surf, self.x, self.y, camera=camera)
@@ -36,6 +39,7 @@ class TheSkull(Enemy):     # bouncing + 5-way volley
                 r = pg.Rect(sx, sy, r.w, r.h)
             pg.draw.rect(surf, (50,220,150), r)
 
+    @traced
     def update(self, dt, player_pos, walls, projectiles):
         # --- Movement (bounce) ---
         dx = self.vx * dt
@@ -62,14 +66,17 @@ class TheSkull(Enemy):     # bouncing + 5-way volley
     def _fire_volley(self, projectiles):
         for ang in (0, 72, 144, 216, 288):
             rad = math.radians(ang)
-            projectiles.append(Projectile(
+            projectiles.spawn(
                 self.x, self.y,
                 math.cos(rad) * 130, math.sin(rad) * 130,
                 6, 1, False, sprite_id=None, color=(255,103,255)
-            ))
+            )
 
 @register_boss("warlock")
 class Warlock(Enemy):    # bullet rings + 3-shot sync
+    __slots__ = ("is_boss", "max_hp", "name", "spawn_x", "spawn_y", "t")
+    hitbox = _BOSS_RECT
+
     def __init__(self, x, y, **opts):
         super().__init__(x, y, hp=40, speed=0.0, sprite_id="warlock")
         self.t = 0.0
@@ -83,9 +90,6 @@ class Warlock(Enemy):    # bullet rings + 3-shot sync
         frames = load_strip(['assets','sprites','bosses','warlock.png'], FRAME_W, FRAME_H)
         self.sprite = AnimatedSprite(frames, fps=4, loop=True, anchor='center')
 
-    def rect(self) -> pg.Rect:
-        return pg.Rect(int(self.x-16), int(self.y-16), 32, 32)
-
     def draw(self, surf: pg.Surface, camera: Camera = None) -> None:
         if self.sprite:
             self.sprite.draw(surf, self.x, self.y, camera=camera)
@@ -96,6 +100,7 @@ class Warlock(Enemy):    # bullet rings + 3-shot sync
                 r = pg.Rect(sx, sy, r.w, r.h)
             pg.draw.rect(surf, (180,100,220), r)
 
+    @traced
     def update(self, dt, player_pos, walls, projectiles):
         # --- return to spawn position ---
         dx = (self.spawn_x - self.x) * 0.6 * dt
@@ -108,14 +113,14 @@ class Warlock(Enemy):    # bullet rings + 3-shot sync
         self.t += dt
         if self.t >= 0.8:
             self.t = 0.0
-            base = random.random() * math.tau
+            base = rng.current().ai.random() * math.tau
             for i in range(10):
                 a = base + (i/10.0)*math.tau
-                projectiles.append(Projectile(
+                projectiles.spawn(
                     self.x, self.y,
                     math.cos(a)*150, math.sin(a)*150,
                     6, 1, False, sprite_id="fireball"
-                ))
+                )
 
         # --- animation update ---
         if self.sprite:
@@ -129,14 +134,17 @@ class Warlock(Enemy):    # bullet rings + 3-shot sync
                     dirv = vec.normalize()
                     for spread in (-0.22, 0.0, 0.22):
                         v = dirv.rotate_rad(spread)
-                        projectiles.append(Projectile(
+                        projectiles.spawn(
                             self.x, self.y,
                             v.x*220.0, v.y*220.0,
                             6, 1, False, sprite_id="fireball"
-                        ))
+                        )
 
 @register_boss("knight_captain")
 class KnightCaptain(Enemy):      # telegraphed dash + lance projectiles while dashing
+    __slots__ = ("is_boss", "max_hp", "name", "anims", "state", "cd", "vx", "vy", "dash_emit_cd", "dash_timer")
+    hitbox = _BOSS_RECT
+
     def __init__(self, x, y, **opts):
         super().__init__(x, y, hp=50, speed=0.0, sprite_id="knight_captain")
         self.is_boss = True
@@ -164,9 +172,6 @@ class KnightCaptain(Enemy):      # telegraphed dash + lance projectiles while da
             nxt.paused = False; nxt.idx = 0; nxt.t = 0.0
             self.sprite = nxt
 
-    def rect(self) -> pg.Rect:
-        return pg.Rect(int(self.x-16), int(self.y-16), 32, 32)
-
     def draw(self, surf: pg.Surface, camera: Camera = None) -> None:
         if self.sprite:
             self.sprite.draw(surf, self.x, self.y, camera=camera)
@@ -177,6 +182,7 @@ class KnightCaptain(Enemy):      # telegraphed dash + lance projectiles while da
                 r = pg.Rect(sx, sy, r.w, r.h)
             pg.draw.rect(surf, (200,180,80) if self.state=="charge" else (220,140,60), r)
 
+    @traced
     def update(self, dt, player_pos, walls, projectiles):
         if self.state == "charge":
             self._set_anim("idle")
@@ -207,13 +213,13 @@ class KnightCaptain(Enemy):      # telegraphed dash + lance projectiles while da
                     dv = dv.normalize()
                     for spread in (-0.25, 0.0, 0.25):
                         a = dv.rotate_rad(spread)
-                        projectiles.append(Projectile(
+                        projectiles.spawn(
                             self.x, self.y,
                             a.x * 360.0, a.y * 360.0,
                             6, 1, False,
                             sprite_id=None,
                             color=(87,191,56)
-                        ))
+                        )
 
             # End dash after timer or collision
             self.dash_timer -= dt
@@ -227,6 +233,9 @@ class KnightCaptain(Enemy):      # telegraphed dash + lance projectiles while da
 
 @register_boss("ogre_warrior")
 class OgreWarrior(Enemy):
+    __slots__ = ("is_boss", "max_hp", "name", "anims", "_state", "_cd", "vx", "vy", "dash_timer")
+    hitbox = _BOSS_RECT
+
     def __init__(self, x, y, **opts):
         super().__init__(x, y, hp=30, speed=100.0, sprite_id="ogre_warrior")
         self.is_boss = True
@@ -254,9 +263,6 @@ class OgreWarrior(Enemy):
             nxt.paused = False; nxt.idx = 0; nxt.t = 0.0
             self.sprite = nxt
 
-    def rect(self) -> pg.Rect:
-        return pg.Rect(int(self.x-16), int(self.y-16), 32, 32)
-
     def draw(self, surf: pg.Surface, camera: Camera | None = None) -> None:
         if self.sprite:
             self.sprite.draw(surf, self.x, self.y, camera=camera)
@@ -267,6 +273,7 @@ class OgreWarrior(Enemy):
                 r = pg.Rect(sx, sy, r.w, r.h)
             pg.draw.rect(surf, (180, 80, 60), r)
 
+    @traced
     def update(self, dt: float, player_pos: pg.Vector2, walls, projectiles):
         self._cd = max(0.0, self._cd - dt)
 
@@ -313,9 +320,7 @@ class OgreWarrior(Enemy):
                 for i in range(12):
                     ang = i * (math.tau / 12)
                     v = pg.Vector2(160.0, 0).rotate_rad(ang)
-                    projectiles.append(
-                        Projectile(self.x, self.y, v.x, v.y, 6, 1, False, sprite_id=None)
-                    )
+                    projectiles.spawn(self.x, self.y, v.x, v.y, 6, 1, False, sprite_id=None)
 
         if self.sprite:
             self.sprite.update(dt)
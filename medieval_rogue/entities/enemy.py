@@ -1,17 +1,20 @@
 from __future__ import annotations
-import pygame as pg, random, math
+import pygame as pg, math
 from dataclasses import dataclass
-from medieval_rogue.entities.projectile import Projectile
 from medieval_rogue.entities.utilities import move_and_collide
 from medieval_rogue.camera import Camera
-from medieval_rogue.entities.base import Entity
+from medieval_rogue.entities.base import Entity, feet_hitbox
 from medieval_rogue.entities.enemy_registry import register_enemy
 from medieval_rogue import settings as S
+from medieval_rogue import rng
+from medieval_rogue.trace import traced
 from assets.sprite_manager import AnimatedSprite, load_strip
 
 
-@dataclass
+@dataclass(slots=True)
 class Enemy(Entity):
+    hitbox = feet_hitbox(S.ENEMY_HITBOX)
+
     hp: int = 1
     speed: float = 40.0
     touch_damage: int = 1
@@ -39,24 +42,20 @@ class Enemy(Entity):
         except Exception:
             self.sprite = None
 
-    def rect(self):
-        w, h = S.ENEMY_HITBOX
-        return pg.Rect(int(self.x-w//2), int(self.y-h), w, h)
-
+    @traced
     def update(self, dt, player_pos, walls, projectiles, **kwargs):
         pass
 
 @register_enemy("slime", sprite_id="slime")
 class Slime(Enemy):
+    __slots__ = ()
+    hitbox = feet_hitbox(S.SMALL_ENEMY_HITBOX)
+
     def __init__(self, x, y, **opts):
         super().__init__(x, y, sprite_id="slime", hp=3, speed=90.0)
         frames = load_strip(['assets','sprites','enemies', f'{self.sprite_id}_walk.png'], 32, 32)
         self.sprite = AnimatedSprite(frames, fps=6, loop=True, anchor='bottom')
         
-    def rect(self):
-        w, h = S.SMALL_ENEMY_HITBOX
-        return pg.Rect(int(self.x-w//2), int(self.y-h), w, h)
-
     def draw(self, surf, camera: Camera=None):
         if self.sprite:
             self.sprite.draw(surf, self.x, self.y, camera=camera)
@@ -65,6 +64,7 @@ class Slime(Enemy):
             if camera is not None: sx, sy = camera.world_to_screen(r.x, r.y); r = pg.Rect(sx, sy, r.w, r.h)
             pg.draw.ellipse(surf, (100,200,100), r)
 
+    @traced
     def update(self, dt, player_pos, walls, projectiles):
         v = player_pos - self.center()
         w, h = S.ENEMY_HITBOX
@@ -85,7 +85,7 @@ class Slime(Enemy):
                     nx, ny = nx_v, ny_v
                 else:
                     # if both blocked, try small random sidestep
-                    ang = random.uniform(0, math.tau)
+                    ang = rng.current().ai.uniform(0, math.tau)
                     sidex = math.cos(ang) * (self.speed * dt * 0.5)
                     sidey = math.sin(ang) * (self.speed * dt * 0.5)
                     nx, ny, _ = move_and_collide(self.x, self.y, w, h, sidex, sidey, walls, ox=ox, oy=oy, stop_on_collision=False)
@@ -95,15 +95,14 @@ class Slime(Enemy):
 
 @register_enemy("bat", sprite_id="bat")
 class Bat(Enemy):
+    __slots__ = ()
+    hitbox = feet_hitbox(S.SMALL_ENEMY_HITBOX)
+
     def __init__(self, x, y, **opts):
         super().__init__(x, y, hp=1, sprite_id="bat", speed=180.0)
         frames = load_strip(['assets','sprites','enemies', f'{self.sprite_id}_walk.png'], 32, 32)
         self.sprite = AnimatedSprite(frames, fps=6, loop=True, anchor='bottom')
         
-    def rect(self):
-        w, h = S.SMALL_ENEMY_HITBOX
-        return pg.Rect(int(self.x-w//2), int(self.y-h), w, h)
-
     def draw(self, surf, camera: Camera=None):
         if hasattr(self, 'sprite') and self.sprite:
             self.sprite.draw(surf, self.x, self.y, camera=camera)
@@ -112,13 +111,15 @@ class Bat(Enemy):
             if camera is not None: sx, sy = camera.world_to_screen(r.x, r.y); r = pg.Rect(sx, sy, r.w, r.h)
             pg.draw.rect(surf, (120,120,220), r)
 
+    @traced
     def update(self, dt, player_pos, walls, projectiles):
         v = player_pos - self.center()
         w, h = S.ENEMY_HITBOX
         ox = -w//2
         oy = -h
         if v.length_squared() > 1:
-            jitter = pg.Vector2(random.uniform(-0.5,0.5), random.uniform(-0.5,0.5))*0.5
+            ai = rng.current().ai
+            jitter = pg.Vector2(ai.uniform(-0.5,0.5), ai.uniform(-0.5,0.5))*0.5
             step = (v.normalize() + jitter).normalize() * self.speed * dt
             nx, ny, collided = move_and_collide(self.x, self.y, w, h, step.x, step.y, walls, ox=ox, oy=oy, stop_on_collision=False)
             if collided:
@@ -135,6 +136,9 @@ class Bat(Enemy):
 
 @register_enemy("skeleton", sprite_id="skeleton")
 class Skeleton(Enemy):
+    __slots__ = ("anims", "shoot_anim", "walk_shoot_anim", "shoot_cd", "shoot_timer",
+                 "shoot_dur", "walk_shoot_dur", "facing_left")
+
     def __init__(self, x, y, **opts):
         super().__init__(x, y, hp=3, sprite_id="skeleton", speed=120.0)
         FRAME_W, FRAME_H = 64, 64
@@ -163,7 +167,7 @@ class Skeleton(Enemy):
         }
         self.sprite = self.anims["walk"]
 
-        self.shoot_cd = random.uniform(0.5, 1.2)
+        self.shoot_cd = rng.current().ai.uniform(0.5, 1.2)
         self.shoot_timer = 0.0
         self.facing_left = False
         
@@ -197,6 +201,7 @@ class Skeleton(Enemy):
                 r = pg.Rect(sx, sy, r.w, r.h)
             pg.draw.rect(surf, (220,220,220), r)
 
+    @traced
     def update(self, dt, player_pos, walls, projectiles):
         v = player_pos - self.center()
         w, h = S.ENEMY_HITBOX
@@ -234,7 +239,7 @@ class Skeleton(Enemy):
             speed = 360.0
 
             origin = self.muzzle_pos(d, height=0.55, forward=14.0)
-            projectiles.append(Projectile(origin.x, origin.y, d.x*speed, d.y*speed, 6, 1, False, sprite_id=None))
+            projectiles.spawn(origin.x, origin.y, d.x*speed, d.y*speed, 6, 1, False, sprite_id=None)
 
             is_moving = step.length_squared() > 0
             use = self.walk_shoot_anim if is_moving and "walk_shoot" in self.anims else self.shoot_anim
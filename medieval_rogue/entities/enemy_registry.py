@@ -10,27 +10,28 @@ class Registry:
     def __init__(self, kind: str) -> None:
         self.kind = kind
         self._reg: Dict[str, Callable[..., object]] = {}
+        self._meta: Dict[str, dict] = {}    # kept off the classes: entities are slotted
 
     def register(self, key: str, **meta):
         def deco(cls_or_fn: Callable[..., object]):
-            for k, v in meta.items():
-                try:
-                    setattr(cls_or_fn, k, v)
-                except Exception:
-                    pass
+            self._meta[key] = meta
             self._reg[key] = cls_or_fn
             return cls_or_fn
         return deco
 
+    def meta(self, key: str) -> dict:
+        return self._meta.get(key, {})
+
     def create(self, key: str, *args, **kwargs):
         try:
             factory = self._reg[key]
             inst = factory(*args, **kwargs)
         except KeyError as e:
             raise KeyError(f"Unknown {self.kind} kind: {key!r}. Known: {sorted(self._reg)}") from e
-        if hasattr(factory, 'sprite_id'):
+        sprite_id = self.meta(key).get('sprite_id')
+        if sprite_id is not None:
             from assets.sprite_manager import _load_image, slice_sheet, AnimatedSprite
-            path = ['assets', 'sprites', 'enemies', f'{factory.sprite_id}_idle.png']
+            path = ['assets', 'sprites', 'enemies', f'{sprite_id}_idle.png']
             try:
                 img = _load_image(path)
             except FileNotFoundError:
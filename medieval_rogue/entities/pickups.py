@@ -3,10 +3,11 @@ import pygame as pg
 from dataclasses import dataclass
 from medieval_rogue.entities.player import Player
 from medieval_rogue.camera import Camera
+from medieval_rogue.entities.base import Hitboxed
 from assets.sprite_manager import load_strip, AnimatedSprite
 
-@dataclass
-class ItemPickup:
+@dataclass(slots=True)
+class ItemPickup(Hitboxed):
     x: float
     y: float
     item_id: str
@@ -24,8 +25,9 @@ class ItemPickup:
             except Exception as e:
                 self.sprite = None
 
-    def rect(self) -> pg.Rect:
-        return pg.Rect(int(self.x - self.w // 2), int(self.y - self.h // 2), self.w, self.h)
+    @property
+    def hitbox(self) -> tuple[int, int, int, int]:
+        return -(self.w // 2), -(self.h // 2), self.w, self.h
 
     def update(self, dt: float, player: Player) -> None:
         if not self.alive:
@@ -3,8 +3,10 @@ import pygame as pg
 from dataclasses import dataclass, field
 from typing import List
 from medieval_rogue import settings as S
-from medieval_rogue.entities.projectile import Projectile
+from medieval_rogue.trace import traced
+from medieval_rogue.entities.projectile_field import ProjectileField
 from medieval_rogue.entities.utilities import move_and_collide
+from medieval_rogue.entities.base import Hitboxed, feet_hitbox
 from medieval_rogue.camera import Camera
 from medieval_rogue.entities.player_classes import PlayerClass
 from assets.sprite_manager import AnimatedSprite, _load_image, slice_sheet, load_strip
@@ -18,8 +20,10 @@ class PlayerStats:
     proj_speed: float = S.PLAYER_BASE_PROJ_SPEED
     damage: float = S.PLAYER_BASE_DAMAGE
 
-@dataclass
-class Player:
+@dataclass(slots=True)
+class Player(Hitboxed):
+    hitbox = feet_hitbox(S.PLAYER_HITBOX)
+
     x: float; y: float
     cls: PlayerClass
     stats: PlayerStats = field(default_factory=PlayerStats)
@@ -30,13 +34,15 @@ class Player:
     inventory: List[str] = field(default_factory=list)
     sprite_id: str = field(init=False)
     projectile_id: str = field(init=False)
+    sfx_shot: pg.mixer.Sound | None = field(default=None, init=False, repr=False)
+    facing_left: bool = field(default=False, init=False)
+    anims: dict[str, AnimatedSprite] = field(default_factory=dict, init=False, repr=False)
+    sprite: AnimatedSprite | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         self.hp = self.stats.hp
         self.sprite_id = self.cls.sprite_id
         self.projectile_id = self.cls.projectile_id
-        self.sfx_shot = None
-        self.facing_left = False
 
         def _safe_load_strip(path_parts, frame_w: int, frame_h: int) -> list[pg.Surface]:
             try:
@@ -94,19 +100,13 @@ class Player:
     @property
     def damage(self) -> float: return self.stats.damage
 
-    def rect(self) -> pg.Rect:
-        w,h = S.PLAYER_HITBOX
-        return pg.Rect(int(self.x-w//2), int(self.y-h), w, h)
-
-    def center(self) -> pg.Vector2:
-        r = self.rect(); return pg.Vector2(r.centerx, r.centery)
-
     def set_position(self, x: float, y: float) -> None:
         self.x = float(x)
         self.y = float(y)
         self.rect()
 
-    def update(self, dt: float, keys, mouse_buttons, mouse_pos, walls: list[pg.Rect], projectiles: list[Projectile]) -> None:
+    @traced
+    def update(self, dt: float, keys, mouse_buttons, mouse_pos, walls: list[pg.Rect], projectiles: ProjectileField) -> None:
         # Move inputs
         move = pg.Vector2(0, 0)
         if keys[pg.K_w] or keys[pg.K_UP]: move.y -= 1
@@ -125,7 +125,7 @@ class Player:
 
         # Shooting
         if mouse_buttons[0] and self.fire_cd <= 0.0:
-            origin = self.center()
+            origin = pg.Vector2(self.center())
             if self.cls.id == "mage":
                 origin.y -= 28
                 origin.x += 14
@@ -136,9 +136,7 @@ class Player:
                 v = dirn * self.proj_speed
                 spawn_x = origin.x + dirn.x
                 spawn_y = origin.y + dirn.y
-                projectiles.append(
-                    Projectile(spawn_x, spawn_y, v.x, v.y, 6, self.damage, True, sprite_id=self.projectile_id)
-                )
+                projectiles.spawn(spawn_x, spawn_y, v.x, v.y, 6, self.damage, True, sprite_id=self.projectile_id)
 
             self.fire_cd = 1.0 / self.firerate
             self.shoot_timer = self.fire_cd
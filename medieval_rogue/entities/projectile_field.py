@@ -0,0 +1,203 @@
+from __future__ import annotations
+import math
+import numpy as np
+import pygame as pg
+from typing import Iterable, Sequence
+from medieval_rogue.camera import Camera
+from medieval_rogue import settings as S
+from medieval_rogue.trace import traced
+from medieval_rogue.entities.projectile import projectile_sprite, rotation_bank
+from medieval_rogue.entities.utilities import WallGrid
+
+# style index -> (sprite_id, sprite or None, fallback circle color); shared by all fields
+_STYLES: list[tuple[str | None, pg.Surface | None, tuple[int, int, int]]] = []
+_STYLE_INDEX: dict[tuple, int] = {}
+
+_COLUMNS = (
+    ("x", np.float64), ("y", np.float64), ("px", np.float64), ("py", np.float64),
+    ("vx", np.float64), ("vy", np.float64),
+    ("radius", np.int32), ("damage", np.float64), ("friendly", np.bool_),
+    ("style", np.int32), ("alive", np.bool_),
+)
+
+
+def _style_index(sprite_id: str | None, color, friendly: bool) -> int:
+    key = (sprite_id, tuple(color) if color else None, bool(friendly))
+    idx = _STYLE_INDEX.get(key)
+    if idx is None:
+        sprite = projectile_sprite(sprite_id)
+        if color:
+            fallback = tuple(color)
+        else:
+            fallback = (240,220,120) if friendly else (220,90,90)
+        idx = len(_STYLES)
+        _STYLES.append((sprite_id, sprite, fallback))
+        _STYLE_INDEX[key] = idx
+    return idx
+
+
+def _boxes(rects: Iterable[pg.Rect]) -> np.ndarray:
+    """(4, N) int array of rect left/top/right/bottom edges."""
+    boxes = [(r.left, r.top, r.right, r.bottom) for r in rects]
+    return np.array(boxes, dtype=np.int64).reshape(-1, 4).T
+
+
+def _hits_any(left: np.ndarray, top: np.ndarray, size: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """Per-row pg.Rect.colliderect against any of the boxes."""
+    l, t, r, b = boxes
+    return ((left[:, None] < r) & (l < (left + size)[:, None]) &
+            (top[:, None] < b) & (t < (top + size)[:, None])).any(axis=1)
+
+
+class ProjectileField:
+    """
+    Struct-of-arrays projectile pool. Slots [0, n) hold projectiles, live or
+    dead (alive flag); dead slots go on a free list and spawn() reuses them,
+    so a shot is an O(1) slot write. update() integrates and wall-tests
+    every slot in bulk.
+    """
+    def __init__(self, capacity: int = 64) -> None:
+        self.n = 0
+        self._free: list[int] = []
+        self._alloc(max(1, capacity))
+        self._wall_src: WallGrid | None = None
+        self._wall_boxes = np.empty((4, 0), dtype=np.int64)
+
+    def _alloc(self, capacity: int) -> None:
+        for name, dtype in _COLUMNS:
+            arr = np.zeros(capacity, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                arr[:self.n] = old[:self.n]
+            setattr(self, name, arr)
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.alive[:self.n]))
+
+    def spawn(self, x: float, y: float, vx: float, vy: float, radius: int, damage: float, friendly: bool,
+              sprite_id: str | None = None, color: tuple[int,int,int] | None = None) -> int:
+        if self._free:
+            i = self._free.pop()
+        else:
+            i = self.n
+            if i == len(self.x):
+                self._alloc(2 * i)
+            self.n = i + 1
+        self.x[i] = self.px[i] = x; self.y[i] = self.py[i] = y; self.vx[i] = vx; self.vy[i] = vy
+        self.radius[i] = radius; self.damage[i] = damage; self.friendly[i] = friendly
+        self.style[i] = _style_index(sprite_id, color, friendly)
+        self.alive[i] = True
+        return i
+
+    def clear(self) -> None:
+        self.n = 0
+        self._free.clear()
+
+    def snapshot(self) -> None:
+        """Remember current positions as the previous sim state for draw(alpha)."""
+        n = self.n
+        self.px[:n] = self.x[:n]
+        self.py[:n] = self.y[:n]
+
+    def kill(self, i: int) -> None:
+        if self.alive[i]:
+            self.alive[i] = False
+            self._free.append(i)
+
+    def _walls(self, walls: Iterable[pg.Rect] | WallGrid) -> np.ndarray:
+        if isinstance(walls, WallGrid):
+            if walls is not self._wall_src:
+                self._wall_src = walls
+                self._wall_boxes = _boxes(walls)
+            return self._wall_boxes
+        return _boxes(walls)
+
+    @traced
+    def update(self, dt: float, walls: Iterable[pg.Rect] | WallGrid) -> None:
+        n = self.n
+        if not n:
+            return
+        alive = self.alive[:n]
+        x, y, rad = self.x[:n], self.y[:n], self.radius[:n]
+        nx = x + self.vx[:n] * dt
+        ny = y + self.vy[:n] * dt
+
+        # same test as move_and_collide(stop_on_collision=True): the x-moved rect, then the fully moved one
+        boxes = self._walls(walls)
+        if boxes.shape[1]:
+            size = 2 * rad
+            left = np.rint(nx - rad)
+            hit = _hits_any(left, np.rint(y - rad), size, boxes)
+            hit |= _hits_any(left, np.rint(ny - rad), size, boxes)
+            alive &= ~hit
+
+        np.copyto(x, nx, where=alive)
+        np.copyto(y, ny, where=alive)
+        self._release()
+
+    def _release(self) -> None:
+        """Trim trailing dead slots and rebuild the free list (lowest slot first)."""
+        alive = self.alive[:self.n]
+        live = np.flatnonzero(alive)
+        self.n = int(live[-1]) + 1 if len(live) else 0
+        self._free = np.flatnonzero(~alive[:self.n])[::-1].tolist()
+
+    @traced
+    def overlaps(self, rects: Sequence[pg.Rect]) -> np.ndarray:
+        """
+        (k, 2) array of (slot, rect index) pairs for live projectiles whose
+        rect overlaps one of rects, ordered by slot, then rect index.
+        """
+        n = self.n
+        if not n or not rects:
+            return np.empty((0, 2), dtype=np.intp)
+        live = np.flatnonzero(self.alive[:n] & (self.radius[:n] > 0))
+        rad = self.radius[live]
+        left = (self.x[live] - rad).astype(np.int64)    # int() truncation, as Hitboxed.rect()
+        top = (self.y[live] - rad).astype(np.int64)
+        l, t, r, b = _boxes(rects)
+        size = (2 * rad)[:, None]
+        hit = ((left[:, None] < r) & (l < left[:, None] + size) &
+               (top[:, None] < b) & (t < top[:, None] + size))
+        pairs = np.argwhere(hit)
+        pairs[:, 0] = live[pairs[:, 0]]
+        return pairs
+
+    @traced
+    def draw(self, surf: pg.Surface, camera: Camera = None, alpha: float = 1.0) -> None:
+        n = self.n
+        if not n:
+            return
+        live = np.flatnonzero(self.alive[:n])
+        x, y = self.x[live], self.y[live]
+        if alpha < 1.0:
+            px, py = self.px[live], self.py[live]
+            x = px + (x - px) * alpha
+            y = py + (y - py) * alpha
+        if camera is not None:
+            sx = np.rint(x - camera.x + camera.shake_x)
+            sy = np.rint(y - camera.y + camera.shake_y)
+        else:
+            sx, sy = np.trunc(x), np.trunc(y)
+        steps = max(1, int(S.PROJECTILE_ROTATION_STEPS))
+        turn = np.rint(np.arctan2(self.vy[live], self.vx[live]) * steps / math.tau).astype(np.int64) % steps
+
+        banks: dict[int, list[pg.Surface]] = {}
+        batch: list[tuple[pg.Surface, tuple[int, int]]] = []
+        for px, py, k, st, rad in zip(sx.astype(np.int64).tolist(), sy.astype(np.int64).tolist(), turn.tolist(),
+                                      self.style[live].tolist(), self.radius[live].tolist()):
+            sprite_id, sprite, color = _STYLES[st]
+            if sprite is not None:
+                bank = banks.get(st)
+                if bank is None:
+                    bank = banks[st] = rotation_bank(sprite_id, sprite)
+                img = bank[k]
+                w, h = img.get_size()
+                batch.append((img, (px - w // 2, py - h // 2)))
+            else:
+                if batch:
+                    surf.blits(batch, doreturn=False)
+                    batch.clear()
+                pg.draw.circle(surf, color, (px, py), rad)
+        if batch:
+            surf.blits(batch, doreturn=False)
@@ -1,6 +1,68 @@
 from __future__ import annotations
 import pygame as pg
-from typing import Iterable, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
+from medieval_rogue import settings as S
+
+
+class SpatialHash:
+    """
+    Uniform grid over rects, mapping each cell to the indices of the rects
+    overlapping it. Cheap to rebuild, so it works both for static walls and
+    for per-tick broadphase over moving entities.
+    """
+    def __init__(self, cell: int = 64) -> None:
+        self.cell = int(cell)
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def build(self, rects: Iterable[pg.Rect]) -> None:
+        c = self.cell
+        cells = self._cells
+        cells.clear()
+        for i, r in enumerate(rects):
+            for cy in range(r.top // c, (r.bottom - 1) // c + 1):
+                for cx in range(r.left // c, (r.right - 1) // c + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [i]
+                    else:
+                        bucket.append(i)
+
+    def query(self, rect: pg.Rect) -> List[int]:
+        """Indices of rects sharing a cell with rect, in insertion order."""
+        c = self.cell
+        cells = self._cells
+        x0, x1 = rect.left // c, (rect.right - 1) // c
+        y0, y1 = rect.top // c, (rect.bottom - 1) // c
+        if x0 == x1 and y0 == y1:
+            return cells.get((x0, y0), [])
+        found: set[int] = set()
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                idx = cells.get((cx, cy))
+                if idx:
+                    found.update(idx)
+        return sorted(found)
+
+
+class WallGrid:
+    """
+    Static broadphase over a room's wall rects. Build once per room (and again
+    when doors open); move_and_collide then only tests walls near the mover.
+    """
+    def __init__(self, walls: Iterable[pg.Rect], cell: int | None = None) -> None:
+        self.walls: List[pg.Rect] = list(walls)
+        self._hash = SpatialHash(cell or S.WALL_GRID_CELL)
+        self._hash.build(self.walls)
+
+    def query(self, rect: pg.Rect) -> List[pg.Rect]:
+        """Walls whose cells rect touches, in their original order."""
+        return [self.walls[i] for i in self._hash.query(rect)]
+
+    def __iter__(self) -> Iterator[pg.Rect]:
+        return iter(self.walls)
+
+    def __len__(self) -> int:
+        return len(self.walls)
 
 
 def move_and_collide(
@@ -10,7 +72,7 @@ def move_and_collide(
         h: int,
         dx: float,
         dy: float,
-        walls: Iterable[pg.Rect],
+        walls: Iterable[pg.Rect] | WallGrid,
         ox: int = 0,
         oy: int = 0,
         stop_on_collision: bool = False,
@@ -23,9 +85,16 @@ def move_and_collide(
       - collided is True if a collision was detected and stop_on_collision=True
         (useful for projectiles).
       - If stop_on_collision is False, movement is clamped against walls.
+    walls may be a WallGrid, in which case only walls near the swept rect are tested.
     """
     collided = False
 
+    if isinstance(walls, WallGrid):
+        x0, y0 = int(round(x + ox)), int(round(y + oy))
+        x1, y1 = int(round(x + dx + ox)), int(round(y + dy + oy))
+        swept = pg.Rect(min(x0, x1), min(y0, y1), abs(x1 - x0) + w, abs(y1 - y0) + h)
+        walls = walls.query(swept.inflate(2, 2))
+
     cx = x + dx
     rect_h = pg.Rect(int(round(cx + ox)), int(round(y + oy)), w, h)
     for wall in walls:
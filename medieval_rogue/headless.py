@@ -0,0 +1,133 @@
+"""
+Headless RunScene driver: no window, no drawing, no audio, scripted input.
+The sim advances as fast as the CPU allows, so it measures pure simulation
+throughput and can run gameplay in CI:
+
+    python -m medieval_rogue.headless --ticks 20000 --seed 4 --cls archer --policy kite
+
+The CLI plays with a bot from medieval_rogue.bots and also reports ticks/s
+with the bot's own time taken out; --policy idle never leaves the start room,
+so it times an empty room.
+"""
+from __future__ import annotations
+import argparse, os, time
+from dataclasses import dataclass
+import pygame as pg
+from medieval_rogue import settings as S
+from medieval_rogue.input_source import IDLE, ScriptedInput
+from medieval_rogue import trace
+
+
+def init_headless() -> None:
+    """Dummy video driver and a 1x1 display (needed for convert_alpha); the mixer stays off."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    if not pg.display.get_init():
+        pg.display.init()
+    if pg.display.get_surface() is None:
+        pg.display.set_mode((1, 1))
+    if not pg.font.get_init():
+        pg.font.init()
+
+
+class HeadlessApp:
+    """The subset of the app object RunScene relies on; render=True adds the fonts draw() needs."""
+    def __init__(self, chosen_class=None, input_source=None, seed: int | None = None, render: bool = False) -> None:
+        self.window = None
+        self.screen = None
+        self.clock = None
+        self.running = True
+        self.chosen_class = chosen_class
+        self.input = input_source
+        self.seed = seed
+        self.final_score = None
+        self.font = self.font_big = self.font_small = None
+        if render:
+            from medieval_rogue.ui.text import CachedFont
+            self.font = CachedFont(pg.font.Font(None, 48))
+            self.font_big = CachedFont(pg.font.Font(None, 72))
+            self.font_small = CachedFont(pg.font.Font(None, 42))
+
+
+@dataclass
+class SimResult:
+    seed: int
+    ticks: int
+    seconds: float
+    outcome: str | None     # next_scene when the run ended ("gameover", "victory", "menu"), else None
+    score: int
+    floor: int
+    rooms_visited: int
+    hp: int
+
+    @property
+    def ticks_per_sec(self) -> float:
+        return self.ticks / self.seconds if self.seconds > 0 else float("inf")
+
+
+def make_scene(input_source=None, cls: str = "archer", seed: int | None = None, render: bool = False):
+    """A RunScene on a HeadlessApp; input_source defaults to no input at all. Pass render=True to draw() it."""
+    from medieval_rogue.scenes.run import RunScene
+    from medieval_rogue.entities.player_classes import PLAYER_CLASSES
+    import medieval_rogue.entities
+
+    init_headless()
+    if input_source is None:
+        input_source = ScriptedInput(lambda tick, scene: IDLE)
+    return RunScene(HeadlessApp(PLAYER_CLASSES[cls], input_source, S.RANDOM_SEED if seed is None else seed, render))
+
+
+def simulate(ticks: int, input_source=None, cls: str = "archer", seed: int | None = None,
+             scene=None) -> SimResult:
+    """Advance a run by up to `ticks` fixed steps, stopping early when the run ends."""
+    if scene is None:
+        scene = make_scene(input_source, cls, seed)
+    dt = 1.0 / S.SIM_HZ
+    done = 0
+    t0 = time.perf_counter()
+    for done in range(1, ticks + 1):
+        scene.update(dt)
+        if scene.next_scene:
+            break
+    seconds = time.perf_counter() - t0
+    return SimResult(
+        seed=scene.rng.seed, ticks=done, seconds=seconds, outcome=scene.next_scene,
+        score=int(scene.score), floor=scene.floor_i,
+        rooms_visited=sum(1 for r in scene.rooms.values() if r.visited),
+        hp=scene.player.hp,
+    )
+
+
+def main() -> None:
+    from medieval_rogue.bots import POLICIES, make_bot
+    ap = argparse.ArgumentParser(description="Run the game simulation without a window.")
+    ap.add_argument("--ticks", type=int, default=10000)
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--cls", default="archer")
+    ap.add_argument("--policy", default="kite", choices=["idle", *POLICIES],
+                    help="bot playing the run; idle stays in the empty start room")
+    args = ap.parse_args()
+    source, bot_seconds = None, 0.0
+    if args.policy != "idle":
+        bot = make_bot(args.policy, args.seed)
+
+        def timed_bot(tick, scene):
+            nonlocal bot_seconds
+            t0 = time.perf_counter()
+            frame = bot(tick, scene)
+            bot_seconds += time.perf_counter() - t0
+            return frame
+        source = ScriptedInput(timed_bot)
+    res = simulate(args.ticks, source, cls=args.cls, seed=args.seed)
+    sim_seconds = res.seconds - bot_seconds
+    print(f"{res.ticks} ticks in {res.seconds:.2f}s ({res.ticks_per_sec:.0f} ticks/s), "
+          f"seed={res.seed} outcome={res.outcome} score={res.score} floor={res.floor + 1} rooms={res.rooms_visited} hp={res.hp}")
+    if bot_seconds:
+        print(f"  {args.policy} bot {bot_seconds:.2f}s; simulation alone {sim_seconds:.2f}s "
+              f"({res.ticks / sim_seconds if sim_seconds > 0 else float('inf'):.0f} ticks/s)")
+    if trace.TRACER is not None:
+        print(f"trace written to {trace.dump()}")
+
+
+if __name__ == "__main__":
+    main()
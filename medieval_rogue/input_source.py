@@ -0,0 +1,45 @@
+from __future__ import annotations
+import pygame as pg
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+
+class KeySet:
+    """Pressed-key lookup indexable like pg.key.get_pressed(): keys[pg.K_w]."""
+    __slots__ = ("down",)
+
+    def __init__(self, down: Iterable[int] = ()) -> None:
+        self.down = frozenset(down)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.down
+
+
+@dataclass(slots=True)
+class InputFrame:
+    """One sim step of input. mouse_pos is in screen space, as pg.mouse.get_pos()."""
+    keys: object = field(default_factory=KeySet)
+    mouse_buttons: tuple[bool, bool, bool] = (False, False, False)
+    mouse_pos: tuple[int, int] = (0, 0)
+    events: tuple[pg.event.Event, ...] = ()    # delivered to the scene's handle_event
+
+
+class LiveInput:
+    """Reads the keyboard and mouse. Events arrive through the main loop instead."""
+    def poll(self, scene) -> InputFrame:
+        return InputFrame(pg.key.get_pressed(), pg.mouse.get_pressed(), pg.mouse.get_pos())
+
+
+class ScriptedInput:
+    """Input from a function of (tick, scene), e.g. a test script or a bot policy."""
+    def __init__(self, fn: Callable[[int, object], InputFrame]) -> None:
+        self.fn = fn
+        self.tick = 0
+
+    def poll(self, scene) -> InputFrame:
+        frame = self.fn(self.tick, scene)
+        self.tick += 1
+        return frame
+
+
+IDLE = InputFrame()
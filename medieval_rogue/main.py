@@ -1,6 +1,5 @@
 from __future__ import annotations
 import pygame as pg
-import random
 from medieval_rogue import settings as S
 from medieval_rogue.scene_manager import SceneManager
 from medieval_rogue.scenes.menu import Menu
@@ -9,9 +8,46 @@ from medieval_rogue.scenes.run import RunScene
 from medieval_rogue.scenes.game_over import GameOver
 from medieval_rogue.scenes.highscores import HighScores
 from medieval_rogue.scenes.victory import Victory
+from medieval_rogue.ui.text import CachedFont
+from medieval_rogue.profiler import PROFILER
+from medieval_rogue import trace, memory
+from medieval_rogue.trace import span, traced
+from medieval_rogue.ui.profiler_overlay import ProfilerOverlay
 import medieval_rogue.entities
 
 
+BG_COLOR = (24, 20, 28)
+
+
+@traced
+def _present(window: pg.Surface, screen: pg.Surface, rects: list[pg.Rect] | None = None) -> None:
+    """Scale the low-res screen onto the window; only `rects` (screen space) if given."""
+    if rects is None:
+        if S.SMOOTH_SCALE:
+            scaled = pg.transform.smoothscale(screen, window.get_size())
+        else:
+            scaled = pg.transform.scale(screen, window.get_size())
+        window.blit(scaled, (0, 0))
+        pg.display.flip()
+        return
+
+    sw, sh = screen.get_size()
+    ww, wh = window.get_size()
+    out = []
+    for r in rects:
+        if (ww, wh) == (sw, sh):
+            window.blit(screen, r, r)
+            out.append(r)
+            continue
+        dst = pg.Rect(r.x * ww // sw, r.y * wh // sh,
+                      (r.right * ww // sw) - (r.x * ww // sw), (r.bottom * wh // sh) - (r.y * wh // sh))
+        src = screen.subsurface(r)
+        scale = pg.transform.smoothscale if S.SMOOTH_SCALE else pg.transform.scale
+        window.blit(scale(src, dst.size), dst)
+        out.append(dst)
+    pg.display.update(out)
+
+
 def run() -> None:
     pg.init()
     pg.display.set_caption("Medieval Rogue")
@@ -21,17 +57,16 @@ def run() -> None:
     # Low-res render target for crisp pixels
     screen = pg.Surface((S.BASE_W, S.BASE_H))
     
-    random.seed(S.RANDOM_SEED)
-    
     class App: pass
     app = App()
     app.window = window
     app.screen = screen
     app.clock = clock
     app.running = True
-    app.font = pg.font.Font(None, 48)
-    app.font_big = pg.font.Font(None, 72)
-    app.font_small = pg.font.Font(None, 42)
+    app.seed = S.RANDOM_SEED    # None: every run rolls (and records) its own seed
+    app.font = CachedFont(pg.font.Font(None, 48))
+    app.font_big = CachedFont(pg.font.Font(None, 72))
+    app.font_small = CachedFont(pg.font.Font(None, 42))
     
     
     sm = SceneManager(app)
@@ -43,17 +78,73 @@ def run() -> None:
     sm.register("victory", Victory)
     sm.switch("menu")
     
+    overlay = ProfilerOverlay(PROFILER)
+    prof_key = pg.key.key_code(S.PROFILER_KEY)
+    export_key = pg.key.key_code(S.PROFILER_EXPORT_KEY)
+    trace_key = pg.key.key_code(S.TRACE_DUMP_KEY)
+
+    step = 1.0 / S.SIM_HZ
+    lag = 0.0
     while app.running:
-        dt = clock.tick(S.FPS) / 1000.0
-        for e in pg.event.get():
-            if e.type == pg.QUIT: app.running = False
-            sm.handle_event(e)
-        sm.update(dt)
-        screen.fill((24, 20, 28))
-        sm.draw(screen)
-        if S.SMOOTH_SCALE:
-            scaled = pg.transform.smoothscale(screen, window.get_size())
-        else:
-            scaled = pg.transform.scale(screen, window.get_size())
-        window.blit(scaled, (0, 0))
-        pg.display.flip()
+        lag += clock.tick(S.FPS) / 1000.0
+        with span("frame"):
+            PROFILER.start()
+            for e in pg.event.get():
+                if e.type == pg.QUIT: app.running = False
+                if e.type in (pg.WINDOWEXPOSED, pg.WINDOWRESTORED) and sm.current is not None:
+                    sm.current.mark_dirty()     # retained scenes only redraw what they marked
+                if e.type == pg.KEYDOWN and e.key == prof_key:
+                    PROFILER.toggle()
+                    if sm.current is not None: sm.current.mark_dirty()
+                elif e.type == pg.KEYDOWN and e.key == export_key and PROFILER.enabled:
+                    overlay.flash(f"saved {PROFILER.export_csv()}")
+                elif e.type == pg.KEYDOWN and e.key == trace_key and trace.TRACER is not None:
+                    print(f"trace written to {trace.dump()}")
+                sm.handle_event(e)
+            PROFILER.lap("events")
+            # fixed-timestep simulation; past MAX_SIM_STEPS the backlog is dropped
+            steps = 0
+            with span("sim"):
+                while lag >= step and steps < S.MAX_SIM_STEPS:
+                    sm.update(step)
+                    lag -= step
+                    steps += 1
+            if lag >= step:
+                lag %= step
+            PROFILER.lap("update")
+            alpha = lag / step
+            scene = sm.current
+            if scene is not None and scene.retained:
+                # redraw and present only what the scene marked as changed
+                if PROFILER.enabled and overlay.rect is not None:
+                    scene.mark_dirty(overlay.rect)      # the graph changes every frame
+                rects = scene.take_dirty(screen.get_rect())
+                if not rects:
+                    PROFILER.end_frame()
+                    continue
+                for r in rects:
+                    screen.set_clip(r)
+                    screen.fill(BG_COLOR)
+                    sm.draw(screen, alpha)
+                screen.set_clip(None)
+                PROFILER.lap("draw")
+                if PROFILER.enabled:
+                    panel = overlay.draw(screen)
+                    if panel not in rects:
+                        rects.append(panel)
+                    PROFILER.lap("overlay")
+                _present(window, screen, rects)
+            else:
+                screen.fill(BG_COLOR)
+                sm.draw(screen, alpha)
+                PROFILER.lap("draw")
+                if PROFILER.enabled:
+                    overlay.draw(screen)
+                    PROFILER.lap("overlay")
+                _present(window, screen)
+            PROFILER.lap("present")
+            PROFILER.end_frame()
+    if trace.TRACER is not None:
+        print(f"trace written to {trace.dump()}")
+    if memory.TELEMETRY is not None:
+        print(memory.TELEMETRY.report())
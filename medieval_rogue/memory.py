@@ -0,0 +1,235 @@
+"""
+Memory telemetry: live pygame Surfaces per module cache and per scene owner,
+plus tracemalloc snapshots of the Python heap at floor boundaries.
+
+Surface pixels come from SDL's allocator, so tracemalloc never sees them;
+the census walks the known caches and the scene's objects instead and sums
+pitch * height for every distinct Surface (subsurfaces count, but their
+pixels belong to the parent). Per owner, "private" is what is not also held
+by a module cache: per-instance copies that grow with entity count show up
+there.
+
+Telemetry is on with S.MEMORY_TELEMETRY or MEDIEVAL_ROGUE_MEMORY=1. RunScene
+then marks the start of every floor and the run's end, and the game prints
+the diff report on exit. For a scripted 3-floor run:
+
+    python -m medieval_rogue.memory --seed 7 --frames 30
+"""
+from __future__ import annotations
+import argparse, importlib, os, tracemalloc
+from dataclasses import dataclass, field
+import pygame as pg
+from medieval_rogue import settings as S
+
+ENABLED = bool(S.MEMORY_TELEMETRY or os.environ.get("MEDIEVAL_ROGUE_MEMORY", "") not in ("", "0"))
+
+# (label, module, attribute) of every module-level surface cache
+CACHES: list[tuple[str, str, str]] = [
+    ("images", "assets.sprite_manager", "_cache"),
+    ("atlas pages", "assets.sprite_manager", "_atlas_pages"),
+    ("clips", "assets.sprite_manager", "_clips"),
+    ("light sprites", "medieval_rogue.ui.lighting", "_LIGHT_SPRITES"),
+    ("lightmap", "medieval_rogue.ui.lighting", "_LIGHTMAP"),
+    ("edge fade masks", "medieval_rogue.ui.edge_fade", "_MASKS"),
+    ("projectile banks", "medieval_rogue.entities.projectile", "_ROTATION_BANKS"),
+    ("projectile sprites", "medieval_rogue.entities.projectile", "_SPRITES"),
+    ("projectile styles", "medieval_rogue.entities.projectile_field", "_STYLES"),
+    ("floor tiles", "medieval_rogue.dungeon.room", "_FLOOR"),
+    ("wall tiles", "medieval_rogue.dungeon.room", "_WALLS"),
+    ("obstacle tiles", "medieval_rogue.dungeon.room", "_OBS"),
+    ("doors", "medieval_rogue.dungeon.room", "_DOOR"),
+    ("scaled doors", "medieval_rogue.dungeon.room", "_DOOR_SCALED"),
+    ("text", "medieval_rogue.ui.text", "TEXT_CACHE"),
+]
+
+# RunScene attributes reported as owners; a Surface is credited to the first owner that reaches it
+OWNERS: list[tuple[str, str]] = [
+    ("rooms", "rooms"), ("room lightmap", "lightmap"), ("player", "player"), ("enemies", "enemies"),
+    ("boss", "boss"), ("item", "item_pickup"), ("minimap", "minimap"),
+]
+
+_LEAVES = (str, bytes, int, float, bool, type(None), pg.Rect, pg.FRect, pg.Color, pg.Vector2, pg.font.Font)
+
+
+def surface_bytes(s: pg.Surface) -> int:
+    """Pixel bytes owned by `s`: 0 for a subsurface, whose pixels live in its parent."""
+    return 0 if s.get_parent() is not None else s.get_pitch() * s.get_height()
+
+
+def find_surfaces(obj, out: dict[int, pg.Surface], seen: set[int], depth: int = 8) -> None:
+    """Collect Surfaces reachable from obj through containers, __dict__ and __slots__."""
+    if isinstance(obj, _LEAVES) or id(obj) in seen or depth < 0:
+        return
+    seen.add(id(obj))
+    if isinstance(obj, pg.Surface):
+        out[id(obj)] = obj
+        return
+    if isinstance(obj, dict):
+        children = obj.values()
+    elif isinstance(obj, (list, tuple, set, frozenset)) or type(obj).__name__ == "deque":
+        children = obj
+    elif isinstance(obj, type) or callable(obj) or not hasattr(obj, "__class__"):
+        return
+    else:
+        children = list(getattr(obj, "__dict__", {}).values())
+        for klass in type(obj).__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                if hasattr(obj, name):
+                    children.append(getattr(obj, name))
+    for child in children:
+        find_surfaces(child, out, seen, depth - 1)
+
+
+@dataclass
+class Usage:
+    count: int = 0
+    bytes: int = 0
+    private: int = 0    # owners only: bytes not held by any module cache
+
+
+def _usage(surfs: dict[int, pg.Surface], cached: dict[int, pg.Surface] | None = None) -> Usage:
+    u = Usage(len(surfs))
+    for i, s in surfs.items():
+        b = surface_bytes(s)
+        u.bytes += b
+        if cached is not None and i not in cached:
+            u.private += b
+    return u
+
+
+@dataclass
+class Census:
+    caches: dict[str, Usage] = field(default_factory=dict)
+    owners: dict[str, Usage] = field(default_factory=dict)
+    total: Usage = field(default_factory=Usage)
+
+
+def census(scene=None) -> Census:
+    """Surface usage per module cache and, given a RunScene, per owner."""
+    out = Census()
+    everything: dict[int, pg.Surface] = {}
+    cached: dict[int, pg.Surface] = {}
+    for label, module, attr in CACHES:
+        surfs: dict[int, pg.Surface] = {}
+        find_surfaces(getattr(importlib.import_module(module), attr, None), surfs, set())
+        out.caches[label] = _usage(surfs)
+        cached.update(surfs)
+    everything.update(cached)
+    if scene is not None:
+        seen: set[int] = set()
+        for label, attr in OWNERS:
+            surfs = {}
+            find_surfaces(getattr(scene, attr, None), surfs, seen)
+            out.owners[label] = _usage(surfs, cached)
+            everything.update(surfs)
+    out.total = _usage(everything)
+    return out
+
+
+@dataclass
+class Mark:
+    label: str
+    census: Census
+    snapshot: tracemalloc.Snapshot | None
+
+
+def _kib(n: int) -> str:
+    return f"{n / 1024:,.1f} KiB"
+
+
+def _signed_kib(n: int) -> str:
+    return f"{'+' if n >= 0 else '-'}{abs(n) / 1024:,.1f} KiB"
+
+
+class MemoryTelemetry:
+    def __init__(self, frames: int = S.MEMORY_TRACE_FRAMES) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        self.marks: list[Mark] = []
+
+    def reset(self) -> None:
+        self.marks.clear()
+
+    def mark(self, label: str, scene=None) -> Mark:
+        snap = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),       # the census itself
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+        m = Mark(label, census(scene), snap)
+        self.marks.append(m)
+        return m
+
+    def diff(self, a: Mark, b: Mark, top: int = S.MEMORY_TOP) -> str:
+        lines = [f"memory: {a.label} -> {b.label}"]
+        if a.snapshot is not None and b.snapshot is not None:
+            stats = b.snapshot.compare_to(a.snapshot, "lineno")
+            grown = sum(s.size_diff for s in stats)
+            lines.append(f"  python heap {_signed_kib(grown)} (now {_kib(sum(s.size for s in stats))})")
+            for s in stats[:top]:
+                if s.size_diff == 0:
+                    break
+                f = s.traceback[0]
+                lines.append(f"    {_signed_kib(s.size_diff):>14} {s.count_diff:+7d} blocks  "
+                             f"{os.path.relpath(f.filename) if os.path.isabs(f.filename) else f.filename}:{f.lineno}")
+        lines.append(f"  {'surfaces':<22}{'count':>8}{'bytes':>16}{'growth':>16}{'private':>16}")
+        rows = [("cache", k, v, a.census.caches.get(k, Usage())) for k, v in b.census.caches.items()]
+        rows += [("owner", k, v, a.census.owners.get(k, Usage())) for k, v in b.census.owners.items()]
+        rows.append(("", "total", b.census.total, a.census.total))
+        for kind, name, now, before in rows:
+            if not now.count and not before.count:
+                continue
+            private = _kib(now.private) if kind == "owner" else ""
+            lines.append(f"  {name:<22}{now.count:>8}{_kib(now.bytes):>16}{_signed_kib(now.bytes - before.bytes):>16}{private:>16}")
+        return "\n".join(lines)
+
+    def report(self, top: int = S.MEMORY_TOP) -> str:
+        """Diffs between consecutive marks, then first to last."""
+        if len(self.marks) < 2:
+            return "memory: fewer than two marks, nothing to compare"
+        parts = [self.diff(a, b, top) for a, b in zip(self.marks, self.marks[1:])]
+        if len(self.marks) > 2:
+            parts.append(self.diff(self.marks[0], self.marks[-1], top))
+        return "\n\n".join(parts)
+
+
+TELEMETRY: MemoryTelemetry | None = MemoryTelemetry() if ENABLED else None
+
+
+def tour(seed: int = 1, frames: int = 30, cls: str = "archer") -> MemoryTelemetry:
+    """Walk every room of every floor with an invulnerable, idle player, drawing `frames` frames per room."""
+    global TELEMETRY
+    from medieval_rogue.headless import make_scene
+    if TELEMETRY is None:
+        TELEMETRY = MemoryTelemetry()
+    scene = make_scene(cls=cls, seed=seed, render=True)    # marks "floor 1"
+    screen = pg.Surface((S.BASE_W, S.BASE_H))
+    dt = 1.0 / S.SIM_HZ
+    while scene.next_scene is None:
+        for gp in list(scene.rooms):
+            scene._enter_room(gp, None)
+            scene.entry_freeze = 0.0
+            for _ in range(frames):
+                scene.player.invuln_timer = 1e9
+                scene.update(dt)
+                scene.draw(screen)
+        scene._advance_floor()
+    return TELEMETRY
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Report surface and heap growth across a full run, floor by floor.")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--frames", type=int, default=30, help="frames simulated and drawn in each room")
+    ap.add_argument("--cls", default="archer")
+    ap.add_argument("--top", type=int, default=S.MEMORY_TOP, help="heap lines per diff")
+    args = ap.parse_args()
+    from medieval_rogue.headless import init_headless
+    from medieval_rogue.memory import tour     # under -m this file is __main__; RunScene reads the package module
+    init_headless()
+    print(tour(args.seed, args.frames, args.cls).report(args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Frame profiler behind the in-game overlay (S.PROFILER_KEY toggles it,
+S.PROFILER_EXPORT_KEY writes the last PROFILER_HISTORY_SEC seconds to CSV).
+
+Code marks phase boundaries with PROFILER.lap("phase"): the time since the
+previous lap is added to that phase for the current frame, and the main loop
+closes each frame with end_frame(). While disabled, lap() and count() return
+at once, so the hooks can stay in hot paths.
+"""
+from __future__ import annotations
+import csv, os, time
+from collections import deque
+from medieval_rogue import settings as S
+
+_clock = time.perf_counter
+
+
+class FrameProfiler:
+    def __init__(self, history_sec: float = S.PROFILER_HISTORY_SEC) -> None:
+        self.enabled = False
+        self.history_sec = history_sec
+        # one row per frame: (end time, frame ms, {phase: ms}, {counter: value})
+        self.frames: deque[tuple[float, float, dict[str, float], dict[str, int]]] = deque(
+            maxlen=int(history_sec * max(S.FPS, S.SIM_HZ)) + 1)
+        self.phases: list[str] = []     # in order of first appearance
+        self._acc: dict[str, float] = {}
+        self._counts: dict[str, int] = {}
+        self._t = 0.0
+        self._frame_t: float | None = None
+
+    def toggle(self) -> bool:
+        self.enabled = not self.enabled
+        self._acc, self._counts, self._frame_t = {}, {}, None
+        self._t = _clock()
+        return self.enabled
+
+    def start(self) -> None:
+        """Start timing from now; the next lap() measures from here."""
+        if self.enabled:
+            self._t = _clock()
+
+    def lap(self, phase: str) -> None:
+        if not self.enabled:
+            return
+        t = _clock()
+        acc = self._acc
+        if phase in acc:
+            acc[phase] += (t - self._t) * 1000.0
+        else:
+            acc[phase] = (t - self._t) * 1000.0
+            if phase not in self.phases:
+                self.phases.append(phase)
+        self._t = t
+
+    def count(self, name: str, value: int) -> None:
+        if self.enabled:
+            self._counts[name] = value
+
+    def end_frame(self) -> None:
+        if not self.enabled:
+            return
+        now = _clock()
+        frame_ms = (now - self._frame_t) * 1000.0 if self._frame_t is not None else 0.0
+        self._frame_t = now
+        self.frames.append((now, frame_ms, self._acc, self._counts))
+        self._acc, self._counts = {}, {}
+        self._t = now
+
+    def recent(self, seconds: float) -> list[tuple[float, float, dict[str, float], dict[str, int]]]:
+        if not self.frames:
+            return []
+        cutoff = self.frames[-1][0] - seconds
+        out = []
+        for row in reversed(self.frames):
+            if row[0] < cutoff:
+                break
+            out.append(row)
+        out.reverse()
+        return out
+
+    def stats(self, seconds: float = 2.0) -> dict[str, tuple[float, float, float]]:
+        """(mean, p95, max) in ms per phase over the last `seconds`, plus "frame"; a phase missing from a frame counts as 0."""
+        rows = self.recent(seconds)
+        if not rows:
+            return {}
+        out = {}
+        for name in ["frame", *self.phases]:
+            vals = sorted(r[1] if name == "frame" else r[2].get(name, 0.0) for r in rows)
+            n = len(vals)
+            out[name] = (sum(vals) / n, vals[min(n - 1, int(n * 0.95))], vals[-1])
+        return out
+
+    def counts(self) -> dict[str, int]:
+        return dict(self.frames[-1][3]) if self.frames else {}
+
+    def export_csv(self, path: str | None = None, seconds: float | None = None) -> str:
+        """Write the last `seconds` (default: the whole history) one frame per row; returns the path."""
+        if path is None:
+            os.makedirs(S.PROFILER_EXPORT_DIR, exist_ok=True)
+            path = os.path.join(S.PROFILER_EXPORT_DIR, f"profile-{time.strftime('%Y%m%d-%H%M%S')}.csv")
+        rows = self.recent(self.history_sec if seconds is None else seconds)
+        counters = sorted({k for r in rows for k in r[3]})
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["t", "frame_ms", *self.phases, *counters])
+            t0 = rows[0][0] if rows else 0.0
+            for t, frame_ms, acc, cnt in rows:
+                w.writerow([f"{t - t0:.4f}", f"{frame_ms:.3f}",
+                            *(f"{acc.get(p, 0.0):.3f}" for p in self.phases),
+                            *(cnt.get(c, "") for c in counters)])
+        return path
+
+
+PROFILER = FrameProfiler()
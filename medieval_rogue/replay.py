@@ -0,0 +1,195 @@
+"""
+Input recording and replay. A recording holds the run seed and every input
+RunScene.update consumed, one fixed-width record per sim step, so a run
+(and any frame-time spike in it) replays exactly:
+
+    python -m medieval_rogue.replay run.mrr             # headless, full speed
+    python -m medieval_rogue.replay run.mrr --render    # in a window, uncapped
+    python -m medieval_rogue.replay run.mrr --profile   # under cProfile
+
+Set S.RECORD_INPUT_DIR to record every run played in the game.
+
+File layout (little endian): header, then `ticks` TICK records, then
+`events` EVENT records. The mouse is stored as a per-tick delta of the
+screen position the scene converts to world space with its own (replayed)
+camera, which keeps it exact in 2 bytes per axis. Both tables are
+fixed-width, so they load straight from np.memmap.
+"""
+from __future__ import annotations
+import argparse, os, struct, time
+import numpy as np
+import pygame as pg
+from medieval_rogue import settings as S
+from medieval_rogue.input_source import InputFrame, KeySet
+from medieval_rogue import trace
+
+MAGIC = b"MRREPLAY"
+VERSION = 1
+# magic, version, sim_hz, seed, ticks, events, player class id
+HEADER = struct.Struct("<8sHHqII16s")
+TICK = np.dtype([("keys", "<u2"), ("buttons", "u1"), ("events", "u1"), ("dx", "<i2"), ("dy", "<i2")])
+EVENT = np.dtype([("tick", "<u4"), ("type", "u1"), ("code", "<i4")])
+
+# Keys RunScene reads from the key state; bit i of TICK.keys is TRACKED_KEYS[i].
+TRACKED_KEYS = (pg.K_w, pg.K_a, pg.K_s, pg.K_d, pg.K_UP, pg.K_LEFT, pg.K_DOWN, pg.K_RIGHT)
+# Events RunScene.handle_event acts on, stored as (type tag, key or button).
+_EV_KEYDOWN, _EV_MOUSEDOWN = 1, 2
+
+
+class InputRecorder:
+    """Collects what RunScene consumes; RunScene calls event() and frame() from its update."""
+    def __init__(self, seed: int, cls: str = "archer") -> None:
+        self.seed = seed
+        self.cls = cls
+        self._ticks: list[tuple[int, int, int, int, int]] = []
+        self._events: list[tuple[int, int, int]] = []
+        self._pending = 0
+        self._last = (0, 0)
+
+    def __len__(self) -> int:
+        return len(self._ticks)
+
+    def event(self, e: pg.event.Event) -> None:
+        if e.type == pg.KEYDOWN:
+            self._events.append((len(self._ticks), _EV_KEYDOWN, e.key))
+        elif e.type == pg.MOUSEBUTTONDOWN:
+            self._events.append((len(self._ticks), _EV_MOUSEDOWN, e.button))
+        else:
+            return
+        self._pending += 1
+
+    def frame(self, frame: InputFrame) -> None:
+        keys = frame.keys
+        mask = 0
+        for bit, k in enumerate(TRACKED_KEYS):
+            if keys[k]:
+                mask |= 1 << bit
+        mb = frame.mouse_buttons
+        buttons = (1 if mb[0] else 0) | (2 if mb[1] else 0) | (4 if mb[2] else 0)
+        x, y = int(frame.mouse_pos[0]), int(frame.mouse_pos[1])
+        self._ticks.append((mask, buttons, min(self._pending, 255), x - self._last[0], y - self._last[1]))
+        self._last = (x, y)
+        self._pending = 0
+
+    def save(self, path: str) -> None:
+        ticks = np.array(self._ticks, dtype=TICK)
+        events = np.array(self._events, dtype=EVENT)
+        cls = self.cls.encode()[:16]
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, S.SIM_HZ, self.seed, len(ticks), len(events), cls))
+            f.write(ticks.tobytes())
+            f.write(events.tobytes())
+
+
+class Replay:
+    """A recording mapped from disk."""
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            head = f.read(HEADER.size)
+        magic, version, self.sim_hz, self.seed, n_ticks, n_events, cls = HEADER.unpack(head)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a replay file (or unsupported version)")
+        self.cls = cls.rstrip(b"\0").decode()
+        self.ticks = np.memmap(path, TICK, "r", HEADER.size, (n_ticks,)) if n_ticks else np.zeros(0, TICK)
+        off = HEADER.size + n_ticks * TICK.itemsize
+        self.events = np.memmap(path, EVENT, "r", off, (n_events,)) if n_events else np.zeros(0, EVENT)
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+
+class ReplayInput:
+    """Input source feeding a Replay back one tick per poll; idle once it runs out."""
+    def __init__(self, replay: Replay) -> None:
+        self.replay = replay
+        t = replay.ticks
+        self._mx = np.cumsum(t["dx"], dtype=np.int64).tolist()
+        self._my = np.cumsum(t["dy"], dtype=np.int64).tolist()
+        self._keys = t["keys"].tolist()
+        self._buttons = t["buttons"].tolist()
+        self._keysets = {}
+        self._events: dict[int, list[pg.event.Event]] = {}
+        for tick, kind, code in replay.events.tolist():
+            if kind == _EV_KEYDOWN:
+                e = pg.event.Event(pg.KEYDOWN, key=code, mod=0, unicode="", scancode=0)
+            else:
+                e = pg.event.Event(pg.MOUSEBUTTONDOWN, button=code, pos=(0, 0))
+            self._events.setdefault(tick, []).append(e)
+        self.tick = 0
+
+    def poll(self, scene) -> InputFrame:
+        i = self.tick
+        self.tick += 1
+        if i >= len(self._keys):
+            return InputFrame()
+        mask = self._keys[i]
+        keys = self._keysets.get(mask)
+        if keys is None:
+            keys = self._keysets[mask] = KeySet(k for bit, k in enumerate(TRACKED_KEYS) if mask >> bit & 1)
+        b = self._buttons[i]
+        return InputFrame(keys, (bool(b & 1), bool(b & 2), bool(b & 4)), (self._mx[i], self._my[i]),
+                          tuple(self._events.get(i, ())))
+
+
+def recording_path(seed: int, folder: str | None = None) -> str:
+    folder = folder or S.RECORD_INPUT_DIR
+    os.makedirs(folder, exist_ok=True)
+    return os.path.join(folder, f"run-{time.strftime('%Y%m%d-%H%M%S')}-{seed}.mrr")
+
+
+def play_back(replay: Replay, render: bool = False) -> tuple[object, list[float]]:
+    """Run a replay at full speed; returns the scene and per-tick update times in ms."""
+    from medieval_rogue.headless import make_scene, init_headless
+    if replay.sim_hz != S.SIM_HZ:
+        raise ValueError(f"recorded at {replay.sim_hz} Hz, game runs at {S.SIM_HZ} Hz")
+    window = screen = None
+    if render:
+        pg.init()
+        window = pg.display.set_mode((S.BASE_W * S.SCALE, S.BASE_H * S.SCALE))
+        screen = pg.Surface((S.BASE_W, S.BASE_H))
+    else:
+        init_headless()
+    scene = make_scene(ReplayInput(replay), replay.cls, replay.seed, render=render)
+    dt = 1.0 / S.SIM_HZ
+    times = []
+    clock = time.perf_counter
+    for _ in range(len(replay)):
+        t0 = clock()
+        scene.update(dt)
+        times.append((clock() - t0) * 1000.0)
+        if render:
+            pg.event.pump()
+            screen.fill((24, 20, 28))
+            scene.draw(screen)
+            pg.transform.scale(screen, window.get_size(), window)
+            pg.display.flip()
+        if scene.next_scene:
+            break
+    return scene, times
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Replay a recorded run.")
+    ap.add_argument("path")
+    ap.add_argument("--render", action="store_true", help="draw every tick in a window")
+    ap.add_argument("--profile", action="store_true", help="run under cProfile and print the top functions")
+    args = ap.parse_args()
+    rep = Replay(args.path)
+    if args.profile:
+        import cProfile, pstats
+        prof = cProfile.Profile()
+        scene, times = prof.runcall(play_back, rep, args.render)
+        pstats.Stats(prof).sort_stats("cumulative").print_stats(25)
+    else:
+        scene, times = play_back(rep, args.render)
+    total = sum(times)
+    worst = sorted(range(len(times)), key=times.__getitem__, reverse=True)[:5]
+    print(f"seed={rep.seed} cls={rep.cls} {len(times)}/{len(rep)} ticks, update {total:.0f} ms "
+          f"(mean {total / max(1, len(times)):.3f} ms), outcome={scene.next_scene} score={int(scene.score)}")
+    print("slowest ticks: " + ", ".join(f"#{i} {times[i]:.2f} ms" for i in worst))
+    if trace.TRACER is not None:
+        print(f"trace written to {trace.dump()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Run-level random numbers. Each run owns one RunRng with independent, named
+substreams, so the same seed replays the same run and e.g. extra cosmetic
+rolls never shift enemy AI or loot:
+
+    generation - floor layouts, spawn patterns, boss order
+    ai         - enemy/boss behaviour
+    loot       - item drops
+    cosmetic   - torches and other visuals that don't touch the sim
+
+Entities reach the active run through current(); scenes start a run with begin_run().
+"""
+from __future__ import annotations
+import hashlib, random
+from medieval_rogue import settings as S
+
+STREAMS = ("generation", "ai", "loot", "cosmetic")
+
+
+def derive_seed(seed: int, *parts: object) -> int:
+    """64-bit seed for (seed, *parts); stable across processes and Python versions."""
+    key = ":".join(str(p) for p in (seed, *parts)).encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+class RunRng:
+    __slots__ = ("seed",) + STREAMS
+
+    def __init__(self, seed: int | None = None) -> None:
+        if seed is None:
+            seed = random.SystemRandom().randrange(1 << 63)
+        self.seed = int(seed)
+        for name in STREAMS:
+            setattr(self, name, random.Random(derive_seed(self.seed, name)))
+
+    def fork(self, name: str, *parts: object) -> random.Random:
+        """
+        A fresh stream keyed by a stream name and extra parts (floor, room...).
+        Its rolls don't depend on how much any other stream has been used.
+        """
+        return random.Random(derive_seed(self.seed, name, *parts))
+
+
+_current = RunRng(S.RANDOM_SEED)
+
+
+def current() -> RunRng:
+    return _current
+
+
+def begin_run(seed: int | None = None) -> RunRng:
+    """Make a new RunRng the active one; seed None picks a random (recorded) seed."""
+    global _current
+    _current = RunRng(seed)
+    return _current
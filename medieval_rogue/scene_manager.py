@@ -1,12 +1,35 @@
 from __future__ import annotations
 import pygame as pg
-from typing import Optional, Dict, Type
+from typing import Optional, Dict, Type, List
 
 
 class Scene:
+    # Retained scenes are only re-rendered and presented where marked dirty.
+    retained: bool = False
+
     def __init__(self, app: 'App') -> None:
         self.app = app
         self.next_scene: Optional[str] = None
+        self.alpha = 1.0    # render interpolation between the previous and current sim step
+        self._dirty: List[pg.Rect] = []
+        self._dirty_all = True
+
+    def mark_dirty(self, rect: Optional[pg.Rect] = None) -> None:
+        """Mark a screen region for redraw (None = whole screen)."""
+        if rect is None:
+            self._dirty_all = True
+        else:
+            self._dirty.append(pg.Rect(rect))
+
+    def take_dirty(self, bounds: pg.Rect) -> List[pg.Rect]:
+        """Return and clear the dirty regions, clipped to bounds."""
+        if self._dirty_all:
+            rects = [pg.Rect(bounds)]
+        else:
+            rects = [r.clip(bounds) for r in self._dirty if r.colliderect(bounds)]
+        self._dirty.clear()
+        self._dirty_all = False
+        return rects
         
     def handle_event(self, e: pg.event.Event) -> None: ...
     
@@ -36,5 +59,7 @@ class SceneManager:
             if self.current.next_scene:
                 self.switch(self.current.next_scene)
                 
-    def draw(self, surf: pg.Surface) -> None:
-        if self.current: self.current.draw(surf)
+    def draw(self, surf: pg.Surface, alpha: float = 1.0) -> None:
+        if self.current:
+            self.current.alpha = alpha
+            self.current.draw(surf)
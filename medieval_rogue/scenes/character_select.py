@@ -5,13 +5,17 @@ from medieval_rogue.scene_manager import Scene
 from medieval_rogue.entities.player_classes import PLAYER_CLASSES
 from assets.sprite_manager import AnimatedSprite, load_strip
 from medieval_rogue.utils import resource_path
+from medieval_rogue.ui.text import TEXT_CACHE
 import os
 
 class CharacterSelect(Scene):
+    retained = True
+
     def __init__(self, app) -> None:
         super().__init__(app)
         self.options = list(PLAYER_CLASSES.values())
         self.index = 0
+        self._preview_rect: pg.Rect | None = None
 
         self.preview_map = {}
         self.preview_frame_size = (64, 64)
@@ -32,8 +36,10 @@ class CharacterSelect(Scene):
         if e.type == pg.KEYDOWN:
             if e.key in (pg.K_LEFT, pg.K_a):
                 self.index = (self.index - 1) % len(self.options)
+                self.mark_dirty()
             elif e.key in (pg.K_RIGHT, pg.K_d):
                 self.index = (self.index + 1) % len(self.options)
+                self.mark_dirty()
             elif e.key in (pg.K_RETURN, pg.K_SPACE):
                 self.app.chosen_class = self.options[self.index]
                 self.next_scene = "run"
@@ -46,7 +52,10 @@ class CharacterSelect(Scene):
         sprite_id = getattr(hero, "sprite_id", "archer")
         anim = self.preview_map.get(sprite_id)
         if anim:
+            prev = anim.idx
             anim.update(dt)
+            if anim.idx != prev and self._preview_rect is not None:
+                self.mark_dirty(self._preview_rect)
 
     def _draw_arrow(self, surf: pg.Surface, center_x: int, center_y: int, left: bool = True):
         size = 18
@@ -135,26 +144,13 @@ class CharacterSelect(Scene):
             draw_x = preview_area_x
             draw_y = card_y + card_h - 8  # bottom of card for 'bottom' anchor
             anim.draw(surf, draw_x, draw_y, camera=None, scale=scale, flip_x=False)
+            pw, ph = frame_w * scale, frame_h * scale
+            self._preview_rect = pg.Rect(draw_x - pw // 2, draw_y - ph, pw, ph)
         else:
             # fallback: draw placeholder rectangle
             placeholder = self.app.font_small.render("No sprite", True, (200,200,200))
             surf.blit(placeholder, (preview_area_x - placeholder.get_width()//2, preview_area_y))
 
     def _wrap_text(self, text: str, font: pg.font.Font, max_width: int) -> list[str]:
-        """Utility: simple word wrap for small blocks."""
-        if not text:
-            return []
-        words = text.split(" ")
-        lines = []
-        cur = ""
-        for w in words:
-            test = (cur + " " + w).strip()
-            if font.size(test)[0] <= max_width:
-                cur = test
-            else:
-                if cur:
-                    lines.append(cur)
-                cur = w
-        if cur:
-            lines.append(cur)
-        return lines
\ No newline at end of file
+        """Utility: simple word wrap for small blocks (memoized in the shared text cache)."""
+        return TEXT_CACHE.wrap(font, text, max_width)
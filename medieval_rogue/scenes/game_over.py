@@ -4,9 +4,16 @@ from medieval_rogue import settings as S
 from medieval_rogue.scene_manager import Scene
 from medieval_rogue.save.save import save_highscore
 
+# layout, shared by draw() and the dirty rects
+TITLE_Y = 72
+SCORE_Y = 180
+NAME_Y = 234
+
 
 # Placeholder for now
 class GameOver(Scene):
+    retained = True
+
     def __init__(self, app) -> None:
         super().__init__(app)
         self.saved = False
@@ -14,6 +21,8 @@ class GameOver(Scene):
 
     def handle_event(self, e: pg.event.Event) -> None:
         if e.type == pg.KEYDOWN:
+            # the name line is the only thing a key press can change
+            self.mark_dirty(pg.Rect(0, NAME_Y, self.app.screen.get_width(), self.app.font.get_linesize()))
             if not self.saved and e.unicode and e.key not in (pg.K_RETURN, pg.K_ESCAPE, pg.K_BACKSPACE):
                 if len(self.name) < 16 and e.unicode.isprintable():
                     self.name += e.unicode.upper()
@@ -30,8 +39,8 @@ class GameOver(Scene):
     def draw(self, surf: pg.Surface) -> None:
         w, h = surf.get_size()
         title = self.app.font_big.render("Game Over", True, S.RED)
-        surf.blit(title, (w//2 - title.get_width()//2, 72))
+        surf.blit(title, (w//2 - title.get_width()//2, TITLE_Y))
         score = self.app.font.render(f"Score: {self.app.final_score}", True, S.WHITE)
-        surf.blit(score, (w//2 - score.get_width()//2, 180))
+        surf.blit(score, (w//2 - score.get_width()//2, SCORE_Y))
         name = self.app.font.render(f"Name: {self.name}", True, S.YELLOW)
-        surf.blit(name, (w//2 - name.get_width()//2, 234))
+        surf.blit(name, (w//2 - name.get_width()//2, NAME_Y))
@@ -6,6 +6,8 @@ from medieval_rogue.save.save import load_highscores
 
 
 class HighScores(Scene):
+    retained = True
+
     def handle_event(self, e: pg.event.Event) -> None:
         if e.type == pg.KEYDOWN and e.key in (pg.K_ESCAPE, pg.K_RETURN, pg.K_SPACE):
             self.next_scene = "menu"
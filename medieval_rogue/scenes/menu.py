@@ -3,8 +3,15 @@ import pygame as pg
 from medieval_rogue import settings as S
 from medieval_rogue.scene_manager import Scene
 
+# layout, shared by draw() and the dirty rects
+TITLE_Y = 50
+OPTIONS_Y = 120
+OPTION_SPACING = 54
+
 
 class Menu(Scene):
+    retained = True
+
     def __init__(self, app) -> None:
         super().__init__(app)
         self.options = [
@@ -14,10 +21,17 @@ class Menu(Scene):
         ]
         self.index = 0
     
+    def _options_rect(self) -> pg.Rect:
+        return pg.Rect(0, OPTIONS_Y, self.app.screen.get_width(), len(self.options) * OPTION_SPACING)
+
     def handle_event(self, e: pg.event.Event) -> None:
         if e.type == pg.KEYDOWN:
-            if e.key in (pg.K_DOWN, pg.K_s): self.index = (self.index + 1) % len(self.options)
-            elif e.key in (pg.K_UP, pg.K_w): self.index = (self.index - 1) % len(self.options)
+            if e.key in (pg.K_DOWN, pg.K_s):
+                self.index = (self.index + 1) % len(self.options)
+                self.mark_dirty(self._options_rect())
+            elif e.key in (pg.K_UP, pg.K_w):
+                self.index = (self.index - 1) % len(self.options)
+                self.mark_dirty(self._options_rect())
             elif e.key in (pg.K_RETURN, pg.K_SPACE):
                 label, target = self.options[self.index]
                 if target: self.next_scene = target
@@ -28,8 +42,8 @@ class Menu(Scene):
     def draw(self, surf: pg.Surface) -> None:
         w, h = surf.get_size()
         title = self.app.font_big.render("Medieval Rogue", True, S.YELLOW)
-        surf.blit(title, (w//2 - title.get_width()//2, 50))
+        surf.blit(title, (w//2 - title.get_width()//2, TITLE_Y))
         for i, (label, _) in enumerate(self.options):
             color = S.WHITE if i == self.index else S.GRAY
             txt = self.app.font.render(label, True, color)
-            surf.blit(txt, (w//2 - txt.get_width()//2, 120 + i * 54))
\ No newline at end of file
+            surf.blit(txt, (w//2 - txt.get_width()//2, OPTIONS_Y + i * OPTION_SPACING))
\ No newline at end of file
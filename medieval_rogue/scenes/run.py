@@ -1,21 +1,28 @@
 from __future__ import annotations
-import pygame as pg, random, math
+import pygame as pg, math
 from medieval_rogue import settings as S
+from medieval_rogue import rng as run_rng
+from medieval_rogue import memory
 from medieval_rogue.scene_manager import Scene
 from medieval_rogue.entities.player import Player, PlayerStats
 from medieval_rogue.entities.enemy_registry import BOSSES
-from medieval_rogue.entities.projectile import Projectile
+from medieval_rogue.entities.projectile_field import ProjectileField
 from medieval_rogue.entities.enemy_registry import create_boss, spawn_from_pattern, SPAWN_PATTERNS, pick_spawn_pattern
 from medieval_rogue.dungeon.generation import generate_floor
 from medieval_rogue.dungeon.room import Room, Direction
 from medieval_rogue.items.basic_items import get_item_by_name, ITEMS
 from medieval_rogue.ui.hud import draw_hud
-from medieval_rogue.ui.minimap import draw_minimap
+from medieval_rogue.ui.minimap import Minimap
 from assets.sound_manager import load_sounds
 from medieval_rogue.camera import Camera
+from medieval_rogue.input_source import LiveInput
+from medieval_rogue.replay import InputRecorder, recording_path
+from medieval_rogue.profiler import PROFILER
+from medieval_rogue.trace import traced
 from medieval_rogue.entities.pickups import ItemPickup
+from medieval_rogue.entities.utilities import WallGrid
 from medieval_rogue.ui.edge_fade import draw_edge_fade
-from medieval_rogue.ui.lighting import compute_torches_for_room, update_torches, draw_torches, apply_lighting
+from medieval_rogue.ui.lighting import compute_torches_for_room, update_torches, draw_torches, apply_lighting, bake_lightmap
 
 
 class RunScene(Scene):
@@ -23,6 +30,8 @@ class RunScene(Scene):
         super().__init__(app)
         self.camera = Camera()
         self.sounds = load_sounds()
+        self.input = getattr(self.app, "input", None) or LiveInput()
+        self.rng = run_rng.begin_run(getattr(self.app, "seed", S.RANDOM_SEED))
         # create player from chosen class if the character select set it on the app.
         pc = getattr(self.app, "chosen_class", None)
         if pc is not None:
@@ -37,12 +46,19 @@ class RunScene(Scene):
             stats = PlayerStats()
         self.player = Player(S.BASE_W//2, S.BASE_H//2, stats=stats, cls=pc if pc else "archer")
         self.player.sfx_shot = self.sounds.get("arrow_shot")
-        self.projectiles: list[Projectile] = []
-        self.e_projectiles: list[Projectile] = []
+        self.recorder: InputRecorder | None = None
+        self._record_path: str | None = None
+        if S.RECORD_INPUT_DIR or getattr(self.app, "record_input", False):
+            self.recorder = InputRecorder(self.rng.seed, pc.id if pc else "archer")
+            if S.RECORD_INPUT_DIR:
+                self._record_path = recording_path(self.rng.seed)
+        self.projectiles = ProjectileField()
+        self.e_projectiles = ProjectileField()
         self.enemies = []
         self.boss = None
         self.torches = []
-        self.floor = generate_floor(0)
+        self.minimap = Minimap()
+        self.floor = generate_floor(0, self.rng.fork("generation", "floor", 0))
         self.rooms: dict[tuple[int,int], Room] = self.floor.rooms
         self.current_gp = self.floor.start
         self.current_room: Room = self.rooms[self.current_gp]
@@ -62,17 +78,24 @@ class RunScene(Scene):
         self.score = 10
         self.boss_history: list[str] = []
         self.boss_pool: list[str] = list(BOSSES.keys())
-        random.shuffle(self.boss_pool)
+        self.rng.fork("generation", "bosses").shuffle(self.boss_pool)
         self.timescale = 1.0; self.hitstop_timer = 0.0; self.entry_freeze = 0.4; self.time_decay = 0.0
         self.sfx_player_hit = self.sounds["player_hit"]; self.sfx_player_hit.set_volume(0.1)
         self.sfx_arrow_shot = self.sounds["arrow_shot"]; self.sfx_arrow_shot.set_volume(0.1)
         self._enter_room(self.current_gp, from_dir=None)
+        if memory.TELEMETRY is not None:
+            memory.TELEMETRY.reset()
+            memory.TELEMETRY.mark("floor 1", self)
 
     def _neighbors_of(self, gp):
         gx, gy = gp
         return {"N": self.rooms.get((gx, gy-1)), "S": self.rooms.get((gx, gy+1)), "W": self.rooms.get((gx-1, gy)), "E": self.rooms.get((gx+1, gy))}
 
+    @traced
     def _enter_room(self, gp, from_dir: Direction | None):
+        prev = getattr(self, "current_room", None)
+        if prev is not None and prev is not self.rooms[gp]:
+            prev.invalidate_bake()  # keep only the current room's baked layers alive
         self.current_gp = gp
         self.current_room = self.rooms[gp]
         self.current_room.visited = True
@@ -80,9 +103,12 @@ class RunScene(Scene):
         for _, r in nbrs.items():
             if r: r.discovered = True
         self.current_room.compute_doors(nbrs)
+        self.minimap.invalidate()
 
         self.walls = self.current_room.wall_rects()
-        self.torches = compute_torches_for_room(self.current_room)
+        self.wall_grid = WallGrid(self.walls)
+        self.torches = compute_torches_for_room(self.current_room, self.rng.cosmetic)
+        self.lightmap = bake_lightmap(self.current_room, self.torches)
         self.enemies.clear()
         self.projectiles.clear()
         self.e_projectiles.clear()
@@ -92,6 +118,7 @@ class RunScene(Scene):
         self._place_player_on_entry(from_dir)
         self.camera.center_on(self.player.x, self.player.y)
         self.camera.clamp_to_room(self.current_room.world_rect)
+        self._snapshot()
 
         if self.current_room.kind == "combat":
             if not self.current_room.cleared:
@@ -165,23 +192,29 @@ class RunScene(Scene):
         cy = max(room_rect.top + S.BORDER + h//2, min(cy, room_rect.bottom - S.BORDER - h//2))
         return float(cx), float(cy)
 
+    @traced
     def _advance_floor(self) -> None:
         self.floor_i += 1
         self.message = ""
         if self.floor_i >= S.FLOORS:
             self.app.final_score = int(self.score)
             self.next_scene = "victory"
+            if memory.TELEMETRY is not None:
+                memory.TELEMETRY.mark("run end", self)
             return
-        self.floor = generate_floor(self.floor_i)
+        self.floor = generate_floor(self.floor_i, self.rng.fork("generation", "floor", self.floor_i))
         self.rooms = self.floor.rooms
         self.current_gp = self.floor.start
         self._enter_room(self.current_gp, from_dir=None)
         self.room_cleared = False
         self.item_picked = False
         self.boss_cleared = False
+        if memory.TELEMETRY is not None:
+            memory.TELEMETRY.mark(f"floor {self.floor_i + 1}", self)
 
+    @traced
     def _spawn_combat_wave(self) -> None:
-        rng = random.Random(S.RANDOM_SEED)
+        rng = self.rng.fork("generation", "wave", self.floor_i, *self.current_gp)
         r = self.current_room.world_rect
         name = pick_spawn_pattern(self.current_room.w_cells, self.current_room.h_cells, rng)
         spawned = spawn_from_pattern(
@@ -192,9 +225,10 @@ class RunScene(Scene):
         self.enemies.extend(spawned)
         self.message = f"Enemies: {len(self.enemies)}"
 
+    @traced
     def _spawn_item(self) -> None:
         r = self.current_room.world_rect
-        name = random.choice(ITEMS).name
+        name = self.rng.loot.choice(ITEMS).name
         preferred = (r.centerx, r.centery)
         sx, sy = self._find_free_spot(preferred, self.walls, w=16, h=16)
         self.item_pickup = ItemPickup(sx, sy, item_id=name)
@@ -214,19 +248,28 @@ class RunScene(Scene):
         # fallback 1    
         remaining = [bid for bid in BOSSES.keys() if bid not in self.boss_history]
         if remaining:
-            bid = random.choice(remaining)
+            bid = self.rng.generation.choice(remaining)
             self.boss_history.append(bid)
             return bid
         
         # fallback 2 
-        return random.choice(list(BOSSES.keys()))
+        return self.rng.generation.choice(list(BOSSES.keys()))
 
+    @traced
     def _spawn_boss_encounter(self) -> None:
         r = self.current_room.world_rect
         boss_id = self._next_boss_id()
         self.boss = create_boss(boss_id, r.centerx, r.centery)
 
+    def _save_recording(self) -> None:
+        if self.recorder is not None and self._record_path:
+            self.recorder.save(self._record_path)
+
     def handle_event(self, e: pg.event.Event) -> None:
+        if self.recorder is not None:
+            self.recorder.event(e)
+            if e.type == pg.QUIT:
+                self._save_recording()
         if e.type == pg.KEYDOWN:
             if e.key == pg.K_ESCAPE:
                 self.next_scene = "menu"
@@ -238,15 +281,53 @@ class RunScene(Scene):
             if e.button == 1:
                 self.sfx_arrow_shot.play()
 
+    def _snapshot(self) -> None:
+        """Remember positions before a sim step; draw() interpolates from them."""
+        movers = [self.player, *self.enemies]
+        if self.boss: movers.append(self.boss)
+        self._prev = [(m, m.x, m.y) for m in movers]
+        self._prev_cam = (self.camera.x, self.camera.y)
+        self.projectiles.snapshot()
+        self.e_projectiles.snapshot()
+
+    def _lerp_positions(self, alpha: float) -> list[tuple[object, float, float]]:
+        """Move entities and camera to the interpolated pose; returns what to restore."""
+        saved = []
+        for m, x0, y0 in self._prev:
+            x, y = m.x, m.y
+            if x != x0 or y != y0:
+                saved.append((m, x, y))
+                m.x = x0 + (x - x0) * alpha
+                m.y = y0 + (y - y0) * alpha
+        cam = self.camera
+        cx0, cy0 = self._prev_cam
+        saved.append((cam, cam.x, cam.y))
+        cam.x = cx0 + (cam.x - cx0) * alpha
+        cam.y = cy0 + (cam.y - cy0) * alpha
+        return saved
+
+    @traced
     def update(self, dt: float) -> None:
+        self._snapshot()
+        frame = self.input.poll(self)
+        for e in frame.events:
+            self.handle_event(e)
+        if self.recorder is not None:
+            self.recorder.frame(frame)
+        prof = PROFILER
+        prof.lap("input")
+        # camera trails the player once more per step (also while frozen)
+        self.camera.follow(self.player.x, self.player.y)
         if self.entry_freeze > 0:
             self.entry_freeze -= dt
+            if self.next_scene:
+                self._save_recording()
             return      # skip updating while frozen
 
         room = self.current_room
-        walls = room.wall_rects()
+        walls = self.wall_grid
 
-        keys = pg.key.get_pressed(); mouse_buttons = pg.mouse.get_pressed(); mouse_pos = pg.mouse.get_pos()
+        keys, mouse_buttons, mouse_pos = frame.keys, frame.mouse_buttons, frame.mouse_pos
         
         # Camera
         self.camera.follow(self.player.x, self.player.y)
@@ -267,40 +348,40 @@ class RunScene(Scene):
         
         # Player
         self.player.update(dt, keys, mouse_buttons, world_mouse, walls, self.projectiles)
+        prof.lap("player")
 
         # Player projectiles
-        for p in self.projectiles: p.update(dt, walls)
-        self.projectiles = [p for p in self.projectiles if p.alive]
+        self.projectiles.update(dt, walls)
+        prof.lap("projectiles")
 
         # Enemy projectiles
         for e in self.enemies:
-            e.update(dt, self.player.center(), walls, self.e_projectiles)
-        for p in self.e_projectiles:
-            p.update(dt, walls)
-        self.e_projectiles = [p for p in self.e_projectiles if p.alive]
-
-        # Projectile vs enemy
-        for p in self.projectiles:
-            if not p.alive: continue
-            for e in self.enemies:
-                if e.alive and p.rect().colliderect(e.rect()):
-                    e.hp -= p.damage; p.alive = False
+            e.update(dt, self.player.center().copy(), walls, self.e_projectiles)
+        prof.lap("enemy_ai")
+        self.e_projectiles.update(dt, walls)
+        prof.lap("projectiles")
+
+        # Projectile vs enemy (overlaps tested in bulk, kills removed below)
+        killed = False
+        if self.enemies and self.projectiles:
+            shots = self.projectiles
+            for i, j in shots.overlaps([e.rect() for e in self.enemies]).tolist():
+                e = self.enemies[j]
+                if e.alive:
+                    e.hp -= float(shots.damage[i]); shots.kill(i)
                     # self.sfx_hit.play()
                     if e.hp <= 0:
                         e.alive = False
                         self.score += S.SCORE_PER_ENEMY
                         # self.sfx_kill.play()
-                        self.enemies = [e for e in self.enemies if e.alive]
-                        self.message = f"Enemies: {len(self.enemies)}"
+                        killed = True
 
         # Enemy projectile vs player
-        for p in self.e_projectiles:
-            if not p.alive: continue
-            if p.rect().colliderect(self.player.rect()):
-                if self.player.take_damage(1):
-                    self.sfx_player_hit.play()
-                    p.alive = False
-                    self.timescale = 0.05; self.hitstop_timer = 0.02
+        for i, _ in self.e_projectiles.overlaps([self.player.rect()]).tolist():
+            if self.player.take_damage(1):
+                self.sfx_player_hit.play()
+                self.e_projectiles.kill(i)
+                self.timescale = 0.05; self.hitstop_timer = 0.02
 
         # Enemy touch vs player
         for e in self.enemies:
@@ -308,6 +389,7 @@ class RunScene(Scene):
                 if self.player.take_damage(e.touch_damage):
                     self.sfx_player_hit.play()
                     self.timescale = 0.05; self.hitstop_timer = 0.02
+        prof.lap("collision")
 
         # Item
         if self.item_pickup:
@@ -321,16 +403,19 @@ class RunScene(Scene):
 
         # Boss
         if self.boss:
-            self.boss.update(dt, self.player.center(), walls, self.e_projectiles)
+            self.boss.update(dt, self.player.center().copy(), walls, self.e_projectiles)
             if self.boss.rect().colliderect(self.player.rect()):
                 if self.player.take_damage(self.boss.touch_damage):
                     self.sfx_player_hit.play()
                     self.timescale = 0.05; self.hitstop_timer = 0.02
 
-        for p in self.projectiles:
-            if self.boss and self.boss.alive and p.rect().colliderect(self.boss.rect()):
-                self.boss.hp -= p.damage
-                p.alive = False
+        prof.lap("enemy_ai")
+
+        hits = self.projectiles.overlaps([self.boss.rect()]).tolist() if self.boss else []
+        for i, _ in hits:
+            if self.boss and self.boss.alive:
+                self.boss.hp -= float(self.projectiles.damage[i])
+                self.projectiles.kill(i)
                 if self.boss.hp <= 0:
                     self.boss = None
                     self.score += S.SCORE_PER_BOSS
@@ -340,14 +425,21 @@ class RunScene(Scene):
                         self.next_scene = "victory"
                     self.message = "Boss defeated!"
                     try:
-                        name = random.choice(ITEMS).name
+                        name = self.rng.loot.choice(ITEMS).name
                         preferred = (self.current_room.world_rect.centerx, self.current_room.world_rect.centery)
                         sx, sy = self._find_free_spot(preferred, self.walls, w=16, h=16)
                         self.item_pickup = ItemPickup(sx, sy, item_id=name)
                     except Exception:
                         # fallback: center
                         r = self.current_room.world_rect
-                        self.item_pickup = ItemPickup(r.centerx, r.centery, item_id=random.choice(ITEMS).name)
+                        self.item_pickup = ItemPickup(r.centerx, r.centery, item_id=self.rng.loot.choice(ITEMS).name)
+
+        prof.lap("collision")
+
+        # Deferred removal of enemies killed this tick
+        if killed:
+            self.enemies = [e for e in self.enemies if e.alive]
+            self.message = f"Enemies: {len(self.enemies)}"
 
         # Room clearance
         if (self.current_room.kind in ("combat", "boss") and
@@ -359,6 +451,7 @@ class RunScene(Scene):
                 for d in self.current_room.doors.values():
                     d.open = True
                 self.walls = self.current_room.wall_rects()
+                self.wall_grid = WallGrid(self.walls)
 
         # Time decay
         self.time_decay += dt
@@ -387,12 +480,28 @@ class RunScene(Scene):
             self.app.final_score = int(self.score)
             self.next_scene = "gameover"
 
+        if self.next_scene:
+            self._save_recording()
+        prof.lap("room")
+
     def draw(self, surf: pg.Surface) -> None:
+        saved = self._lerp_positions(self.alpha) if self.alpha < 1.0 else ()
+        try:
+            self._draw_frame(surf)
+        finally:
+            for m, x, y in saved:
+                m.x, m.y = x, y
+
+    @traced
+    def _draw_frame(self, surf: pg.Surface) -> None:
         w, h = S.BASE_W, S.BASE_H
+        prof = PROFILER
+        prof.lap("draw_setup")
         self.current_room.draw(surf, camera=self.camera)
         draw_torches(surf, self.camera, self.torches)
-        for p in self.projectiles: p.draw(surf, camera=self.camera)
-        for p in self.e_projectiles: p.draw(surf, camera=self.camera)
+        prof.lap("room_draw")
+        self.projectiles.draw(surf, camera=self.camera, alpha=self.alpha)
+        self.e_projectiles.draw(surf, camera=self.camera, alpha=self.alpha)
         for e in self.enemies: e.draw(surf, camera=self.camera)
         self.player.draw(surf, camera=self.camera)
         if self.item_pickup and self.item_pickup.alive:
@@ -410,8 +519,15 @@ class RunScene(Scene):
         if self.message:
             txt = self.app.font.render(self.message, True, (220,220,220))
             surf.blit(txt, (surf.get_width()//2 - txt.get_width()//2, surf.get_height()-48))
-        apply_lighting(surf, self.camera, self.torches)
+        prof.lap("entities_draw")
+        apply_lighting(surf, self.camera, self.torches, self.lightmap)
+        prof.lap("lighting")
         draw_edge_fade(surf, self.camera, self.current_room.world_rect)
+        prof.lap("edge_fade")
         draw_hud(surf, self.app.font, self.player.hp, self.player.stats.hp, int(self.score), self.floor_i)
-        draw_minimap(surf, self.rooms, self.current_gp)
-        self.camera.follow(self.player.x, self.player.y)
+        self.minimap.draw(surf, self.rooms, self.current_gp)
+        prof.lap("hud")
+        if prof.enabled:
+            prof.count("enemies", len(self.enemies) + (self.boss is not None))
+            prof.count("shots", len(self.projectiles))
+            prof.count("enemy_shots", len(self.e_projectiles))
@@ -4,8 +4,17 @@ from medieval_rogue import settings as S
 from medieval_rogue.scene_manager import Scene
 from medieval_rogue.save.save import save_highscore
 
+# layout, shared by draw() and the dirty rects
+TITLE_Y = 72
+SCORE_Y = 180
+NAME_Y = 234
+HINT_Y = 300
+HINT_SPACING = 40
+
 
 class Victory(Scene):
+    retained = True
+
     def __init__(self, app) -> None:
         super().__init__(app)
         self.saved = False
@@ -13,6 +22,8 @@ class Victory(Scene):
         
     def handle_event(self, e: pg.event.Event) -> None:
         if e.type == pg.KEYDOWN:
+            # the name line is the only thing a key press can change
+            self.mark_dirty(pg.Rect(0, NAME_Y, self.app.screen.get_width(), self.app.font.get_linesize()))
             if e.key == pg.K_RETURN:
                 if not self.saved:
                     save_highscore(self.name, self.app.final_score)
@@ -33,15 +44,15 @@ class Victory(Scene):
     def draw(self, surf: pg.Surface) -> None:
         w, h = surf.get_size()
         title = self.app.font_big.render("Victory!", True, S.GREEN)
-        surf.blit(title, (w//2 - title.get_width()//2, 72))
+        surf.blit(title, (w//2 - title.get_width()//2, TITLE_Y))
         
         score = self.app.font.render(f"Score: {self.app.final_score}", True, S.WHITE)
-        surf.blit(score, (w//2 - score.get_width()//2, 180))
+        surf.blit(score, (w//2 - score.get_width()//2, SCORE_Y))
 
         name = self.app.font.render(f"Name: {self.name}", True, S.YELLOW)
-        surf.blit(name, (w//2 - name.get_width()//2, 234))
+        surf.blit(name, (w//2 - name.get_width()//2, NAME_Y))
 
         hint1 = self.app.font_small.render("Enter = save & menu", True, S.GRAY)
-        surf.blit(hint1, (w//2 - hint1.get_width()//2, 300))
+        surf.blit(hint1, (w//2 - hint1.get_width()//2, HINT_Y))
         hint2 = self.app.font_small.render("R = restart run • ESC = menu", True, S.GRAY)
-        surf.blit(hint2, (w//2 - hint2.get_width()//2, 340))
\ No newline at end of file
+        surf.blit(hint2, (w//2 - hint2.get_width()//2, HINT_Y + HINT_SPACING))
\ No newline at end of file
@@ -11,7 +11,9 @@ from __future__ import annotations
 # Logical resolution and scaling
 BASE_W, BASE_H = 1280, 736  # logical pixels
 SCALE = 1                   # window = BASE * SCALE
-FPS = 60
+FPS = 60                    # render cap
+SIM_HZ = 60                 # fixed simulation steps per second
+MAX_SIM_STEPS = 5           # sim steps run per rendered frame before the backlog is dropped
 
 # Visual framing / margins
 VIEW_GUTTER = 80
@@ -31,12 +33,15 @@ BOSS_SPRITE_SIZE = 96
 BOSS_HITBOX = (64, 64)
 
 PROJECTILE_SPRITE_SIZE = 16
+PROJECTILE_ROTATION_STEPS = 64   # pre-rotated angle buckets per projectile sprite
 ITEM_SPRITE_SIZE = 32
 
 # Tile and rendering settings
 TILE_SIZE = 32
 SMOOTH_SCALE = False
+USE_SPRITE_ATLAS = True     # use assets/atlas/ when built (python -m assets.build_atlas)
 DEBUG_DRAW_HITBOXES = False
+TEXT_CACHE_SIZE = 256       # rendered text surfaces kept by ui.text.TEXT_CACHE
 
 # Colors
 BLACK = (0, 0, 0)
@@ -70,7 +75,8 @@ SCORE_DECAY_PER_SEC = 1
 FLOORS = 3
 ROOM_ENEMY_MIN = 3
 ROOM_ENEMY_MAX = 6
-RANDOM_SEED = None  # set to an int for deterministic runs, 4 -> item room up top 
+RANDOM_SEED = None  # set to an int to replay the same run (see medieval_rogue/rng.py)
+RECORD_INPUT_DIR = None  # e.g. "replays": record every run's input (python -m medieval_rogue.replay <file>)
 SAFE_RADIUS = 192
 
 # HUD anchoring
@@ -90,12 +96,34 @@ MIN_ROOMS = 6
 MAX_ROOMS = 12
 DEBUG_MINIMAP = False
 DEBUG_ROOMS = False
+WALL_GRID_CELL = 64          # cell size of the per-room wall broadphase
 WALL_TILE_WEIGHTS = [100, 100, 100, 100, 40, 10, 5, 1]
 OBS_TILE_WEIGHTS  = [100, 100, 100, 100, 40, 10, 5, 1]
 FLOOR_TILE_WEIGHTS = [100, 80, 80, 60, 20, 10, 2, 1]
 LIGHT_RADIUS = 260
+LIGHT_FLICKER_LEVELS = 8   # quantized flicker steps applied to the baked lightmap
 AMBIENT_LIGHT = 0.55
 
 # Debug / testing
 FORCE_BOSS_IN_START_ROOM = False
 FORCE_BOSS_ID = None
+
+# Benchmarks (python -m medieval_rogue.bench)
+BENCH_REGRESSION_THRESHOLD = 0.15   # flag cases >15% slower than this machine's baseline
+
+# Frame profiler overlay (medieval_rogue/profiler.py)
+PROFILER_KEY = "f3"             # toggle the overlay
+PROFILER_EXPORT_KEY = "f4"      # write the recent history to CSV
+PROFILER_HISTORY_SEC = 10.0
+PROFILER_EXPORT_DIR = "profiles"
+
+# Span tracing (medieval_rogue/trace.py); also enabled by MEDIEVAL_ROGUE_TRACE=1
+TRACE = False
+TRACE_BUFFER = 1 << 18          # spans kept in the ring buffer
+TRACE_PATH = "traces/trace.json"
+TRACE_DUMP_KEY = "f5"
+
+# Memory telemetry (medieval_rogue/memory.py); also enabled by MEDIEVAL_ROGUE_MEMORY=1
+MEMORY_TELEMETRY = False
+MEMORY_TRACE_FRAMES = 1         # tracemalloc traceback depth
+MEMORY_TOP = 10                 # heap growth lines per diff
@@ -0,0 +1,250 @@
+"""
+Stress scenarios: the player in a chosen room size and PATTERNS layout, N
+enemies of chosen registry kinds and M live enemy projectiles kept topped up
+by boss-style ring emitters. Update and draw are timed per profiler phase
+(see medieval_rogue/profiler.py) while N and M scale:
+
+    python -m medieval_rogue.stress --room 2x2 --pattern 2 --kinds slime,bat,skeleton \\
+        --enemies 0,25,50,100,200 --projectiles 0,250,500,1000 --csv stress.csv --plot stress.png
+
+By default N and M are swept one at a time (the other held at its first
+value); --grid runs every combination. Enemies can't die and the player
+can't be hurt, so counts stay fixed while the player keeps firing into them.
+"""
+from __future__ import annotations
+import argparse, csv, math, time
+from dataclasses import dataclass, field
+import pygame as pg
+from medieval_rogue import settings as S
+from medieval_rogue.input_source import InputFrame, ScriptedInput
+from medieval_rogue.profiler import PROFILER
+
+FRAME_BUDGET_MS = 1000.0 / 60
+
+
+@dataclass
+class Scenario:
+    room: tuple[int, int] = (2, 2)
+    pattern: int = 0                    # index into PATTERNS[("combat", w, h)]
+    kinds: tuple[str, ...] = ("slime", "bat", "skeleton")
+    enemies: int = 0
+    projectiles: int = 0
+    emitters: int = 4
+    seed: int = 1
+
+
+@dataclass
+class Sample:
+    enemies: int
+    projectiles: int
+    update_ms: float
+    draw_ms: float
+    phases: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def frame_ms(self) -> float:
+        return self.update_ms + self.draw_ms
+
+
+class RingEmitters:
+    """Warlock-style rings of fireballs from fixed points, topping enemy projectiles up to `target`."""
+    def __init__(self, points: list[tuple[float, float]], target: int, per_ring: int = 10) -> None:
+        self.points = points
+        self.target = target
+        self.per_ring = per_ring
+        self._i = 0
+        self._angle = 0.0
+
+    def update(self, projectiles) -> None:
+        missing = self.target - len(projectiles)
+        while missing > 0 and self.points:
+            x, y = self.points[self._i % len(self.points)]
+            self._i += 1
+            self._angle += 0.37
+            for k in range(min(self.per_ring, missing)):
+                a = self._angle + k * math.tau / self.per_ring
+                projectiles.spawn(x, y, math.cos(a) * 150, math.sin(a) * 150, 6, 1, False, sprite_id="fireball")
+            missing -= self.per_ring
+
+
+def build(sc: Scenario):
+    """A RunScene set up for the scenario, plus its projectile emitters."""
+    from medieval_rogue.headless import make_scene
+    from medieval_rogue.dungeon.room import Room, PATTERNS
+    from medieval_rogue.entities.enemy_registry import create_enemy
+    from medieval_rogue.rng import RunRng
+
+    pats = PATTERNS.get(("combat", *sc.room))
+    if not pats:
+        raise ValueError(f"no combat patterns for room size {sc.room}; known: {sorted(k[1:] for k in PATTERNS if k[0] == 'combat')}")
+    room = Room(kind="start", gx=0, gy=0, w_cells=sc.room[0], h_cells=sc.room[1], pattern=pats[sc.pattern % len(pats)])
+
+    target = [0.0, 0.0]
+
+    def aim_and_fire(tick, scene) -> InputFrame:
+        return InputFrame(mouse_buttons=(True, False, False), mouse_pos=scene.camera.world_to_screen(*target))
+
+    scene = make_scene(ScriptedInput(aim_and_fire), seed=sc.seed, render=True)
+    scene.rooms = {(0, 0): room}        # "start" kind: no wave, no clear check
+    scene._enter_room((0, 0), None)
+    scene.entry_freeze = 0.0
+    wr = room.world_rect
+    px, py = scene._find_free_spot(wr.center, scene.walls, *S.PLAYER_HITBOX, max_radius=600)
+    scene.player.set_position(px, py + S.PLAYER_HITBOX[1] // 2)
+
+    rng = RunRng(sc.seed).generation
+    inner = wr.inflate(-2 * (S.ROOM_INSET + S.WALL_THICKNESS + 24), -2 * (S.ROOM_INSET + S.WALL_THICKNESS + 24))
+    for i in range(sc.enemies):
+        spot = (rng.uniform(inner.left, inner.right), rng.uniform(inner.top, inner.bottom))
+        ex, ey = scene._find_free_spot(spot, scene.walls, *S.ENEMY_HITBOX, max_radius=400)
+        e = create_enemy(sc.kinds[i % len(sc.kinds)], int(ex), int(ey + S.ENEMY_HITBOX[1] // 2))
+        e.hp = 10**9
+        scene.enemies.append(e)
+    target[:] = (scene.enemies[0].x, scene.enemies[0].y) if scene.enemies else wr.center
+
+    points = [(inner.left + (0.2 + 0.6 * (i % 2)) * inner.w, inner.top + (0.2 + 0.6 * (i // 2 % 2)) * inner.h)
+              for i in range(sc.emitters)]
+    return scene, RingEmitters(points, sc.projectiles)
+
+
+def measure(sc: Scenario, frames: int = 120, warmup: int = 30) -> Sample:
+    scene, emitters = build(sc)
+    screen = pg.Surface((S.BASE_W, S.BASE_H))
+    dt = 1.0 / S.SIM_HZ
+    player = scene.player
+    clock = time.perf_counter
+    was_enabled = PROFILER.enabled
+    if not was_enabled:
+        PROFILER.toggle()
+    upd = drw = 0.0
+    try:
+        for i in range(warmup + frames):
+            player.invuln_timer = 1e9
+            emitters.update(scene.e_projectiles)
+            PROFILER.start()
+            t0 = clock()
+            scene.update(dt)
+            t1 = clock()
+            scene.draw(screen)
+            t2 = clock()
+            PROFILER.end_frame()
+            if i >= warmup:
+                upd += t1 - t0
+                drw += t2 - t1
+        rows = list(PROFILER.frames)[-frames:]
+    finally:
+        if not was_enabled:
+            PROFILER.toggle()
+    phases = {name: sum(r[2].get(name, 0.0) for r in rows) / frames for name in PROFILER.phases}
+    return Sample(sc.enemies, sc.projectiles, upd * 1000 / frames, drw * 1000 / frames,
+                  {k: v for k, v in phases.items() if v > 0})
+
+
+def sweep(base: Scenario, enemies: list[int], projectiles: list[int], grid: bool = False,
+          frames: int = 120, log=print) -> list[Sample]:
+    if grid:
+        combos = [(n, m) for m in projectiles for n in enemies]
+    else:
+        combos = [(n, projectiles[0]) for n in enemies] + [(enemies[0], m) for m in projectiles[1:]]
+    out = []
+    for n, m in combos:
+        sc = Scenario(base.room, base.pattern, base.kinds, n, m, base.emitters, base.seed)
+        s = measure(sc, frames)
+        out.append(s)
+        top = sorted(s.phases.items(), key=lambda kv: -kv[1])[:3]
+        log(f"enemies {n:5d} projectiles {m:5d}: update {s.update_ms:7.2f} ms  draw {s.draw_ms:7.2f} ms  "
+            f"frame {s.frame_ms:7.2f} ms{'  OVER BUDGET' if s.frame_ms > FRAME_BUDGET_MS else ''}  "
+            f"[{', '.join(f'{k} {v:.2f}' for k, v in top)}]")
+    return out
+
+
+def write_csv(samples: list[Sample], path: str) -> None:
+    phases = sorted({k for s in samples for k in s.phases})
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["enemies", "projectiles", "update_ms", "draw_ms", "frame_ms", *phases])
+        for s in samples:
+            w.writerow([s.enemies, s.projectiles, f"{s.update_ms:.3f}", f"{s.draw_ms:.3f}", f"{s.frame_ms:.3f}",
+                        *(f"{s.phases.get(p, 0.0):.3f}" for p in phases)])
+
+
+_PALETTE = [(230, 90, 90), (90, 200, 110), (90, 140, 240), (230, 190, 70), (190, 100, 220), (80, 210, 210),
+            (240, 140, 60), (160, 160, 160), (200, 230, 120), (240, 120, 180), (120, 120, 255), (255, 255, 255)]
+
+
+def plot(samples: list[Sample], path: str, enemies0: int, projectiles0: int) -> None:
+    """Two panels (ms vs enemies, ms vs projectiles), one line per phase plus the frame total, saved as PNG."""
+    pg.font.init()
+    font = pg.font.Font(None, 20)
+    W, H, pad = 1200, 520, 48
+    img = pg.Surface((W, H))
+    img.fill((20, 18, 26))
+    series_keys = ["frame", *sorted({k for s in samples for k in s.phases}, key=lambda k: -max(s.phases.get(k, 0) for s in samples))]
+    panels = [("enemies", [s for s in samples if s.projectiles == projectiles0], lambda s: s.enemies),
+              ("projectiles", [s for s in samples if s.enemies == enemies0], lambda s: s.projectiles)]
+    pw = (W - 3 * pad) // 2
+    for pi, (label, rows, xof) in enumerate(panels):
+        ox, oy, ph = pad + pi * (pw + pad), pad, H - 2 * pad - 40
+        pg.draw.rect(img, (70, 66, 80), (ox, oy, pw, ph), 1)
+        img.blit(font.render(f"ms / frame vs {label}", True, (230, 230, 230)), (ox, oy - 20))
+        rows = sorted(rows, key=xof)
+        if len(rows) < 2:
+            continue
+        xmax = max(xof(r) for r in rows) or 1
+        ymax = max(max(r.frame_ms for r in rows), FRAME_BUDGET_MS) * 1.1
+        by = oy + ph - int(ph * FRAME_BUDGET_MS / ymax)
+        pg.draw.line(img, (110, 60, 60), (ox, by), (ox + pw, by))
+        img.blit(font.render("16.7 ms", True, (160, 90, 90)), (ox + 4, by - 16))
+        img.blit(font.render(f"{ymax:.1f}", True, (150, 150, 150)), (ox - 40, oy))
+        img.blit(font.render(str(xmax), True, (150, 150, 150)), (ox + pw - 24, oy + ph + 4))
+        for si, key in enumerate(series_keys):
+            pts = [(ox + int(pw * xof(r) / xmax),
+                    oy + ph - int(ph * (r.frame_ms if key == "frame" else r.phases.get(key, 0.0)) / ymax)) for r in rows]
+            pg.draw.lines(img, _PALETTE[si % len(_PALETTE)], False, pts, 3 if key == "frame" else 1)
+    lx = pad
+    for si, key in enumerate(series_keys):
+        txt = font.render(key, True, _PALETTE[si % len(_PALETTE)])
+        if lx + txt.get_width() > W - pad:
+            break
+        img.blit(txt, (lx, H - pad + 8))
+        lx += txt.get_width() + 16
+    pg.image.save(img, path)
+
+
+def _ints(text: str) -> list[int]:
+    return [int(v) for v in text.split(",") if v]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Measure update/draw cost as enemy and projectile counts scale.")
+    ap.add_argument("--room", default="2x2", help="room size in cells, WxH")
+    ap.add_argument("--pattern", type=int, default=0, help="index into PATTERNS for that size")
+    ap.add_argument("--kinds", default="slime,bat,skeleton", help="enemy registry kinds, cycled")
+    ap.add_argument("--enemies", default="0,10,25,50,100,200")
+    ap.add_argument("--projectiles", default="0,100,250,500,1000,2000")
+    ap.add_argument("--emitters", type=int, default=4)
+    ap.add_argument("--grid", action="store_true", help="every enemies x projectiles combination")
+    ap.add_argument("--frames", type=int, default=120)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--csv", default=None)
+    ap.add_argument("--plot", default=None, help="write the scaling curves as a PNG")
+    args = ap.parse_args()
+
+    from medieval_rogue.headless import init_headless
+    init_headless()
+    w, h = (int(v) for v in args.room.lower().split("x"))
+    enemies, projectiles = _ints(args.enemies), _ints(args.projectiles)
+    base = Scenario((w, h), args.pattern, tuple(args.kinds.split(",")), emitters=args.emitters, seed=args.seed)
+    samples = sweep(base, enemies, projectiles, args.grid, args.frames)
+    over = [s for s in samples if s.frame_ms > FRAME_BUDGET_MS]
+    if over:
+        first = min(over, key=lambda s: (s.enemies, s.projectiles))
+        print(f"over the 60 fps budget from enemies={first.enemies} projectiles={first.projectiles}")
+    if args.csv:
+        write_csv(samples, args.csv)
+    if args.plot:
+        plot(samples, args.plot, enemies[0], projectiles[0])
+
+
+if __name__ == "__main__":
+    main()
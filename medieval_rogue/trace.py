@@ -0,0 +1,143 @@
+"""
+Span tracing with Chrome/Perfetto trace export.
+
+    from medieval_rogue.trace import span, traced
+
+    @traced                       # or @traced("custom name")
+    def generate_floor(...): ...
+
+    with span("lighting"):
+        apply_lighting(...)
+
+Tracing is decided once at import: S.TRACE or MEDIEVAL_ROGUE_TRACE=1 in the
+environment. When off, @traced returns the function itself and span() hands
+back one shared no-op context manager, so instrumented code runs as before.
+When on, spans go into a preallocated ring buffer (S.TRACE_BUFFER events)
+and dump() writes the buffered spans as trace JSON for chrome://tracing or
+ui.perfetto.dev. The game dumps on exit and on S.TRACE_DUMP_KEY.
+"""
+from __future__ import annotations
+import functools, json, os, time
+import numpy as np
+from medieval_rogue import settings as S
+
+ENABLED = bool(S.TRACE or os.environ.get("MEDIEVAL_ROGUE_TRACE", "") not in ("", "0"))
+
+_now = time.perf_counter_ns
+
+
+class Tracer:
+    """Ring buffer of completed spans: name id, start and end in ns."""
+    def __init__(self, capacity: int = S.TRACE_BUFFER) -> None:
+        self.capacity = capacity
+        self.name_ids: dict[str, int] = {}
+        self.names: list[str] = []
+        self._name = np.zeros(capacity, np.int32)
+        self._t0 = np.zeros(capacity, np.int64)
+        self._t1 = np.zeros(capacity, np.int64)
+        self.n = 0          # spans recorded so far (the buffer keeps the last `capacity`)
+        self.origin = _now()
+
+    def name_id(self, name: str) -> int:
+        i = self.name_ids.get(name)
+        if i is None:
+            i = self.name_ids[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+    def record(self, name_id: int, t0: int, t1: int) -> None:
+        i = self.n % self.capacity
+        self._name[i] = name_id
+        self._t0[i] = t0
+        self._t1[i] = t1
+        self.n += 1
+
+    def spans(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Buffered spans ordered by start time."""
+        k = min(self.n, self.capacity)
+        names, t0, t1 = self._name[:k], self._t0[:k], self._t1[:k]
+        order = np.argsort(t0, kind="stable")
+        return names[order], t0[order], t1[order]
+
+    def clear(self) -> None:
+        self.n = 0
+
+    def to_chrome(self) -> dict:
+        names, t0, t1 = self.spans()
+        ts = ((t0 - self.origin) / 1000.0).tolist()
+        dur = ((t1 - t0) / 1000.0).tolist()
+        labels = self.names
+        pid, tid = os.getpid(), 1
+        events = [{"name": labels[n], "ph": "X", "ts": s, "dur": d, "pid": pid, "tid": tid}
+                  for n, s, d in zip(names.tolist(), ts, dur)]
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": "main"}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, path: str | None = None) -> str:
+        path = path or S.TRACE_PATH
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome(), f)
+        return path
+
+
+class _Span:
+    __slots__ = ("name_id", "t0")
+
+    def __init__(self, name_id: int) -> None:
+        self.name_id = name_id
+
+    def __enter__(self) -> "_Span":
+        self.t0 = _now()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        TRACER.record(self.name_id, self.t0, _now())
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NULL = _NullSpan()
+TRACER: Tracer | None = Tracer() if ENABLED else None
+
+
+if ENABLED:
+    def span(name: str) -> _Span:
+        return _Span(TRACER.name_id(name))
+
+    def traced(fn=None, *, name: str | None = None):
+        def wrap(f):
+            nid = TRACER.name_id(name or f.__qualname__)
+
+            @functools.wraps(f)
+            def inner(*args, **kwargs):
+                t0 = _now()
+                try:
+                    return f(*args, **kwargs)
+                finally:
+                    TRACER.record(nid, t0, _now())
+            return inner
+        if isinstance(fn, str):
+            name, fn = fn, None
+        return wrap if fn is None else wrap(fn)
+else:
+    def span(name: str) -> _NullSpan:
+        return _NULL
+
+    def traced(fn=None, *, name: str | None = None):
+        if fn is None or isinstance(fn, str):
+            return lambda f: f
+        return fn
+
+
+def dump(path: str | None = None) -> str | None:
+    """Write the buffered spans as trace JSON; None when tracing is off."""
+    return TRACER.dump(path) if TRACER is not None else None
@@ -1,6 +1,8 @@
 from __future__ import annotations
 import pygame as pg
+from collections import OrderedDict
 from medieval_rogue import settings as S
+from medieval_rogue.trace import traced
 from medieval_rogue.dungeon.room import inset_rect
 
 def _make_hstrip(width: int) -> pg.Surface:
@@ -14,13 +16,21 @@ def _make_hstrip(width: int) -> pg.Surface:
 _HSTRIP = None
 _VSTRIP = None
 
+# Finished masks keyed by (screen size, fade, on-screen start rect); small LRU.
+_MASK_CACHE_SIZE = 8
+_MASKS: "OrderedDict[tuple, pg.Surface]" = OrderedDict()
+_LAST_KEY: tuple | None = None
+_LAST_MASK: pg.Surface | None = None
+
 def _ensure_strips():
     global _HSTRIP, _VSTRIP
     if _HSTRIP is None or _HSTRIP.get_width() != int(S.EDGE_FADE):
         _HSTRIP = _make_hstrip(int(S.EDGE_FADE))
         _VSTRIP = pg.transform.rotate(_HSTRIP, 90)
 
+@traced
 def draw_edge_fade(screen: pg.Surface, camera, room_rect_world: pg.Rect) -> None:
+    global _LAST_KEY, _LAST_MASK
     fade = int(S.EDGE_FADE)
     if fade <= 0:
         return
@@ -39,6 +49,24 @@ def draw_edge_fade(screen: pg.Surface, camera, room_rect_world: pg.Rect) -> None
     start_shift = int(getattr(S, "EDGE_FADE_START_SHIFT", 0))
     start_rect = room_scr.inflate(2 * start_shift, 2 * start_shift).clip(screen_rect)
 
+    key = (sw, sh, fade, start_rect.x, start_rect.y, start_rect.w, start_rect.h)
+    if key == _LAST_KEY:
+        screen.blit(_LAST_MASK, (0, 0))
+        return
+
+    mask = _MASKS.get(key)
+    if mask is None:
+        mask = _build_mask(sw, sh, fade, start_rect)
+        _MASKS[key] = mask
+        while len(_MASKS) > _MASK_CACHE_SIZE:
+            _MASKS.popitem(last=False)
+    else:
+        _MASKS.move_to_end(key)
+
+    _LAST_KEY, _LAST_MASK = key, mask
+    screen.blit(mask, (0, 0))
+
+def _build_mask(sw: int, sh: int, fade: int, start_rect: pg.Rect) -> pg.Surface:
     mask = pg.Surface((sw, sh), pg.SRCALPHA)
 
     if start_rect.left > 0:
@@ -63,5 +91,4 @@ def draw_edge_fade(screen: pg.Surface, camera, room_rect_world: pg.Rect) -> None
             s = pg.transform.scale(_HSTRIP, (sw, h))
             s = pg.transform.flip(s, False, True)
             mask.blit(s, (0, start_rect.bottom))
-
-    screen.blit(mask, (0, 0))
+    return mask
@@ -1,12 +1,16 @@
 from __future__ import annotations
 import pygame as pg, math, random
+import numpy as np
 from dataclasses import dataclass
 from medieval_rogue import settings as S
+from medieval_rogue import rng as run_rng
+from medieval_rogue.trace import traced
 from assets.sprite_manager import _load_image
 from medieval_rogue.dungeon.room import inset_rect
 
 _TORCH = None
 _LIGHT_SPRITES: dict[tuple[int,int,int], pg.Surface] = {}
+_LIGHTMAP: pg.Surface | None = None     # reused screen-sized lightmap
 
 def _torch_img() -> pg.Surface:
     global _TORCH
@@ -20,18 +24,17 @@ def _torch_img() -> pg.Surface:
     return _TORCH
 
 def _radial_brightness(radius: int, inner: int, outer: int) -> pg.Surface:
+    """Grey radial gradient: `outer` at the centre fading linearly to `inner` at `radius`."""
     key = (radius, inner, outer)
     if key in _LIGHT_SPRITES:
         return _LIGHT_SPRITES[key]
     d = radius * 2
-    surf = pg.Surface((d, d), pg.SRCALPHA)
-    cx = cy = radius
-    for y in range(d):
-        for x in range(d):
-            r = ((x - cx)**2 + (y - cy)**2) ** 0.5
-            t = min(1.0, r / radius)
-            v = int(outer + (inner - outer) * t)
-            surf.set_at((x, y), (v, v, v, 255))
+    ys, xs = np.ogrid[0:d, 0:d]
+    r = np.sqrt((xs - radius) ** 2 + (ys - radius) ** 2)
+    t = np.minimum(1.0, r / radius)
+    v = (outer + (inner - outer) * t).astype(np.uint8)
+    surf = pg.Surface((d, d))
+    pg.surfarray.blit_array(surf, np.repeat(v.T[:, :, None], 3, axis=2))
     _LIGHT_SPRITES[key] = surf
     return surf
 
@@ -43,7 +46,47 @@ class Torch:
     base: int = 24
     amp: int = 10
 
-def compute_torches_for_room(room) -> list[Torch]:
+    def brightness(self, ambient: int) -> int:
+        flicker = max(0, min(255, int(255 - (self.base + int(self.amp * math.sin(self.phase))))))
+        return min(255, ambient + flicker)
+
+@dataclass
+class RoomLightmap:
+    """
+    World-space light above ambient for one room, baked once with every torch at
+    its brightest flicker. Per frame it is scaled by one quantized flicker level.
+    """
+    origin: tuple[int, int]
+    excess: pg.Surface
+    ambient: int
+    peak: int       # brightest torch centre value above ambient
+
+def _ambient() -> int:
+    return int(255 * float(getattr(S, "AMBIENT_LIGHT", 0.8)))
+
+@traced
+def bake_lightmap(room, torches: list[Torch]) -> RoomLightmap:
+    ambient = _ambient()
+    radius = int(S.LIGHT_RADIUS)
+    wr = room.world_rect
+    excess = pg.Surface(wr.size)
+    excess.fill((0, 0, 0))
+
+    # brightest value any torch reaches over its flicker cycle
+    peak = 0
+    for t in torches:
+        flicker = max(0, min(255, int(255 - (t.base - t.amp))))
+        peak = max(peak, min(255, ambient + flicker) - ambient)
+
+    if peak > 0:
+        sprite = _radial_brightness(radius, inner=0, outer=peak)
+        for t in torches:
+            rect = sprite.get_rect(center=(t.x - wr.x, t.y - wr.y - 16))
+            excess.blit(sprite, rect, special_flags=pg.BLEND_RGB_MAX)
+    return RoomLightmap(origin=wr.topleft, excess=excess, ambient=ambient, peak=peak)
+
+def compute_torches_for_room(room, rng: random.Random | None = None) -> list[Torch]:
+    rng = rng or run_rng.current().cosmetic
     inner = inset_rect(room.world_rect, S.ROOM_INSET)
     torches: list[Torch] = []
     pad = 32
@@ -63,7 +106,7 @@ def compute_torches_for_room(room) -> list[Torch]:
                 if d.rect.top <= y <= d.rect.bottom:
                     ok = False; break
         if ok:
-            torches.append(Torch(x, y, phase=random.uniform(0.0, 6.283)))
+            torches.append(Torch(x, y, phase=rng.uniform(0.0, 6.283)))
     return torches
 
 def update_torches(torches: list[Torch], dt: float) -> None:
@@ -77,19 +120,35 @@ def draw_torches(surf: pg.Surface, camera, torches: list[Torch]) -> None:
         rect = img.get_rect(midbottom=(int(sx), int(sy)))
         surf.blit(img, rect)
 
-def apply_lighting(surf: pg.Surface, camera, torches: list[Torch]) -> None:
+def _flicker_scale(lightmap: RoomLightmap, torches: list[Torch]) -> int:
+    """Mean torch brightness as a 0..255 multiplier, quantized to LIGHT_FLICKER_LEVELS."""
+    if not torches or lightmap.peak <= 0:
+        return 255
+    mean = sum(t.brightness(lightmap.ambient) for t in torches) / len(torches)
+    levels = max(2, int(getattr(S, "LIGHT_FLICKER_LEVELS", 8)))
+    q = round((mean - lightmap.ambient) / lightmap.peak * (levels - 1))
+    return int(round(255 * max(0, min(levels - 1, q)) / (levels - 1)))
+
+@traced
+def apply_lighting(surf: pg.Surface, camera, torches: list[Torch], lightmap: RoomLightmap) -> None:
+    global _LIGHTMAP
     sw, sh = surf.get_size()
-    ambient = int(255 * float(getattr(S, "AMBIENT_LIGHT", 0.8)))
-    lightmap = pg.Surface((sw, sh), pg.SRCALPHA)
-    lightmap.fill((ambient, ambient, ambient, 255))
-    radius = int(S.LIGHT_RADIUS)
+    if _LIGHTMAP is None or _LIGHTMAP.get_size() != (sw, sh):
+        _LIGHTMAP = pg.Surface((sw, sh))
+    out = _LIGHTMAP
 
-    for t in torches:
-        flicker = max(0, min(255, int(255 - (t.base + int(t.amp * math.sin(t.phase))))))
-        inner = min(255, ambient + flicker)
-        sprite = _radial_brightness(radius, inner=ambient, outer=inner)
-        sx, sy = camera.world_to_screen(t.x, t.y)
-        rect = sprite.get_rect(center=(int(sx), int(sy) - 16))
-        lightmap.blit(sprite, rect, special_flags=pg.BLEND_RGBA_MAX)
+    # slice of the baked room lightmap under the camera
+    ox, oy = camera.world_to_screen(*lightmap.origin)
+    view = pg.Rect(-ox, -oy, sw, sh).clip(lightmap.excess.get_rect())
+    if view.size != (sw, sh):
+        out.fill((0, 0, 0))
+    if view.w > 0 and view.h > 0:
+        out.blit(lightmap.excess, (ox + view.x, oy + view.y), view)
+
+    scale = _flicker_scale(lightmap, torches)
+    if scale < 255:
+        out.fill((scale, scale, scale), special_flags=pg.BLEND_RGB_MULT)
+    a = lightmap.ambient
+    out.fill((a, a, a), special_flags=pg.BLEND_RGB_ADD)
 
-    surf.blit(lightmap, (0, 0), special_flags=pg.BLEND_RGBA_MULT)
+    surf.blit(out, (0, 0), special_flags=pg.BLEND_RGB_MULT)
@@ -7,60 +7,95 @@ from medieval_rogue.dungeon.room import Room, Direction
 
 GridPos = Tuple[int, int]
 
-def draw_minimap(surf: pg.Surface, rooms: Dict[GridPos, Room], current: GridPos) -> None:
-    if not rooms:
-        return
-    margin = 10 + S.BORDER
-    cell = 12
-
-    xs = [gp[0] for gp in rooms]
-    ys = [gp[1] for gp in rooms]
-    minx, maxx = min(xs), max(xs)
-    miny, maxy = min(ys), max(ys)
-    w = (maxx - minx + 1) * cell * 2
-    h = (maxy - miny + 1) * cell * 2
-    x0 = surf.get_width() - w - margin
-    y0 = margin + (S.VIEW_GUTTER // 4)
-
-    panel = pg.Rect(x0-6, y0-6, w+12, h+12)
-    pg.draw.rect(surf, (20,20,26), panel)
-    pg.draw.rect(surf, (60,60,80), panel, 2)
-
-    # Connections
-    for (gx, gy), r in rooms.items():
-        if not S.DEBUG_MINIMAP and (not r.visited and not r.discovered):
-            continue
-        cx = x0 + (gx - minx) * cell * 2 + cell
-        cy = y0 + (gy - miny) * cell * 2 + cell
-        for side, d in r.doors.items():
-            if side == "N" and (gx, gy-1) in rooms and (rooms[(gx, gy-1)].visited or rooms[(gx, gy-1)].discovered):
-                pg.draw.line(surf, (80,80,110), (cx, cy), (cx, cy - cell))
-            if side == "S" and (gx, gy+1) in rooms and (rooms[(gx, gy+1)].visited or rooms[(gx, gy+1)].discovered):
-                pg.draw.line(surf, (80,80,110), (cx, cy), (cx, cy + cell))
-            if side == "W" and (gx-1, gy) in rooms and (rooms[(gx-1, gy)].visited or rooms[(gx-1, gy)].discovered):
-                pg.draw.line(surf, (80,80,110), (cx, cy), (cx - cell, cy))
-            if side == "E" and (gx+1, gy) in rooms and (rooms[(gx+1, gy)].visited or rooms[(gx+1, gy)].discovered):
-                pg.draw.line(surf, (80,80,110), (cx, cy), (cx + cell, cy))
-
-    # Rooms
-    for gp, r in rooms.items():
-        if not S.DEBUG_MINIMAP and (not r.visited and not r.discovered):
-            continue
-        cx = x0 + (gp[0] - minx) * cell * 2 + cell
-        cy = y0 + (gp[1] - miny) * cell * 2 + cell
-        col = (70,70,90)
-        if r.visited:
-            col = (180,180,220) if r.kind == "start" else (140,160,220)
-        elif r.discovered:
-            col = (100,100,130)
-        box = pg.Rect(cx - cell//2, cy - cell//2, cell, cell)
-        pg.draw.rect(surf, col, box, 0 if r.visited else 2)
-        if r.kind == "boss":
-            pg.draw.circle(surf, (200,80,80), (cx, cy), 3)
-        elif r.kind == "item":
-            pg.draw.circle(surf, (220,200,120), (cx, cy), 3)
-
-    # current room highlight
-    ccx = x0 + (current[0] - minx) * cell * 2 + cell
-    ccy = y0 + (current[1] - miny) * cell * 2 + cell
-    pg.draw.rect(surf, (240,240,255), (ccx - cell//2 - 2, ccy - cell//2 - 2, cell + 4, cell + 4), 2)
+CELL = 12
+_SIDE_OFFSETS: Dict[Direction, GridPos] = {"N": (0, -1), "S": (0, 1), "W": (-1, 0), "E": (1, 0)}
+
+
+class Minimap:
+    """
+    Minimap with a pre-rendered panel. The panel is only redrawn after
+    invalidate() (a room's visited/discovered flags changed) or when a new
+    floor's rooms are passed in; the current-room highlight is a per-frame overlay.
+    """
+    def __init__(self) -> None:
+        self._panel: pg.Surface | None = None
+        self._rooms: Dict[GridPos, Room] | None = None
+        self._surf_w = 0
+        self._min: GridPos = (0, 0)
+        self._origin: GridPos = (0, 0)   # screen position of the grid's top-left cell
+
+    def invalidate(self) -> None:
+        self._panel = None
+
+    def _render_panel(self, surf_w: int, rooms: Dict[GridPos, Room]) -> None:
+        margin = 10 + S.BORDER
+        cell = CELL
+
+        xs = [gp[0] for gp in rooms]
+        ys = [gp[1] for gp in rooms]
+        minx, maxx = min(xs), max(xs)
+        miny, maxy = min(ys), max(ys)
+        w = (maxx - minx + 1) * cell * 2
+        h = (maxy - miny + 1) * cell * 2
+        x0 = surf_w - w - margin
+        y0 = margin + (S.VIEW_GUTTER // 4)
+
+        panel = pg.Surface((w + 12, h + 12))
+        panel.fill((20,20,26))
+        pg.draw.rect(panel, (60,60,80), panel.get_rect(), 2)
+
+        def shown(r: Room | None) -> bool:
+            return r is not None and (S.DEBUG_MINIMAP or r.visited or r.discovered)
+
+        # local coords: panel is blitted at (x0-6, y0-6)
+        def cell_center(gx: int, gy: int) -> GridPos:
+            return 6 + (gx - minx) * cell * 2 + cell, 6 + (gy - miny) * cell * 2 + cell
+
+        # Connections
+        for (gx, gy), r in rooms.items():
+            if not shown(r):
+                continue
+            cx, cy = cell_center(gx, gy)
+            for side in r.doors:
+                dx, dy = _SIDE_OFFSETS[side]
+                nbr = rooms.get((gx + dx, gy + dy))
+                if nbr is not None and (nbr.visited or nbr.discovered):
+                    pg.draw.line(panel, (80,80,110), (cx, cy), (cx + dx * cell, cy + dy * cell))
+
+        # Rooms
+        for gp, r in rooms.items():
+            if not shown(r):
+                continue
+            cx, cy = cell_center(*gp)
+            col = (70,70,90)
+            if r.visited:
+                col = (180,180,220) if r.kind == "start" else (140,160,220)
+            elif r.discovered:
+                col = (100,100,130)
+            box = pg.Rect(cx - cell//2, cy - cell//2, cell, cell)
+            pg.draw.rect(panel, col, box, 0 if r.visited else 2)
+            if r.kind == "boss":
+                pg.draw.circle(panel, (200,80,80), (cx, cy), 3)
+            elif r.kind == "item":
+                pg.draw.circle(panel, (220,200,120), (cx, cy), 3)
+
+        self._panel = panel
+        self._rooms = rooms
+        self._surf_w = surf_w
+        self._min = (minx, miny)
+        self._origin = (x0, y0)
+
+    def draw(self, surf: pg.Surface, rooms: Dict[GridPos, Room], current: GridPos) -> None:
+        if not rooms:
+            return
+        if self._panel is None or rooms is not self._rooms or surf.get_width() != self._surf_w:
+            self._render_panel(surf.get_width(), rooms)
+
+        x0, y0 = self._origin
+        surf.blit(self._panel, (x0 - 6, y0 - 6))
+
+        # current room highlight
+        cell = CELL
+        ccx = x0 + (current[0] - self._min[0]) * cell * 2 + cell
+        ccy = y0 + (current[1] - self._min[1]) * cell * 2 + cell
+        pg.draw.rect(surf, (240,240,255), (ccx - cell//2 - 2, ccy - cell//2 - 2, cell + 4, cell + 4), 2)
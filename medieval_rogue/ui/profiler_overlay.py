@@ -0,0 +1,93 @@
+from __future__ import annotations
+import time
+from itertools import islice
+import pygame as pg
+from medieval_rogue import settings as S
+from medieval_rogue.profiler import FrameProfiler
+
+_REFRESH = 0.25          # seconds between table re-renders
+_GRAPH_FRAMES = 240
+_GRAPH_H = 72
+_GRAPH_MAX_MS = 50.0
+_PANEL_W = 360
+_BG = (12, 10, 16, 200)
+
+
+class ProfilerOverlay:
+    """Per-phase timing table, counters and a frame-time graph, bottom-left of the screen."""
+    def __init__(self, profiler: FrameProfiler) -> None:
+        self.profiler = profiler
+        self.font: pg.font.Font | None = None
+        self._table: pg.Surface | None = None
+        self._graph_bg: pg.Surface | None = None
+        self._next = 0.0
+        self.note = ""
+        self._note_until = 0.0
+        self.rect: pg.Rect | None = None    # screen area covered by the last draw()
+
+    def flash(self, text: str, seconds: float = 3.0) -> None:
+        self.note = text
+        self._note_until = time.perf_counter() + seconds
+        self._next = 0.0
+
+    def _render_table(self) -> pg.Surface:
+        prof = self.profiler
+        stats = prof.stats(2.0)
+        lines = [("phase", "mean", "p95", "max")]
+        for name, (mean, p95, mx) in stats.items():
+            lines.append((name, f"{mean:.2f}", f"{p95:.2f}", f"{mx:.2f}"))
+        counts = prof.counts()
+        footer = ["  ".join(f"{k} {v}" for k, v in counts.items())]
+        if "frame" in stats and stats["frame"][0] > 0:
+            footer.append(f"{1000.0 / stats['frame'][0]:.0f} fps, last 2 s in ms")
+        if self.note and time.perf_counter() < self._note_until:
+            footer.append(self.note)
+        lh = self.font.get_linesize()
+        h = lh * (len(lines) + len(footer)) + 8
+        panel = pg.Surface((_PANEL_W, h), pg.SRCALPHA)
+        panel.fill(_BG)
+        cols = (6, 170, 230, 290)
+        for row, cells in enumerate(lines):
+            color = S.GRAY if row == 0 else S.WHITE
+            if row and cells[0] != "frame" and float(cells[2]) > 1000.0 / S.FPS / 4:
+                color = (240, 180, 90)      # phase p95 above a quarter of the frame budget
+            for x, text in zip(cols, cells):
+                panel.blit(self.font.render(text, True, color), (x, 4 + row * lh))
+        for i, text in enumerate(footer):
+            panel.blit(self.font.render(text, True, S.GRAY), (6, 4 + (len(lines) + i) * lh))
+        return panel
+
+    def draw(self, surf: pg.Surface) -> pg.Rect:
+        """Draw the panel; returns the area it covers, grown by last draw's when the table resized."""
+        if self.font is None:
+            self.font = pg.font.Font(None, 22)
+            self._graph_bg = pg.Surface((_PANEL_W, _GRAPH_H), pg.SRCALPHA)
+            self._graph_bg.fill(_BG)
+        now = time.perf_counter()
+        if self._table is None or now >= self._next:
+            self._table = self._render_table()
+            self._next = now + _REFRESH
+
+        table = self._table
+        x = S.BORDER + 8
+        y = surf.get_height() - table.get_height() - _GRAPH_H - S.BORDER - 8
+        surf.blit(table, (x, y))
+
+        # frame-time graph with 60 and 30 fps guides
+        gy = y + table.get_height()
+        surf.blit(self._graph_bg, (x, gy))
+        for ms, color in ((1000 / 60, (70, 120, 70)), (1000 / 30, (130, 90, 60))):
+            ly = gy + _GRAPH_H - int(_GRAPH_H * ms / _GRAPH_MAX_MS)
+            pg.draw.line(surf, color, (x, ly), (x + _PANEL_W - 1, ly))
+        frames = self.profiler.frames
+        n = min(len(frames), _GRAPH_FRAMES)
+        if n >= 2:
+            step = (_PANEL_W - 1) / (_GRAPH_FRAMES - 1)
+            scale = (_GRAPH_H - 1) / _GRAPH_MAX_MS
+            recent = islice(frames, len(frames) - n, None)
+            pts = [(x + int(i * step), gy + _GRAPH_H - 1 - int(min(row[1], _GRAPH_MAX_MS) * scale))
+                   for i, row in enumerate(recent)]
+            pg.draw.lines(surf, (220, 220, 120), False, pts)
+        rect = pg.Rect(x, y, _PANEL_W, table.get_height() + _GRAPH_H)
+        prev, self.rect = self.rect, rect
+        return rect if prev is None else rect.union(prev)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+import pygame as pg
+from collections import OrderedDict
+from medieval_rogue import settings as S
+
+
+class TextCache:
+    """
+    Bounded LRU of rendered text surfaces keyed by (font, text, color, antialias),
+    plus memoized word wrapping. Returned surfaces are shared: blit, don't modify.
+    """
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._surfs: OrderedDict[tuple, pg.Surface] = OrderedDict()
+        self._wraps: OrderedDict[tuple, list[str]] = OrderedDict()
+
+    def render(self, font: pg.font.Font, text: str, antialias: bool, color) -> pg.Surface:
+        key = (font, text, tuple(pg.Color(color)), bool(antialias))
+        surf = self._surfs.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._surfs.move_to_end(key)
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._surfs[key] = surf
+        if len(self._surfs) > self.maxsize:
+            self._surfs.popitem(last=False)
+        return surf
+
+    def wrap(self, font: pg.font.Font, text: str, max_width: int) -> list[str]:
+        """Simple word wrap for small blocks (memoized)."""
+        key = (font, text, int(max_width))
+        lines = self._wraps.get(key)
+        if lines is not None:
+            self._wraps.move_to_end(key)
+            return lines
+        lines = []
+        if text:
+            cur = ""
+            for w in text.split(" "):
+                test = (cur + " " + w).strip()
+                if font.size(test)[0] <= max_width:
+                    cur = test
+                else:
+                    if cur:
+                        lines.append(cur)
+                    cur = w
+            if cur:
+                lines.append(cur)
+        self._wraps[key] = lines
+        if len(self._wraps) > self.maxsize:
+            self._wraps.popitem(last=False)
+        return lines
+
+    def stats(self) -> dict:
+        return {"size": len(self._surfs), "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        self._surfs.clear()
+        self._wraps.clear()
+
+
+TEXT_CACHE = TextCache(getattr(S, "TEXT_CACHE_SIZE", 256))
+
+
+class CachedFont:
+    """Drop-in wrapper for pg.font.Font whose render() goes through TEXT_CACHE."""
+    def __init__(self, font: pg.font.Font, cache: TextCache = TEXT_CACHE) -> None:
+        self.font = font
+        self.cache = cache
+
+    def render(self, text: str, antialias: bool, color, background=None) -> pg.Surface:
+        if background is not None:
+            return self.font.render(text, antialias, color, background)
+        return self.cache.render(self.font, text, antialias, color)
+
+    def wrap(self, text: str, max_width: int) -> list[str]:
+        return self.cache.wrap(self.font, text, max_width)
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)